@@ -0,0 +1 @@
+"""Mediciones de rendimiento de los métodos numéricos."""
@@ -0,0 +1,40 @@
+"""
+Casos de regresión de los métodos de integración.
+
+Cada caso integra un problema que alguna vez falló con integrate() y compara el
+resultado con el esperado. El script termina con código 1 si algún caso falla.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.integration_regressions
+"""
+import numpy as np
+from benchmarks.root_finding_regressions import report_regressions
+from common.lazy_imports import lazy_import
+from integration_methods.integrate import INTEGRATION_METHODS, integrate
+
+sp = lazy_import("sympy")
+
+# Métodos que integran sobre un intervalo finito
+FINITE_METHODS = [method for method in INTEGRATION_METHODS if method not in ("gauss_laguerre", "gauss_hermite")]
+
+
+def callable_cases(x):
+    # Una función de Python escrita con NumPy debe servir con todos los métodos (romberg la
+    # pasaba a sympy)
+    for method in FINITE_METHODS:
+        yield (f"integrate exp(t) en [0, 1] como función de Python, method={method}",
+               lambda method=method: round(integrate(x, lambda t: np.exp(t), 0, 1, method).value, 9),
+               round(np.e - 1, 9))
+
+
+def cases():
+    x = sp.symbols('x')
+    yield from callable_cases(x)
+
+
+def main():
+    report_regressions(cases())
+
+
+if __name__ == "__main__":
+    main()
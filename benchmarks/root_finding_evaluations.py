@@ -0,0 +1,102 @@
+"""
+Compara la cantidad de evaluaciones de f que usa cada método de raíces.
+
+Para cada problema se usa el mismo intervalo [a, b]: Brent e Illinois lo toman
+como bracket, la secante parte de sus extremos y Newton-Raphson de su punto
+medio. La bisección replica el patrón de Profe/3.biseccion.py, que vuelve a
+evaluar f(a) en cada iteración. El atajo para polinomios de Newton y la secante
+se desactiva para comparar las iteraciones.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.root_finding_evaluations
+"""
+import json
+import sys
+
+from common.lambdify_cache import cached_lambdify
+from common.lazy_imports import lazy_callable, lazy_import
+from root_finding.bracketing import brent, illinois
+from root_finding.newton_raphson import newton_raphson
+from root_finding.secant_method import secant
+
+sp = lazy_import("sympy")
+tabulate = lazy_callable("tabulate", "tabulate")
+
+TOLERANCE = 1e-10
+
+
+def problems():
+    x = sp.symbols('x')
+    return x, [
+        ("x**3 - 2*x - 5", x**3 - 2*x - 5, 2, 3),
+        ("x**3 - sin(x) - 5", x**3 - sp.sin(x) - 5, 1, 3),
+        ("exp(x) - 3*x**2", sp.exp(x) - 3*x**2, 0, 1),
+        ("x**2 - 4", x**2 - 4, 0, 3),
+        ("atan(x)", sp.atan(x), -1, 5),
+        ("(x - 1)**3", (x - 1)**3, 0, 3),
+        ("tan(x) - x", sp.tan(x) - x, 4, 4.7),
+        ("exp(x) - 1e-9", sp.exp(x) - 1e-9, -30, 1),
+    ]
+
+
+def bisection_evaluations(f, a, b, tolerance):
+    evaluations = 2
+    if f(a) * f(b) >= 0:
+        raise ValueError("La función debe tener signos opuestos en los extremos del intervalo [a, b].")
+    for _ in range(200):
+        c = (a + b) / 2.0
+        fc = f(c)
+        evaluations += 1
+        if abs(fc) < tolerance or (b - a) / 2.0 < tolerance:
+            return c, evaluations
+        fa = f(a)
+        evaluations += 1
+        if fa * fc < 0:
+            b = c
+        else:
+            a = c
+    raise ValueError("El método no convergió o faltan iteraciones.")
+
+
+def run_method(method, *args, **kwargs):
+    try:
+        result = method(*args, **kwargs)
+        return float(result.root), result.evaluations
+    except (ValueError, ZeroDivisionError, OverflowError):
+        return None, None
+
+
+def run_benchmark():
+    x, cases = problems()
+    rows = []
+    for label, f_expr, a, b in cases:
+        f = cached_lambdify(x, f_expr, 'numpy')
+        row = {"problema": label, "intervalo": [a, b]}
+        row["brent"] = run_method(brent, x, f_expr, a, b, tolerance=TOLERANCE, max_iterations=200)
+        row["illinois"] = run_method(illinois, x, f_expr, a, b, tolerance=TOLERANCE, max_iterations=200)
+        row["secante"] = run_method(secant, x, f_expr, a, b, tolerance=TOLERANCE, max_iterations=200,
+                                   polynomial_fast_path=False)
+        row["newton_raphson"] = run_method(newton_raphson, x, f_expr, (a + b) / 2, max_iterations=200, precision=10,
+                                           polynomial_fast_path=False)
+        try:
+            row["biseccion"] = bisection_evaluations(f, a, b, TOLERANCE)
+        except ValueError:
+            row["biseccion"] = (None, None)
+        rows.append(row)
+    return rows
+
+
+def main():
+    rows = run_benchmark()
+    methods = ["brent", "illinois", "biseccion", "secante", "newton_raphson"]
+    table = [
+        [row["problema"]] + [row[m][1] if row[m][1] is not None else "no converge" for m in methods]
+        for row in rows
+    ]
+    print(tabulate(table, headers=["Problema", *methods], tablefmt="grid"))
+    if "--json" in sys.argv:
+        print(json.dumps(rows, indent=2))
+
+
+if __name__ == "__main__":
+    main()
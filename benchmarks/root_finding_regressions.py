@@ -0,0 +1,128 @@
+"""
+Casos de regresión de los métodos de raíces.
+
+Cada caso corre un método sobre un problema que alguna vez falló y compara el
+resultado con el esperado. El script termina con código 1 si algún caso falla.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.root_finding_regressions
+"""
+import json
+import sys
+
+import numpy as np
+from common.lazy_imports import lazy_import
+from differential_equations.fixed_point_acceleration import ACCELERATION_METHODS, accelerated_fixed_point
+from root_finding.all_roots import all_roots
+from root_finding.newton_raphson import newton_raphson
+from root_finding.newton_system import newton_system_batch
+from root_finding.steffensen_aitken import steffensen_aitken
+
+mpmath = lazy_import("mpmath")
+sp = lazy_import("sympy")
+
+
+def all_roots_cases(x):
+    # Oscilación densa: el refinamiento no puede muestrear más grueso que la grilla inicial
+    yield "all_roots sin(200 x) en [0, 10]", lambda: len(all_roots(x, sp.sin(200 * x), 0, 10)), 637
+    # Polos con cambio de signo: no son raíces
+    yield "all_roots tan(x) en [0, 5]", lambda: np.round(all_roots(x, sp.tan(x), 0, 5), 10).tolist(), [
+        0.0, 3.1415926536
+    ]
+    yield "all_roots 1/x en [-1, 2]", lambda: all_roots(x, 1 / x, -1, 2).tolist(), []
+
+
+def newton_multiplicity_cases(x):
+    # Raíces simples con convergencia lenta lejos de la raíz: no deben tomarse por múltiples
+    simple = [
+        ("x**8 + sin(x)/100 - 1 desde 2.5", x**8 + sp.sin(x) / 100 - 1, 2.5, 0.998944987),
+        ("x**10 - 1 desde 0.5", x**10 - 1, 0.5, 1.0),
+        ("x**20 - 1 desde 2", x**20 - 1, 2, 1.0),
+    ]
+    for label, f_x, start, expected in simple:
+        for multiplicity in (1, "auto"):
+            yield (f"newton_raphson {label}, multiplicity={multiplicity}",
+                   lambda f_x=f_x, start=start, multiplicity=multiplicity: round(float(newton_raphson(
+                       x, f_x, start, polynomial_fast_path=False, multiplicity=multiplicity
+                   ).root), 9), expected)
+    yield ("newton_raphson (x - 1)**3 desde 3, multiplicity=auto",
+           lambda: newton_raphson(x, (x - 1)**3, 3, polynomial_fast_path=False, multiplicity="auto").multiplicity, 3)
+
+
+def high_precision_cases(x):
+    # La etapa float de Steffensen anulaba el denominador antes de llegar a 1e-12
+    yield ("steffensen_aitken x - cos(x) con precision=50",
+           lambda: mpmath.nstr(steffensen_aitken(x, x - sp.cos(x), sp.cos(x), 1, precision=50).root, 40),
+           "0.7390851332151606416553120876738734040134")
+    # Las constantes Float de f limitaban la raíz a unos 16 dígitos
+    yield ("newton_raphson x**2 - 0.1 con precision=40",
+           lambda: mpmath.nstr(newton_raphson(x, x**2 - 0.1, 1, precision=40).root, 40),
+           "0.316227766016837933199889354443271853372")
+    # Las opciones de raíces múltiples se ignoraban en silencio
+    yield ("newton_raphson (x - 1)**3 con multiplicity=auto y precision=30",
+           lambda: newton_raphson(x, (x - 1)**3, 3, precision=30, multiplicity="auto").root,
+           "ValueError: multiplicity, known_roots y polynomial_fast_path no se combinan con precision > 15.")
+
+
+def system_cases(x, y):
+    # Jacobiana bien condicionada de escala 1e-160: el determinante se anulaba por underflow
+    yield ("newton_system_batch con Jacobiana de escala 1e-160",
+           lambda: newton_system_batch((x, y), [1e-160 * (x - 1), 1e-160 * (x + y - 2)], [[0, 0], [5, 5]],
+                                       tolerance=1e-175)['converged'].tolist(), [True, True])
+    # Jacobiana casi singular con entradas de orden 1 (como función de Python: sympy redondea
+    # 1 + 4e-16 a 1): el determinante (~4e-16) pasaba la prueba y el carril daba pasos de
+    # orden 1e12 en lugar de retirarse en su punto
+    yield ("newton_system_batch con Jacobiana casi singular",
+           lambda: newton_system_batch((x, y), lambda u, v: (u + v - 2, u + (1 + 4e-16) * v - 2.001), [[0, 0]])[
+               'root'].tolist(), [[0.0, 0.0]])
+
+
+def fixed_point_cases():
+    # Un mapa vectorial de un elemento recibe un vector, no un escalar
+    for method in ACCELERATION_METHODS:
+        yield (f"accelerated_fixed_point [cos(v0)] desde [0.5], method={method}",
+               lambda method=method: np.round(accelerated_fixed_point(
+                   lambda v: np.array([np.cos(v[0])]), [0.5], method
+               ).root, 8).tolist(), [0.73908513])
+
+
+def cases():
+    x = sp.symbols('x')
+    yield from all_roots_cases(x)
+    yield from newton_multiplicity_cases(x)
+    yield from high_precision_cases(x)
+    yield from system_cases(x, sp.symbols('y'))
+    yield from fixed_point_cases()
+
+
+def run_case(run):
+    try:
+        return run()
+    except (ValueError, ZeroDivisionError, OverflowError) as error:
+        return f"{type(error).__name__}: {error}"
+
+
+def run_regressions(cases):
+    report = []
+    for label, run, expected in cases:
+        obtained = run_case(run)
+        report.append({"caso": label, "esperado": expected, "obtenido": obtained, "passed": obtained == expected})
+    return report
+
+
+def report_regressions(cases):
+    # Imprime el reporte en JSON y termina con código 1 si algún caso falla
+    report = run_regressions(cases)
+    print(json.dumps(report, indent=2, ensure_ascii=False, default=str))
+    failed = [case["caso"] for case in report if not case["passed"]]
+    if failed:
+        print(f"Casos fallidos: {', '.join(failed)}")
+        sys.exit(1)
+
+
+def main():
+    report_regressions(cases())
+
+
+if __name__ == "__main__":
+    main()
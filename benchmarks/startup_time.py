@@ -0,0 +1,89 @@
+"""
+Mide el tiempo de importación de los paquetes y verifica el presupuesto de arranque.
+
+Cada medición se hace en un proceso nuevo para no reutilizar módulos ya cargados.
+El presupuesto se expresa como tiempo adicional sobre importar solo numpy, que es
+la única dependencia que se carga al importar los métodos.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.startup_time [--budget-ms 150] [--repeat 7]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ENTRY_MODULES = [
+    "root_finding.newton_raphson",
+    "root_finding.secant_method",
+    "root_finding.steffensen_aitken",
+    "integration_methods.rectangle_method",
+    "integration_methods.simpson_method",
+    "integration_methods.trapezoid_method",
+    "integration_methods.montecarlo_method",
+    "differential_equations.euler",
+    "differential_equations.improved_euler",
+    "differential_equations.runge_kutta",
+    "differential_equations.fixed_point",
+    "dynamic_systems.dynamic_system",
+]
+
+HEAVY_MODULES = ["sympy", "matplotlib", "scipy", "tabulate", "mpmath"]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(modules, repeat):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = PROBE.format(modules=modules, heavy=HEAVY_MODULES)
+    samples = []
+    loaded = set()
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=root, check=True, capture_output=True, text=True
+        ).stdout
+        data = json.loads(output)
+        samples.append(data["seconds"])
+        loaded.update(data["loaded"])
+    return statistics.median(samples), sorted(loaded)
+
+
+def run_benchmark(budget_ms=150, repeat=7):
+    numpy_time, _ = measure(["numpy"], repeat)
+    total_time, loaded = measure(["numpy"] + ENTRY_MODULES, repeat)
+    overhead_ms = (total_time - numpy_time) * 1000
+    return {
+        "numpy_ms": numpy_time * 1000,
+        "total_ms": total_time * 1000,
+        "overhead_ms": overhead_ms,
+        "budget_ms": budget_ms,
+        "heavy_modules_loaded": loaded,
+        "passed": overhead_ms <= budget_ms and not loaded,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Presupuesto de tiempo de importación.")
+    parser.add_argument("--budget-ms", type=float, default=150)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    report = run_benchmark(args.budget_ms, args.repeat)
+    print(json.dumps(report, indent=2))
+    if report["heavy_modules_loaded"]:
+        print(f"Dependencias pesadas cargadas al importar: {', '.join(report['heavy_modules_loaded'])}")
+    if not report["passed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Utilidades compartidas por los métodos numéricos."""
@@ -0,0 +1,338 @@
+import numpy as np
+
+
+class Dual:
+    """
+    Número dual value + derivative·ε (ε² = 0) para derivación automática en modo directo.
+
+    value y derivative pueden ser escalares o arreglos de NumPy de la misma forma,
+    así una sola evaluación vectorizada entrega f y f' en todos los puntos. Los
+    ufuncs de NumPy (np.sin, np.exp, ...) y los operadores aritméticos propagan la
+    derivada, de modo que sirven las funciones de lambdify con 'numpy' y cualquier
+    función de Python que use NumPy (las funciones del módulo math no). value y
+    derivative pueden ser a su vez duales, lo que da derivadas de orden superior.
+    """
+
+    __slots__ = ("value", "derivative")
+    __array_priority__ = 100
+
+    def __init__(self, value, derivative=0.0):
+        self.value = value
+        self.derivative = derivative
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != "__call__" or kwargs.get("out") is not None:
+            return NotImplemented
+        if ufunc in COMPARISONS:
+            return ufunc(*(primal(x) for x in inputs))
+        rule = RULES.get(ufunc)
+        if rule is None:
+            return NotImplemented
+        return rule(*inputs)
+
+    def __add__(self, other):
+        return np.add(self, other)
+
+    def __radd__(self, other):
+        return np.add(other, self)
+
+    def __sub__(self, other):
+        return np.subtract(self, other)
+
+    def __rsub__(self, other):
+        return np.subtract(other, self)
+
+    def __mul__(self, other):
+        return np.multiply(self, other)
+
+    def __rmul__(self, other):
+        return np.multiply(other, self)
+
+    def __truediv__(self, other):
+        return np.true_divide(self, other)
+
+    def __rtruediv__(self, other):
+        return np.true_divide(other, self)
+
+    def __pow__(self, other):
+        return np.power(self, other)
+
+    def __rpow__(self, other):
+        return np.power(other, self)
+
+    def __neg__(self):
+        return Dual(-self.value, -self.derivative)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return np.absolute(self)
+
+    def __lt__(self, other):
+        return primal(self) < primal(other)
+
+    def __le__(self, other):
+        return primal(self) <= primal(other)
+
+    def __gt__(self, other):
+        return primal(self) > primal(other)
+
+    def __ge__(self, other):
+        return primal(self) >= primal(other)
+
+    def __eq__(self, other):
+        return primal(self) == primal(other)
+
+    def __ne__(self, other):
+        return primal(self) != primal(other)
+
+    __hash__ = None
+
+    def __float__(self):
+        return float(primal(self))
+
+    def __getitem__(self, index):
+        return Dual(self.value[index], np.broadcast_to(self.derivative, np.shape(self.value))[index])
+
+    @property
+    def shape(self):
+        return np.shape(primal(self))
+
+    def __repr__(self):
+        return f"Dual({self.value!r}, {self.derivative!r})"
+
+
+def primal(x):
+    while isinstance(x, Dual):
+        x = x.value
+    return x
+
+
+def parts(x):
+    if isinstance(x, Dual):
+        return x.value, x.derivative, True
+    return x, 0.0, False
+
+
+def unary(function, slope):
+    # slope(a) es la derivada de function evaluada en a
+    def rule(x):
+        a, da, _ = parts(x)
+        return Dual(function(a), slope(a) * da)
+    return rule
+
+
+def rule_add(x, y):
+    a, da, _ = parts(x)
+    b, db, _ = parts(y)
+    return Dual(a + b, da + db)
+
+
+def rule_subtract(x, y):
+    a, da, _ = parts(x)
+    b, db, _ = parts(y)
+    return Dual(a - b, da - db)
+
+
+def rule_multiply(x, y):
+    a, da, _ = parts(x)
+    b, db, _ = parts(y)
+    return Dual(a * b, da * b + a * db)
+
+
+def rule_divide(x, y):
+    a, da, _ = parts(x)
+    b, db, _ = parts(y)
+    quotient = a / b
+    return Dual(quotient, (da - quotient * db) / b)
+
+
+def rule_power(x, y):
+    a, da, _ = parts(x)
+    b, db, exponent_is_dual = parts(y)
+    result = a ** b
+    if not exponent_is_dual:
+        # Exponente constante: no hace falta log(a), que no existe para a <= 0
+        return Dual(result, b * a ** (b - 1) * da)
+    return Dual(result, result * (db * np.log(a) + b * da / a))
+
+
+def rule_arctan2(x, y):
+    a, da, _ = parts(x)
+    b, db, _ = parts(y)
+    return Dual(np.arctan2(a, b), (b * da - a * db) / (a * a + b * b))
+
+
+def rule_hypot(x, y):
+    a, da, _ = parts(x)
+    b, db, _ = parts(y)
+    h = np.hypot(a, b)
+    return Dual(h, (a * da + b * db) / h)
+
+
+def rule_tan(x):
+    a, da, _ = parts(x)
+    t = np.tan(a)
+    return Dual(t, (1 + t * t) * da)
+
+
+def rule_tanh(x):
+    a, da, _ = parts(x)
+    t = np.tanh(a)
+    return Dual(t, (1 - t * t) * da)
+
+
+def rule_exp(x):
+    a, da, _ = parts(x)
+    e = np.exp(a)
+    return Dual(e, e * da)
+
+
+def rule_sqrt(x):
+    a, da, _ = parts(x)
+    s = np.sqrt(a)
+    return Dual(s, da / (2 * s))
+
+
+def rule_cbrt(x):
+    a, da, _ = parts(x)
+    c = np.cbrt(a)
+    return Dual(c, da / (3 * c * c))
+
+
+def constant_rule(function):
+    # Funciones escalonadas: derivada cero donde existe
+    def rule(x):
+        a = parts(x)[0]
+        return Dual(function(a), 0.0 * a)
+    return rule
+
+
+RULES = {
+    np.add: rule_add,
+    np.subtract: rule_subtract,
+    np.multiply: rule_multiply,
+    np.true_divide: rule_divide,
+    np.power: rule_power,
+    np.float_power: rule_power,
+    np.arctan2: rule_arctan2,
+    np.hypot: rule_hypot,
+    np.negative: unary(np.negative, lambda a: -1.0),
+    np.positive: unary(np.positive, lambda a: 1.0),
+    np.absolute: unary(np.absolute, np.sign),
+    np.exp: rule_exp,
+    np.expm1: unary(np.expm1, np.exp),
+    np.exp2: unary(np.exp2, lambda a: np.exp2(a) * np.log(2)),
+    np.log: unary(np.log, lambda a: 1 / a),
+    np.log2: unary(np.log2, lambda a: 1 / (a * np.log(2))),
+    np.log10: unary(np.log10, lambda a: 1 / (a * np.log(10))),
+    np.log1p: unary(np.log1p, lambda a: 1 / (1 + a)),
+    np.sqrt: rule_sqrt,
+    np.cbrt: rule_cbrt,
+    np.square: unary(np.square, lambda a: 2 * a),
+    np.reciprocal: unary(np.reciprocal, lambda a: -1 / (a * a)),
+    np.sin: unary(np.sin, np.cos),
+    np.cos: unary(np.cos, lambda a: -np.sin(a)),
+    np.tan: rule_tan,
+    np.arcsin: unary(np.arcsin, lambda a: 1 / np.sqrt(1 - a * a)),
+    np.arccos: unary(np.arccos, lambda a: -1 / np.sqrt(1 - a * a)),
+    np.arctan: unary(np.arctan, lambda a: 1 / (1 + a * a)),
+    np.sinh: unary(np.sinh, np.cosh),
+    np.cosh: unary(np.cosh, np.sinh),
+    np.tanh: rule_tanh,
+    np.arcsinh: unary(np.arcsinh, lambda a: 1 / np.sqrt(a * a + 1)),
+    np.arccosh: unary(np.arccosh, lambda a: 1 / np.sqrt(a * a - 1)),
+    np.arctanh: unary(np.arctanh, lambda a: 1 / (1 - a * a)),
+    np.sign: constant_rule(np.sign),
+    np.floor: constant_rule(np.floor),
+    np.ceil: constant_rule(np.ceil),
+    np.rint: constant_rule(np.rint),
+}
+
+COMPARISONS = {
+    np.less, np.less_equal, np.greater, np.greater_equal, np.equal, np.not_equal,
+    np.isfinite, np.isnan, np.isinf, np.signbit,
+}
+
+
+def derivative(func, x):
+    """
+    Retorna (f(x), f'(x)) con una sola evaluación de func. x puede ser un arreglo.
+    """
+    result = func(Dual(np.asarray(x, dtype=float) if np.ndim(x) else float(x), 1.0))
+    if isinstance(result, Dual):
+        return result.value, result.derivative
+    # func no depende de x
+    return result, 0.0 * np.asarray(result)
+
+
+def derivatives(func, x, order=2):
+    """
+    Retorna (f(x), f'(x), ..., f^(order)(x)) anidando duales.
+
+    El costo crece como 2**order, así que está pensado para órdenes pequeños
+    (Halley y métodos de Householder usan order=2 u order=3).
+    """
+    x = np.asarray(x, dtype=float) if np.ndim(x) else float(x)
+    result = func(lift(x, order))
+    values = []
+    for k in range(order + 1):
+        node = result
+        # Cualquier camino con k derivadas entre los order niveles da f^(k)
+        for level in range(order):
+            if isinstance(node, Dual):
+                node = node.derivative if level < k else node.value
+            elif level < k:
+                # Un valor que no es dual es constante en ese nivel
+                node = 0.0 * np.asarray(node)
+        values.append(node)
+    return tuple(values)
+
+
+def lift(x, order):
+    # x_n = Dual(x_{n-1}, dx_{n-1}/dx), donde la derivada de la semilla es 1 en el nivel base
+    if order == 0:
+        return x
+    return Dual(lift(x, order - 1), unit(order - 1))
+
+
+def unit(order):
+    if order == 0:
+        return 1.0
+    return Dual(unit(order - 1), zero(order - 1))
+
+
+def zero(order):
+    if order == 0:
+        return 0.0
+    return Dual(zero(order - 1), zero(order - 1))
+
+
+def jacobian(func, point):
+    """
+    Evalúa func(*point) y su Jacobiana con n pasadas en modo directo.
+
+    point tiene forma (n,) o (n, m) para evaluar m puntos a la vez; func recibe
+    n argumentos y retorna una secuencia de funciones componentes. Retorna
+    (valores, J) con formas (k,) y (k, n) (o (k, m) y (k, n, m) en lote).
+    """
+    point = [np.asarray(p, dtype=float) for p in point]
+    n = len(point)
+    values = None
+    columns = []
+    for i in range(n):
+        args = [Dual(p, 1.0 if j == i else 0.0) for j, p in enumerate(point)]
+        outputs = func(*args)
+        if values is None:
+            values = np.array([np.broadcast_to(primal(o), np.shape(point[0])) for o in outputs], dtype=float)
+        columns.append([
+            np.broadcast_to(o.derivative if isinstance(o, Dual) else 0.0, np.shape(point[0]))
+            for o in outputs
+        ])
+    return values, np.array(columns, dtype=float).swapaxes(0, 1)
+
+
+def is_numeric_callable(obj):
+    # Las expresiones de sympy tienen free_symbols; las funciones de Python no
+    return callable(obj) and not hasattr(obj, "free_symbols")
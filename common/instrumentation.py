@@ -0,0 +1,186 @@
+import functools
+import json
+import os
+import time
+import weakref
+from contextlib import contextmanager
+
+import numpy as np
+from common.dual import Dual
+
+ENABLE_ENV = "MODELADO_INSTRUMENTATION"
+NO_METHOD = "<sin método>"
+LABEL_LENGTH = 80
+
+
+class Instrumentation:
+    """
+    Registro opcional de evaluaciones y tiempos de los métodos numéricos.
+
+    Los métodos decorados con profiled registran su tiempo total y las funciones
+    compiladas (cached_lambdify) o importadas de forma diferida (lazy_callable)
+    registran cada llamada: cantidad, elementos evaluados (el tamaño del lote en
+    llamadas vectorizadas) y tiempo. Las llamadas se atribuyen al método que está
+    en ejecución. Desactivado, las funciones no se envuelven y los métodos (y las
+    funciones envueltas antes de disable()) solo revisan una bandera, así que el
+    costo es despreciable. Se activa con enable(),
+    con recording() o con la variable de entorno MODELADO_INSTRUMENTATION.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.methods = {}
+        self.stack = []
+        self.wrappers = weakref.WeakKeyDictionary()
+
+    def stats(self, method):
+        stats = self.methods.get(method)
+        if stats is None:
+            stats = {"calls": 0, "seconds": 0.0, "nested_seconds": 0.0, "functions": {}}
+            self.methods[method] = stats
+        return stats
+
+    def record_call(self, label, elements, seconds):
+        method = self.stack[-1] if self.stack else NO_METHOD
+        functions = self.stats(method)["functions"]
+        entry = functions.get(label)
+        if entry is None:
+            entry = functions[label] = {"calls": 0, "elements": 0, "seconds": 0.0}
+        entry["calls"] += 1
+        entry["elements"] += elements
+        entry["seconds"] += seconds
+
+    def record_method(self, method, seconds):
+        stats = self.stats(method)
+        stats["calls"] += 1
+        stats["seconds"] += seconds
+        if self.stack:
+            # El tiempo de un método llamado desde otro no cuenta como tiempo propio del padre
+            self.stats(self.stack[-1])["nested_seconds"] += seconds
+
+    def instrument(self, func, label):
+        # label puede ser un texto o una expresión de sympy (se convierte una sola vez)
+        if not self.enabled:
+            return func
+        timed = self.wrappers.get(func)
+        if timed is not None:
+            return timed
+        label = label if isinstance(label, str) else expression_label(label)
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            # La envoltura sobrevive a disable(): la bandera se revisa en cada llamada
+            if not self.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            value = func(*args, **kwargs)
+            self.record_call(label, batch_size(args), time.perf_counter() - start)
+            return value
+
+        self.wrappers[func] = timed
+        return timed
+
+    def profiled(self, func):
+        method = func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return func(*args, **kwargs)
+            self.stack.append(method)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                seconds = time.perf_counter() - start
+                self.stack.pop()
+                self.record_method(method, seconds)
+
+        return wrapper
+
+    def report(self):
+        methods = {}
+        for method, stats in self.methods.items():
+            functions = {label: dict(entry) for label, entry in stats["functions"].items()}
+            evaluation_seconds = sum(entry["seconds"] for entry in functions.values())
+            own_seconds = stats["seconds"] - stats["nested_seconds"]
+            methods[method] = {
+                "calls": stats["calls"],
+                "seconds": stats["seconds"],
+                "evaluations": sum(entry["calls"] for entry in functions.values()),
+                "evaluation_seconds": evaluation_seconds,
+                # Lazo de Python, tablas, impresión y gráficas
+                "other_seconds": max(own_seconds - evaluation_seconds, 0.0) if stats["calls"] else 0.0,
+                "functions": functions,
+            }
+        return {"methods": methods}
+
+    def reset(self):
+        self.methods.clear()
+
+
+def batch_size(args):
+    # Arreglos, listas y números duales (se cuenta el tamaño de su parte real)
+    size = 1
+    for arg in args:
+        size = max(size, np.size(arg.value if isinstance(arg, Dual) else arg))
+    return int(size)
+
+
+def expression_label(expr):
+    label = str(expr)
+    return label if len(label) <= LABEL_LENGTH else label[:LABEL_LENGTH - 3] + "..."
+
+
+default_instrumentation = Instrumentation(enabled=bool(os.environ.get(ENABLE_ENV)))
+
+
+def profiled(func):
+    return default_instrumentation.profiled(func)
+
+
+def instrument(func, label):
+    return default_instrumentation.instrument(func, label)
+
+
+def is_enabled():
+    return default_instrumentation.enabled
+
+
+def enable():
+    default_instrumentation.enabled = True
+
+
+def disable():
+    default_instrumentation.enabled = False
+
+
+def reset():
+    default_instrumentation.reset()
+
+
+def report():
+    return default_instrumentation.report()
+
+
+def write_report(path):
+    with open(path, "w", encoding="utf-8") as report_file:
+        json.dump(report(), report_file, indent=2)
+
+
+@contextmanager
+def recording():
+    """
+    Activa la instrumentación dentro del bloque y entrega el registro, por ejemplo:
+
+        with recording() as instrumentation:
+            newton_raphson(x, f_x, 2)
+        print(json.dumps(instrumentation.report(), indent=2))
+    """
+    previous = default_instrumentation.enabled
+    default_instrumentation.reset()
+    default_instrumentation.enabled = True
+    try:
+        yield default_instrumentation
+    finally:
+        default_instrumentation.enabled = previous
@@ -0,0 +1,171 @@
+import hashlib
+import inspect
+import os
+import threading
+from collections import OrderedDict, namedtuple
+
+from common.instrumentation import instrument, is_enabled
+from common.lazy_imports import lazy_import
+
+sp = lazy_import("sympy")
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "disk_hits", "evictions", "maxsize", "currsize"])
+
+DEFAULT_MAXSIZE = 256
+DISK_DIR_ENV = "MODELADO_LAMBDIFY_CACHE_DIR"
+
+
+class LambdifyCache:
+    """
+    Caché LRU de funciones compiladas con sympy.lambdify.
+
+    La clave combina la estructura de la expresión, los símbolos de los
+    argumentos, el backend (modules) y las opciones extra de lambdify.
+    Si se indica disk_dir, el código generado se guarda en disco para que
+    un proceso nuevo no tenga que volver a generarlo.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, disk_dir=None):
+        if maxsize < 1:
+            raise ValueError("El tamaño máximo de la caché debe ser al menos 1.")
+        self.maxsize = maxsize
+        self.disk_dir = disk_dir
+        self.entries = OrderedDict()
+        self.namespaces = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+
+    def lambdify(self, args, expr, modules='numpy', **kwargs):
+        key = (freeze(args), freeze(expr), freeze(modules), freeze(kwargs))
+        with self.lock:
+            func = self.entries.get(key)
+            if func is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return func
+            self.misses += 1
+
+        func = None
+        path = self.disk_path(key) if self.disk_dir else None
+        if path is not None and os.path.exists(path):
+            func = self.load(path, key[2], modules)
+            if func is not None:
+                with self.lock:
+                    self.disk_hits += 1
+        if func is None:
+            func = sp.lambdify(args, expr, modules, **kwargs)
+            if path is not None:
+                self.store(path, func, key[2], modules)
+
+        with self.lock:
+            self.entries[key] = func
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+        return func
+
+    def disk_path(self, key):
+        # Solo se persisten backends descritos por datos simples, no por objetos en memoria
+        if not is_plain(key[2]) or not is_plain(key[3]):
+            return None
+        digest = hashlib.sha256(repr((sp.srepr(key[0]), sp.srepr(key[1]), key[2], key[3])).encode()).hexdigest()
+        return os.path.join(self.disk_dir, f"{digest}.py")
+
+    def namespace(self, frozen_modules, modules):
+        namespace = self.namespaces.get(frozen_modules)
+        if namespace is None:
+            namespace = sp.lambdify((), 0, modules).__globals__
+            self.namespaces[frozen_modules] = namespace
+        return namespace
+
+    def load(self, path, frozen_modules, modules):
+        try:
+            with open(path, encoding="utf-8") as source_file:
+                source = source_file.read()
+            namespace = dict(self.namespace(frozen_modules, modules))
+            exec(compile(source, path, "exec"), namespace)
+            return namespace["_lambdifygenerated"]
+        except (OSError, SyntaxError, KeyError):
+            return None
+
+    def store(self, path, func, frozen_modules, modules):
+        # Si lambdify agregó nombres propios de la expresión (funciones implementadas,
+        # importaciones del printer), el código no se puede reconstruir solo con el backend
+        base = self.namespace(frozen_modules, modules)
+        extra = [
+            name for name in set(func.__globals__) - set(base)
+            if name != "_lambdifygenerated" and not isinstance(func.__globals__[name], sp.Symbol)
+        ]
+        if extra:
+            return
+        try:
+            source = inspect.getsource(func)
+            os.makedirs(self.disk_dir, exist_ok=True)
+            temporary = f"{path}.{os.getpid()}.tmp"
+            with open(temporary, "w", encoding="utf-8") as source_file:
+                source_file.write(source)
+            os.replace(temporary, path)
+        except (OSError, TypeError):
+            pass
+
+    def info(self):
+        with self.lock:
+            return CacheInfo(self.hits, self.misses, self.disk_hits, self.evictions, self.maxsize, len(self.entries))
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = self.disk_hits = self.evictions = 0
+
+
+def freeze(value):
+    if isinstance(value, sp.MatrixBase):
+        return sp.ImmutableMatrix(value)
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted((str(k), freeze(v)) for k, v in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(freeze(v) for v in value))
+    if inspect.ismodule(value):
+        return ("module", value.__name__)
+    return value
+
+
+def is_plain(value):
+    if isinstance(value, tuple):
+        return all(is_plain(v) for v in value)
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+default_cache = LambdifyCache(disk_dir=os.environ.get(DISK_DIR_ENV))
+
+
+def cached_lambdify(args, expr, modules='numpy', **kwargs):
+    func = default_cache.lambdify(args, expr, modules, **kwargs)
+    if is_enabled():
+        return instrument(func, expr)
+    return func
+
+
+def cache_info():
+    return default_cache.info()
+
+
+def cache_clear():
+    default_cache.clear()
+
+
+def configure_cache(maxsize=None, disk_dir=None):
+    if maxsize is not None:
+        if maxsize < 1:
+            raise ValueError("El tamaño máximo de la caché debe ser al menos 1.")
+        with default_cache.lock:
+            default_cache.maxsize = maxsize
+            while len(default_cache.entries) > maxsize:
+                default_cache.entries.popitem(last=False)
+                default_cache.evictions += 1
+    if disk_dir is not None:
+        default_cache.disk_dir = disk_dir or None
@@ -0,0 +1,41 @@
+import importlib
+import types
+
+from common.instrumentation import default_instrumentation
+
+
+class LazyModule(types.ModuleType):
+    """
+    Módulo que se importa recién cuando se accede a uno de sus atributos.
+
+    Después de la primera importación copia el contenido del módulo real,
+    así que los accesos siguientes no pasan por __getattr__.
+    """
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+    def __repr__(self):
+        return f"<lazy module {self.__name__!r}>"
+
+
+def lazy_import(name):
+    return LazyModule(name)
+
+
+def lazy_callable(module_name, attribute):
+    target = None
+
+    def call(*args, **kwargs):
+        nonlocal target
+        if target is None:
+            target = getattr(importlib.import_module(module_name), attribute)
+        if default_instrumentation.enabled:
+            return default_instrumentation.instrument(target, f"{module_name}.{attribute}")(*args, **kwargs)
+        return target(*args, **kwargs)
+
+    call.__name__ = attribute
+    call.__qualname__ = attribute
+    return call
@@ -0,0 +1 @@
+"""Métodos para ecuaciones diferenciales, punto fijo e interpolación."""
@@ -1,11 +1,17 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from tabulate import tabulate
-import sympy as sp
+from common.instrumentation import profiled
+from common.lambdify_cache import cached_lambdify
+from common.lazy_imports import lazy_callable, lazy_import
 
+plt = lazy_import("matplotlib.pyplot")
+sp = lazy_import("sympy")
+tabulate = lazy_callable("tabulate", "tabulate")
+
+
+@profiled
 def euler(f_sym, initial_point, end, steps, precision=5):
     x_sym, y_sym = sp.symbols('x y')
-    f = sp.lambdify((x_sym, y_sym), f_sym, 'numpy')
+    f = cached_lambdify((x_sym, y_sym), f_sym, 'numpy')
     h = (end - initial_point[0]) / steps
     x = np.zeros(steps + 1)
     y = np.zeros(steps + 1)
@@ -1,51 +1,71 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from tabulate import tabulate
-import sympy as sp
+from common.instrumentation import profiled
+from common.lambdify_cache import cached_lambdify
+from common.lazy_imports import lazy_import
+from differential_equations.fixed_point_acceleration import accelerated_fixed_point
+from root_finding.root_result import RootResult
 
-def fixed_point(initial_value, f_sym, g_sym, max_iterations=100, tolerance=1e-6, precision=5):
+plt = lazy_import("matplotlib.pyplot")
+sp = lazy_import("sympy")
+
+
+@profiled
+def fixed_point(initial_value, f_sym, g_sym, max_iterations=100, tolerance=1e-6, precision=5, trace="summary",
+                acceleration=None, depth=5):
+    """
+    Con acceleration ("anderson", "aitken" o "epsilon") la iteración se delega a
+    accelerated_fixed_point, que necesita menos evaluaciones de g en mapas lentos.
+    """
     x_sym = sp.symbols('x')
-    g = sp.lambdify(x_sym, g_sym, 'numpy')
-    f = sp.lambdify(x_sym, f_sym, 'numpy')
+    g = cached_lambdify(x_sym, g_sym, 'numpy')
+    f = cached_lambdify(x_sym, f_sym, 'numpy')
     h = 1e-5
     deriv = (g(initial_value + h) - g(initial_value - h)) / (2 * h)
     if abs(deriv) >= 1:
         raise ValueError("No cumple la condición de convergencia (|g'(x)| < 1)")
+    if acceleration is not None:
+        result = accelerated_fixed_point(
+            g, initial_value, acceleration, depth, tolerance, max_iterations,
+            precision=precision, trace=trace, function=f, plotter=plot_fixed_point
+        )
+        result.evaluations += 2
+        return result
+    result = RootResult(
+        "fixed_point",
+        ["x", "g(x)", "Error Absoluto", "Error Relativo %"],
+        max_iterations, trace, precision, function=f, plotter=plot_fixed_point
+    )
+    result.evaluations = 2
+    full_trace = result.trace
     x = initial_value
-    iterations = []
     for i in range(max_iterations):
         x_new = g(x)
+        result.evaluations += 1
         abs_error = abs(x_new - x)
         rel_error = abs((x_new - x) * 100 / x_new) if x_new != 0 else float('inf')
-        iterations.append([
-            i + 1,
-            round(x, precision),
-            round(x_new, precision),
-            round(abs_error, precision),
-            f"{round(rel_error, 2)} %"
-        ])
+        if full_trace is not None:
+            full_trace[i] = (x, x_new, abs_error, rel_error)
         if abs_error < tolerance:
-            print(tabulate(
-                iterations,
-                headers=["Iteración", "x", "g(x)", "Error Absoluto", "Error Relativo"],
-                tablefmt="grid"
-            ))
-            x_vals = np.linspace(0, 2, 400)
-            y_vals = f(x_vals)
-            plt.plot(x_vals, y_vals, label='$f(x)$')
-            plt.plot(x_new, f(x_new), 'ro', label=f'Raíz aproximada: x = {x_new:.5f}')
-            plt.axhline(0, color='black', linewidth=0.5)
-            plt.axvline(0, color='black', linewidth=0.5)
-            plt.grid(color='gray', linestyle='--', linewidth=0.5)
-            plt.title('Método del Punto Fijo')
-            plt.xlabel('$x$')
-            plt.ylabel('$f(x)$')
-            plt.legend()
-            plt.show()
-            return x_new
+            return result.finish(x_new, i + 1, abs_error, rel_error)
         x = x_new
     raise ValueError("El método no convergió dentro del número máximo de iteraciones.")
 
+def plot_fixed_point(result):
+    f = result.function
+    x_new = result.root
+    x_vals = np.linspace(0, 2, 400)
+    y_vals = f(x_vals)
+    plt.plot(x_vals, y_vals, label='$f(x)$')
+    plt.plot(x_new, f(x_new), 'ro', label=f'Raíz aproximada: x = {x_new:.5f}')
+    plt.axhline(0, color='black', linewidth=0.5)
+    plt.axvline(0, color='black', linewidth=0.5)
+    plt.grid(color='gray', linestyle='--', linewidth=0.5)
+    plt.title('Método del Punto Fijo')
+    plt.xlabel('$x$')
+    plt.ylabel('$f(x)$')
+    plt.legend()
+    plt.show()
+
 def main():
     x = sp.symbols('x')
     f_sym = x**2 - 2
@@ -54,7 +74,9 @@ def main():
     max_iterations = 100
     tolerance = 1e-6
     precision = 5
-    fixed_point(initial_value, f_sym, g_sym, max_iterations, tolerance, precision)
+    result = fixed_point(initial_value, f_sym, g_sym, max_iterations, tolerance, precision, trace="full")
+    result.print_report()
+    result.plot()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,169 @@
+import numpy as np
+from common.instrumentation import profiled
+from root_finding.root_result import RootResult
+
+ACCELERATION_METHODS = ("none", "anderson", "aitken", "epsilon")
+# El ciclo épsilon se alarga cuando el residuo no baja al menos este factor entre ciclos
+EPSILON_IMPROVEMENT = 0.1
+
+
+@profiled
+def accelerated_fixed_point(g, initial_value, method="anderson", depth=5, tolerance=1e-10, max_iterations=200,
+                            mixing=1.0, precision=8, trace="summary", function=None, plotter=None):
+    """
+    Acelera la iteración de punto fijo x = g(x) para g escalar o vectorial.
+
+    - "anderson": mezcla de Anderson con las últimas depth diferencias de g(x) - x.
+      Usa una evaluación de g por iteración; mixing es el factor de relajación.
+    - "aitken": extrapolación Δ² vectorial (Irons-Tuck) cada dos evaluaciones de g.
+    - "epsilon": algoritmo épsilon de Wynn vectorial. Cada ciclo reinicia la tabla
+      desde la extrapolación anterior; empieza con 3 términos (2 evaluaciones de g,
+      como Aitken) y se alarga de a dos, hasta 2 * depth + 1, mientras el residuo
+      no baje al menos 10 veces por ciclo (mapas con varios modos lentos).
+    - "none": iteración simple.
+    Si el residuo ||g(x) - x|| deja de mejorar, se descarta la historia (o la
+    extrapolación) y se reinicia desde el mejor punto conocido.
+
+    Converge cuando ||g(x) - x|| < tolerance y retorna g(x) en un RootResult;
+    evaluations cuenta las evaluaciones de g.
+    """
+    if method not in ACCELERATION_METHODS:
+        raise ValueError(f"Aceleración desconocida: {method}. Opciones: {', '.join(ACCELERATION_METHODS)}")
+    if depth < 1:
+        raise ValueError("La profundidad de la historia debe ser al menos 1.")
+
+    scalar = np.ndim(initial_value) == 0
+    result = RootResult(
+        f"fixed_point_{method}",
+        ["||g(x) - x||", "Evaluaciones", "Reinicio"],
+        max_iterations, trace, precision, function=function, plotter=plotter
+    )
+    iterate = FixedPointMap(g, result, scalar)
+    engines = {"none": plain_steps, "anderson": anderson_steps, "aitken": aitken_steps, "epsilon": epsilon_steps}
+    steps = engines[method](iterate, depth, mixing)
+    next(steps)
+
+    x = np.atleast_1d(np.array(initial_value, dtype=float))
+    restarted = False
+    for iteration in range(max_iterations):
+        gx, residual_norm = iterate(x)
+        if result.trace is not None:
+            result.trace[iteration] = (residual_norm, result.evaluations, int(restarted))
+        if residual_norm < tolerance:
+            root = gx[0] if scalar else gx
+            rel_error = residual_norm * 100 / np.max(np.abs(gx)) if np.any(gx) else np.inf
+            return result.finish(root, iteration + 1, residual_norm, rel_error)
+
+        restarted = iterate.stalled(depth + 1)
+        if restarted:
+            # Estancamiento: se descarta la historia y se sigue desde el mejor punto
+            steps = engines[method](iterate, depth, mixing)
+            next(steps)
+            x, gx = iterate.best, iterate.best_image
+        x = steps.send((x, gx))
+        if not np.all(np.isfinite(x)):
+            x = iterate.best_image
+
+    raise ValueError("El método no convergió dentro del número máximo de iteraciones.")
+
+
+class FixedPointMap:
+    # Evalúa g, cuenta las evaluaciones y recuerda el punto con menor residuo. Con scalar,
+    # g recibe un número; si no, un vector (aunque tenga un solo elemento)
+    def __init__(self, g, result, scalar):
+        self.g = g
+        self.result = result
+        self.scalar = scalar
+        self.best = None
+        self.best_image = None
+        self.best_norm = np.inf
+        self.without_progress = 0
+
+    def __call__(self, x):
+        self.result.evaluations += 1
+        value = self.g(x[0]) if self.scalar else self.g(x)
+        gx = np.atleast_1d(np.array(value, dtype=float))
+        residual_norm = np.max(np.abs(gx - x))
+        if residual_norm < self.best_norm:
+            self.best, self.best_image, self.best_norm = x, gx, residual_norm
+            self.without_progress = 0
+        else:
+            self.without_progress += 1
+        return gx, residual_norm
+
+    def stalled(self, patience):
+        if self.without_progress < patience:
+            return False
+        self.without_progress = 0
+        return True
+
+
+def plain_steps(iterate, depth, mixing):
+    x, gx = yield
+    while True:
+        x, gx = yield x + mixing * (gx - x)
+
+
+def anderson_steps(iterate, depth, mixing):
+    x, gx = yield
+    history_x, history_f = [], []
+    while True:
+        residual = gx - x
+        history_x = (history_x + [x])[-(depth + 1):]
+        history_f = (history_f + [residual])[-(depth + 1):]
+        if len(history_f) == 1:
+            x_new = x + mixing * residual
+        else:
+            delta_x = np.diff(np.array(history_x), axis=0).T
+            delta_f = np.diff(np.array(history_f), axis=0).T
+            gamma = np.linalg.lstsq(delta_f, residual, rcond=None)[0]
+            x_new = x + mixing * residual - (delta_x + mixing * delta_f) @ gamma
+        x, gx = yield x_new
+
+
+def aitken_steps(iterate, depth, mixing):
+    x, gx = yield
+    while True:
+        x1 = gx
+        x2, _ = iterate(x1)
+        delta1 = x2 - x1
+        delta2 = delta1 - (x1 - x)
+        denominator = delta2 @ delta2
+        if denominator == 0:
+            x, gx = yield x2
+        else:
+            x, gx = yield x2 - (delta1 @ delta2) / denominator * delta1
+
+
+def epsilon_steps(iterate, depth, mixing):
+    x, gx = yield
+    terms = 3
+    previous_norm = np.inf
+    while True:
+        norm = np.max(np.abs(gx - x))
+        if norm > EPSILON_IMPROVEMENT * previous_norm:
+            terms = min(terms + 2, 2 * depth + 1)
+        previous_norm = norm
+        sequence = [x, gx]
+        for _ in range(terms - 2):
+            value, _ = iterate(sequence[-1])
+            sequence.append(value)
+        extrapolated = wynn_epsilon(sequence)
+        x, gx = yield sequence[-1] if extrapolated is None else extrapolated
+
+
+def wynn_epsilon(sequence):
+    # Tabla épsilon con la inversa de Samelson v^-1 = v / (v · v)
+    previous = [np.zeros_like(sequence[0])] * (len(sequence) + 1)
+    current = list(sequence)
+    for column in range(1, len(sequence)):
+        following = []
+        for n in range(len(current) - 1):
+            difference = current[n + 1] - current[n]
+            squared = difference @ difference
+            if squared == 0 or not np.isfinite(squared):
+                return None
+            following.append(previous[n + 1] + difference / squared)
+        previous, current = current, following
+    # Solo las columnas pares son aproximaciones del límite
+    return current[0] if len(sequence) % 2 == 1 else previous[0]
@@ -1,7 +1,9 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from tabulate import tabulate
-import sympy as sp
+from common.lazy_imports import lazy_callable, lazy_import
+
+plt = lazy_import("matplotlib.pyplot")
+sp = lazy_import("sympy")
+tabulate = lazy_callable("tabulate", "tabulate")
 
 
 def lagrange_interpolation(points, num_points=100, precision=5):
@@ -0,0 +1 @@
+"""Análisis de sistemas dinámicos en el plano."""
@@ -1,17 +1,21 @@
 # bifurcation.py
 
 import numpy as np
-import matplotlib.pyplot as plt
-import sympy as sp
-from sympy import symbols, solve
+from common.lazy_imports import lazy_import
 
-def generate_bifurcation_diagram(f_sym, g_sym, parameter, param_range, variables=(sp.Symbol('x'), sp.Symbol('y'))):
+plt = lazy_import("matplotlib.pyplot")
+sp = lazy_import("sympy")
+
+
+def generate_bifurcation_diagram(f_sym, g_sym, parameter, param_range, variables=None):
+    if variables is None:
+        variables = (sp.Symbol('x'), sp.Symbol('y'))
     equilibria_values = []
     param_values = np.linspace(param_range[0], param_range[1], 200)
     for param_val in param_values:
         f_sub = f_sym.subs({parameter: param_val})
         g_sub = g_sym.subs({parameter: param_val})
-        solutions = solve([f_sub, g_sub], variables, dict=True)
+        solutions = sp.solve([f_sub, g_sub], variables, dict=True)
         for sol in solutions:
             try:
                 eq_x = sol.get(variables[0], variables[0])
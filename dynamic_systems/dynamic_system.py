@@ -1,10 +1,13 @@
-import sympy as sp
 import numpy as np
-from sympy import symbols, Matrix, lambdify, solve, simplify, sympify, pprint, nsimplify, S, Rational, Expr, exp
-from jacobian import compute_jacobian_symbolic, compute_jacobian_at_equilibrium
-from equilibria import find_equilibria_symbolic, analyze_equilibria
-from plotting import plot_phase_portrait, display_nullclines
-from bifurcation import generate_bifurcation_diagram
+from common.lambdify_cache import cached_lambdify
+from common.lazy_imports import lazy_import
+from dynamic_systems.bifurcation import generate_bifurcation_diagram
+from dynamic_systems.equilibria import find_equilibria_symbolic, analyze_equilibria
+from dynamic_systems.jacobian import compute_jacobian_symbolic, compute_jacobian_at_equilibrium
+from dynamic_systems.plotting import plot_phase_portrait, display_nullclines
+
+sp = lazy_import("sympy")
+
 
 class DynamicSystem:
     def __init__(self, f_sym, g_sym, parameters=None):
@@ -19,8 +22,8 @@ class DynamicSystem:
         self.results = []
 
     def ensure_sympy_expression(self, func):
-        expr = sympify(func, evaluate=False)
-        expr = nsimplify(expr, rational=True)
+        expr = sp.sympify(func, evaluate=False)
+        expr = sp.nsimplify(expr, rational=True)
         return expr
 
     def run_full_analysis(self):
@@ -30,7 +33,7 @@ class DynamicSystem:
         if self.equilibria:
             print("Puntos de equilibrio encontrados:")
             for eq in self.equilibria:
-                pprint(eq)
+                sp.pprint(eq)
             self.analyze_equilibria()
             self.display_results()
         else:
@@ -48,7 +51,7 @@ class DynamicSystem:
     def compute_jacobian(self):
         self.jacobian_matrix = compute_jacobian_symbolic(self.f_sym, self.g_sym, self.variables)
         print("Matriz Jacobiana del Sistema:")
-        pprint(self.jacobian_matrix)
+        sp.pprint(self.jacobian_matrix)
         print()
 
     def find_equilibria(self):
@@ -56,18 +59,18 @@ class DynamicSystem:
 
     def compute_nullclines(self):
         nullclines = []
-        f_nullcline = solve(self.f_sym, self.y)
+        f_nullcline = sp.solve(self.f_sym, self.y)
         if f_nullcline:
             nullclines.append({'variable': self.y, 'solutions': f_nullcline, 'label': "Nuclina x'"})
         else:
-            f_nullcline = solve(self.f_sym, self.x)
+            f_nullcline = sp.solve(self.f_sym, self.x)
             if f_nullcline:
                 nullclines.append({'variable': self.x, 'solutions': f_nullcline, 'label': "Nuclina x'"})
-        g_nullcline = solve(self.g_sym, self.y)
+        g_nullcline = sp.solve(self.g_sym, self.y)
         if g_nullcline:
             nullclines.append({'variable': self.y, 'solutions': g_nullcline, 'label': "Nuclina y'"})
         else:
-            g_nullcline = solve(self.g_sym, self.x)
+            g_nullcline = sp.solve(self.g_sym, self.x)
             if g_nullcline:
                 nullclines.append({'variable': self.x, 'solutions': g_nullcline, 'label': "Nuclina y'"})
         self.nullclines = nullclines
@@ -82,20 +85,20 @@ class DynamicSystem:
             eigenvals = result["eigenvals"]
             eigenvects = result["eigenvects"]
             print("\nPunto de equilibrio:")
-            pprint(eq)
+            sp.pprint(eq)
             print("Matriz Jacobiana en el equilibrio:")
-            pprint(J)
+            sp.pprint(J)
             print("Valores propios:")
             for ev in eigenvals:
-                ev_simplified = nsimplify(ev, rational=True)
+                ev_simplified = sp.nsimplify(ev, rational=True)
                 ev_str = str(ev_simplified).replace('I', 'i')
                 print(f"λ = {ev_str}")
             print("Vectores propios:")
             for ev, mult, vects in eigenvects:
-                ev_simplified = nsimplify(ev, rational=True)
+                ev_simplified = sp.nsimplify(ev, rational=True)
                 ev_str = str(ev_simplified).replace('I', 'i')
                 for vect in vects:
-                    vect_simplified = vect.applyfunc(lambda x: nsimplify(x, rational=True))
+                    vect_simplified = vect.applyfunc(lambda x: sp.nsimplify(x, rational=True))
                     vect_components = [str(comp).replace('I', 'i') for comp in vect_simplified]
                     vect_str = f"({', '.join(vect_components)})"
                     print(f"Vector propio asociado a λ = {ev_str}:\n{vect_str}")
@@ -133,23 +136,23 @@ class DynamicSystem:
                 return "Otro tipo de equilibrio"
 
     def compute_general_solution(self):
-        A = Matrix([
+        A = sp.Matrix([
             [self.f_sym.coeff(var) for var in self.variables],
             [self.g_sym.coeff(var) for var in self.variables]
         ])
         eigenvects = A.eigenvects()
-        c = symbols('c1:%d' % (len(eigenvects) * A.shape[0] + 1))
-        t = symbols('t')
+        c = sp.symbols('c1:%d' % (len(eigenvects) * A.shape[0] + 1))
+        t = sp.symbols('t')
         sol_x = 0
         sol_y = 0
         idx = 0
         for ev, mult, vects in eigenvects:
             for vect in vects:
-                term = c[idx] * exp(ev * t) * vect
+                term = c[idx] * sp.exp(ev * t) * vect
                 sol_x += term[0]
                 sol_y += term[1]
                 idx += 1
-        self.general_solution = (simplify(sol_x), simplify(sol_y))
+        self.general_solution = (sp.simplify(sol_x), sp.simplify(sol_y))
 
     def display_general_solution(self):
         print("\nSolución general del sistema:")
@@ -158,8 +161,8 @@ class DynamicSystem:
 
     def lambdify_functions(self):
         vars = (self.x, self.y) + tuple(self.parameters)
-        self.f_num = lambdify(vars, self.f_sym, modules=['numpy', {'I': 0}])
-        self.g_num = lambdify(vars, self.g_sym, modules=['numpy', {'I': 0}])
+        self.f_num = cached_lambdify(vars, self.f_sym, modules=['numpy', {'I': 0}])
+        self.g_num = cached_lambdify(vars, self.g_sym, modules=['numpy', {'I': 0}])
 
     def vectorize_functions(self):
         f_vectorized = np.vectorize(self.f_num)
@@ -1,25 +1,28 @@
-from sympy import symbols, solve, simplify, nsimplify, Expr
 import numpy as np  # Importar numpy
-from jacobian import compute_jacobian_at_equilibrium  # Importar la función necesaria
+from common.lazy_imports import lazy_import
+from dynamic_systems.jacobian import compute_jacobian_at_equilibrium  # Importar la función necesaria
+
+sp = lazy_import("sympy")
+
 
 def find_equilibria_symbolic(f_sym, g_sym, parameters):
-    x, y = symbols('x y')
+    x, y = sp.symbols('x y')
     variables = (x, y)
-    f_sym = simplify(f_sym)
-    g_sym = simplify(g_sym)
-    solutions = solve([f_sym, g_sym], variables, dict=True, rational=True)
+    f_sym = sp.simplify(f_sym)
+    g_sym = sp.simplify(g_sym)
+    solutions = sp.solve([f_sym, g_sym], variables, dict=True, rational=True)
     equilibria = []
     if solutions:
         for sol in solutions:
             eq_x = sol.get(x, x)
             eq_y = sol.get(y, y)
-            equilibria.append((simplify(eq_x), simplify(eq_y)))
+            equilibria.append((sp.simplify(eq_x), sp.simplify(eq_y)))
     return equilibria
 
 def analyze_equilibria(equilibria, f_sym, g_sym, parameters):
     results = []
     for eq in equilibria:
-        if not isinstance(eq[0], Expr) or not isinstance(eq[1], Expr):
+        if not isinstance(eq[0], sp.Expr) or not isinstance(eq[1], sp.Expr):
             print(f"\nEl equilibrio {eq} no es una expresión simbólica válida y se omitirá.")
             continue
         if eq[0].free_symbols or eq[1].free_symbols:
@@ -1,13 +1,22 @@
-import sympy as sp
-from sympy import Matrix, simplify
+from common.lazy_imports import lazy_import
+
+sp = lazy_import("sympy")
+
 
 def compute_jacobian_symbolic(f_sym, g_sym, variables):
-    jacobian_matrix = Matrix([
-        [simplify(f_sym.diff(var)) for var in variables],
-        [simplify(g_sym.diff(var)) for var in variables]
+    return compute_jacobian_matrix([f_sym, g_sym], variables)
+
+
+def compute_jacobian_matrix(functions, variables, simplify=True):
+    # Jacobiana de n funciones respecto de m variables (fila i: derivadas de la función i)
+    derivative = sp.simplify if simplify else (lambda expr: expr)
+    jacobian_matrix = sp.Matrix([
+        [derivative(sp.sympify(function).diff(var)) for var in variables]
+        for function in functions
     ])
     return jacobian_matrix
 
+
 def compute_jacobian_at_equilibrium(f_sym, g_sym, eq):
     jacobian_matrix = compute_jacobian_symbolic(f_sym, g_sym, (sp.Symbol('x'), sp.Symbol('y')))
     J_at_eq = jacobian_matrix.subs({sp.Symbol('x'): eq[0], sp.Symbol('y'): eq[1]})
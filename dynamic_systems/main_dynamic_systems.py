@@ -1,5 +1,8 @@
-import sympy as sp
-from dynamic_system import DynamicSystem
+from common.lazy_imports import lazy_import
+from dynamic_systems.dynamic_system import DynamicSystem
+
+sp = lazy_import("sympy")
+
 
 def main():
     x, y, a = sp.symbols('x y a')
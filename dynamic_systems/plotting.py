@@ -1,7 +1,10 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import sympy as sp
-from sympy import nsimplify
+from common.lambdify_cache import cached_lambdify
+from common.lazy_imports import lazy_import
+
+plt = lazy_import("matplotlib.pyplot")
+sp = lazy_import("sympy")
+
 
 def display_nullclines(nullclines):
     for nullcline in nullclines:
@@ -62,7 +65,7 @@ def plot_phase_portrait(f_vectorized, g_vectorized, equilibria, parameters, x_ra
                         continue
 
                     if variable == sp.Symbol('y'):
-                        y_nullcline = sp.lambdify(sp.Symbol('x'), expr, modules='numpy')
+                        y_nullcline = cached_lambdify(sp.Symbol('x'), expr, modules='numpy')
                         y_plot = y_nullcline(x_vals_plot)
                         # Verificar si y_plot tiene componentes complejas
                         if np.iscomplexobj(y_plot):
@@ -78,7 +81,7 @@ def plot_phase_portrait(f_vectorized, g_vectorized, equilibria, parameters, x_ra
                         else:
                             plt.plot(x_vals_plot, y_plot, '--')
                     else:
-                        x_nullcline = sp.lambdify(sp.Symbol('y'), expr, modules='numpy')
+                        x_nullcline = cached_lambdify(sp.Symbol('y'), expr, modules='numpy')
                         x_plot = x_nullcline(y_vals_plot)
                         # Verificar si x_plot tiene componentes complejas
                         if np.iscomplexobj(x_plot):
@@ -120,7 +123,7 @@ def plot_phase_portrait(f_vectorized, g_vectorized, equilibria, parameters, x_ra
                     eigenvects = result["eigenvects"]
                     for ev, mult, vects in eigenvects:
                         for vect in vects:
-                            vect_simplified = vect.applyfunc(lambda x: nsimplify(x, rational=True))
+                            vect_simplified = vect.applyfunc(lambda x: sp.nsimplify(x, rational=True))
                             vect_numeric = np.array([float(comp.evalf()) for comp in vect_simplified])
                             eigvec = vect_numeric / np.linalg.norm(vect_numeric)
                             scale = (x_range[1] - x_range[0]) / 2
@@ -1,6 +1,8 @@
 import numpy as np
-from scipy.integrate import odeint
-import matplotlib.pyplot as plt
+from common.lazy_imports import lazy_callable, lazy_import
+
+plt = lazy_import("matplotlib.pyplot")
+odeint = lazy_callable("scipy.integrate", "odeint")
 
 # Parámetros del modelo
 r1 = 0.1  # Tasa de crecimiento de los conejos
@@ -19,20 +21,25 @@ def non_linear_lotka_volterra(N, t, r1, r2, K1, K2, alpha12, alpha21):
     return [dN1_dt, dN2_dt]
 
 
-# Condiciones iniciales
-N0 = [50, 30]  # Poblaciones iniciales de conejos y ovejas
+def main():
+    # Condiciones iniciales
+    N0 = [50, 30]  # Poblaciones iniciales de conejos y ovejas
+
+    # Intervalo de tiempo
+    t = np.linspace(0, 200, 1000)
+
+    # Resolver el sistema de ecuaciones diferenciales
+    sol = odeint(non_linear_lotka_volterra, N0, t, args=(r1, r2, K1, K2, alpha12, alpha21))
 
-# Intervalo de tiempo
-t = np.linspace(0, 200, 1000)
+    # Graficar los resultados
+    plt.plot(t, sol[:, 0], label='Conejos')
+    plt.plot(t, sol[:, 1], label='Ovejas')
+    plt.xlabel('Tiempo')
+    plt.ylabel('Población')
+    plt.legend()
+    plt.title('Competencia No Lineal entre Conejos y Ovejas')
+    plt.show()
 
-# Resolver el sistema de ecuaciones diferenciales
-sol = odeint(non_linear_lotka_volterra, N0, t, args=(r1, r2, K1, K2, alpha12, alpha21))
 
-# Graficar los resultados
-plt.plot(t, sol[:, 0], label='Conejos')
-plt.plot(t, sol[:, 1], label='Ovejas')
-plt.xlabel('Tiempo')
-plt.ylabel('Población')
-plt.legend()
-plt.title('Competencia No Lineal entre Conejos y Ovejas')
-plt.show()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Métodos de integración numérica."""
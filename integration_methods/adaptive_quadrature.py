@@ -0,0 +1,173 @@
+import heapq
+import itertools
+import math
+
+import numpy as np
+from common.dual import is_numeric_callable
+from common.instrumentation import profiled
+from common.lambdify_cache import cached_lambdify
+from common.lazy_imports import lazy_import
+from integration_methods.quadrature_result import QuadratureResult
+
+sp = lazy_import("sympy")
+
+# Gauss-Kronrod 7/15 en [-1, 1]: los 7 nodos de Gauss son los de índice impar de los 15 de Kronrod
+KRONROD_NODES = np.array([
+    0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245, 0.0,
+])
+KRONROD_WEIGHTS = np.array([
+    0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649, 0.209482141084727828012999174891714,
+])
+GAUSS_WEIGHTS = np.array([
+    0.0, 0.129484966168869693270611432679082, 0.0, 0.279705391489276667901467771423780,
+    0.0, 0.381830050505118944950369775488975, 0.0, 0.417959183673469387755102040816327,
+])
+# Los 15 nodos simétricos: -x_0, ..., -x_6, 0, x_6, ..., x_0
+GK_NODES = np.concatenate([-KRONROD_NODES[:-1], KRONROD_NODES[::-1]])
+GK_WEIGHTS = np.concatenate([KRONROD_WEIGHTS[:-1], KRONROD_WEIGHTS[::-1]])
+GK_GAUSS_WEIGHTS = np.concatenate([GAUSS_WEIGHTS[:-1], GAUSS_WEIGHTS[::-1]])
+
+# Puntos nuevos de un panel de Simpson al dividirlo, en fracciones del panel
+SIMPSON_NEW_POINTS = np.array([1, 3, 5, 7]) / 8
+
+
+@profiled
+def adaptive_quadrature(x, f_x, start, end, method="gauss_kronrod", abs_tolerance=1e-10, rel_tolerance=1e-10,
+                        max_intervals=2000, precision=8):
+    """
+    Integración adaptativa global con control de error.
+
+    - "gauss_kronrod": regla de Gauss-Kronrod 7/15 en cada subintervalo; el error
+      es |K15 - G7|, y G7 reutiliza 7 de los 15 valores de K15. No evalúa f en
+      los extremos, así sirve con singularidades integrables en ellos.
+    - "simpson": Simpson con cinco puntos por subintervalo y error |S2 - S1| / 15;
+      al dividir, cada mitad reutiliza tres valores del padre y solo evalúa dos
+      puntos nuevos.
+
+    Los subintervalos se guardan en una cola de prioridad con el de mayor error
+    arriba; se divide ese hasta que el error total sea menor que
+    max(abs_tolerance, rel_tolerance * |integral|) o se llegue a max_intervals
+    (entonces converged es False). f_x también puede ser una función de Python
+    escrita con NumPy.
+
+    Retorna un QuadratureResult.
+    """
+    if method not in QUADRATURE_RULES:
+        raise ValueError(f"Método desconocido: {method}. Opciones: {', '.join(QUADRATURE_RULES)}")
+    f_num = f_x if is_numeric_callable(f_x) else cached_lambdify(x, f_x, 'numpy')
+    initial_panel, split_panel = QUADRATURE_RULES[method]
+
+    panel, evaluations = initial_panel(f_num, float(start), float(end))
+    counter = itertools.count()
+    heap = [(-panel[3], next(counter), panel)]
+    value, error = panel[2], panel[3]
+    converged = True
+
+    while error > max(abs_tolerance, rel_tolerance * abs(value)):
+        if len(heap) >= max_intervals:
+            converged = False
+            break
+        _, _, worst = heap[0]
+        a, b = worst[0], worst[1]
+        if not a < (a + b) / 2 < b and not b < (a + b) / 2 < a:
+            # El subintervalo ya no se puede dividir en punto flotante
+            converged = False
+            break
+        heapq.heappop(heap)
+        children, cost = split_panel(f_num, worst)
+        evaluations += cost
+        value -= worst[2]
+        error -= worst[3]
+        for child in children:
+            heapq.heappush(heap, (-child[3], next(counter), child))
+            value += child[2]
+            error += child[3]
+
+    # Las sumas corridas acumulan redondeo: el resultado final se suma de nuevo
+    panels = sorted(panel for _, _, panel in heap)
+    value = math.fsum(panel[2] for panel in panels)
+    error = math.fsum(panel[3] for panel in panels)
+    return QuadratureResult(
+        method, value, error, evaluations, converged,
+        panels=np.array([panel[:4] for panel in panels]), function=f_num, precision=precision
+    )
+
+
+def evaluate(f_num, nodes):
+    values = np.broadcast_to(f_num(nodes), np.shape(nodes))
+    if not np.all(np.isfinite(values)):
+        bad = np.asarray(nodes)[~np.isfinite(values)].ravel()[0]
+        raise ValueError(f"f no es finita en x = {bad}. Con una singularidad en un extremo use 'gauss_kronrod'.")
+    return values
+
+
+def simpson_panel(a, b, values):
+    # values: f en a, a + h/4, a + h/2, a + 3h/4 y b
+    coarse = (b - a) / 6 * (values[0] + 4 * values[2] + values[4])
+    fine = (b - a) / 12 * (values[0] + 4 * values[1] + 2 * values[2] + 4 * values[3] + values[4])
+    # Extrapolación de Richardson: el error de Simpson es O(h^4)
+    return a, b, fine + (fine - coarse) / 15, abs(fine - coarse) / 15, values
+
+
+def simpson_initial(f_num, a, b):
+    return simpson_panel(a, b, evaluate(f_num, a + (b - a) * np.linspace(0, 1, 5))), 5
+
+
+def simpson_split(f_num, panel):
+    a, b, _, _, values = panel
+    new = evaluate(f_num, a + (b - a) * SIMPSON_NEW_POINTS)
+    middle = (a + b) / 2
+    left = simpson_panel(a, middle, np.array([values[0], new[0], values[1], new[1], values[2]]))
+    right = simpson_panel(middle, b, np.array([values[2], new[2], values[3], new[3], values[4]]))
+    return (left, right), 4
+
+
+def kronrod_panels(f_num, edges):
+    # Evalúa todos los subintervalos de edges con una sola llamada a f
+    edges = np.asarray(edges, dtype=float)
+    centers = (edges[:, 0] + edges[:, 1]) / 2
+    half_widths = (edges[:, 1] - edges[:, 0]) / 2
+    values = evaluate(f_num, centers[:, None] + half_widths[:, None] * GK_NODES)
+    kronrod = half_widths * (values @ GK_WEIGHTS)
+    gauss = half_widths * (values @ GK_GAUSS_WEIGHTS)
+    return tuple(
+        (a, b, k, abs(k - g), None)
+        for (a, b), k, g in zip(edges.tolist(), kronrod.tolist(), gauss.tolist())
+    )
+
+
+def kronrod_initial(f_num, a, b):
+    return kronrod_panels(f_num, [[a, b]])[0], len(GK_NODES)
+
+
+def kronrod_split(f_num, panel):
+    a, b = panel[0], panel[1]
+    middle = (a + b) / 2
+    return kronrod_panels(f_num, [[a, middle], [middle, b]]), 2 * len(GK_NODES)
+
+
+QUADRATURE_RULES = {
+    "gauss_kronrod": (kronrod_initial, kronrod_split),
+    "simpson": (simpson_initial, simpson_split),
+}
+
+
+def main():
+    x = sp.symbols('x')
+    f_x = sp.sqrt(x) * sp.exp(-x)
+    for method in QUADRATURE_RULES:
+        adaptive_quadrature(x, f_x, 0, 4, method).print_report()
+    # log(x + 1) / x no está definida en x = 0, pero Gauss-Kronrod no evalúa los extremos
+    result = adaptive_quadrature(x, sp.log(x + 1) / x, 0, 4)
+    result.print_report()
+    result.plot()
+
+
+if __name__ == "__main__":
+    main()
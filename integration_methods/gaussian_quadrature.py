@@ -0,0 +1,221 @@
+from functools import lru_cache
+
+import numpy as np
+from common.dual import is_numeric_callable
+from common.instrumentation import profiled
+from common.lambdify_cache import cached_lambdify
+from common.lazy_imports import lazy_import
+from integration_methods.quadrature_result import QuadratureResult
+
+linalg = lazy_import("scipy.linalg")
+sp = lazy_import("sympy")
+
+RULE_CACHE_SIZE = 64
+
+
+def golub_welsch(diagonal, off_diagonal, total_weight):
+    # Nodos: autovalores de la matriz de Jacobi. Los pesos salen de la función de
+    # Christoffel w_i = total_weight / Σ_k p_k(x_i)², con p_k ortonormales evaluados por la
+    # recurrencia de tres términos: a diferencia de v_0² del autovector, conservan
+    # precisión relativa aunque sean diminutos (Laguerre y Hermite los multiplican por e^x)
+    nodes = linalg.eigh_tridiagonal(diagonal, off_diagonal, eigvals_only=True)
+    log_weights = np.log(total_weight) - log_christoffel_sum(nodes, diagonal, off_diagonal)
+    return read_only(nodes), read_only(np.exp(log_weights)), read_only(log_weights)
+
+
+def log_christoffel_sum(nodes, diagonal, off_diagonal):
+    p_previous = np.zeros_like(nodes)
+    p_current = np.ones_like(nodes)
+    total = np.ones_like(nodes)
+    log_scale = np.zeros_like(nodes)
+    for k in range(len(off_diagonal)):
+        coupling = off_diagonal[k - 1] if k else 0.0
+        p_next = ((nodes - diagonal[k]) * p_current - coupling * p_previous) / off_diagonal[k]
+        p_previous, p_current = p_current, p_next
+        total += p_current * p_current
+        # Se reescala para no desbordar con nodos grandes
+        large = total > 1e100
+        if large.any():
+            factor = np.where(large, total, 1.0)
+            p_previous /= np.sqrt(factor)
+            p_current /= np.sqrt(factor)
+            total /= factor
+            log_scale += np.log(factor)
+    return np.log(total) + log_scale
+
+
+@lru_cache(maxsize=RULE_CACHE_SIZE)
+def gauss_legendre_rule(order):
+    """
+    Nodos y pesos de Gauss-Legendre de order puntos en [-1, 1] (Golub-Welsch).
+
+    Los nodos son los autovalores de la matriz de Jacobi simétrica tridiagonal de
+    los polinomios de Legendre y los pesos 2 v_0², con v_0 la primera componente
+    de cada autovector. Los arreglos se guardan en caché y son de solo lectura.
+    """
+    check_order(order)
+    k = np.arange(1, order)
+    nodes, vectors = linalg.eigh_tridiagonal(np.zeros(order), k / np.sqrt(4.0 * k * k - 1))
+    # En [-1, 1] los pesos no son diminutos y 2 v_0² del autovector es más preciso
+    return read_only(nodes), read_only(2 * vectors[0] ** 2)
+
+
+@lru_cache(maxsize=RULE_CACHE_SIZE)
+def gauss_laguerre_rule(order):
+    """
+    Nodos, pesos y logaritmos de los pesos de Gauss-Laguerre:
+    ∫_0^∞ e^(-x) g(x) dx ≈ Σ w_i g(x_i).
+    """
+    check_order(order)
+    return golub_welsch(2.0 * np.arange(order) + 1, np.arange(1.0, order), 1.0)
+
+
+@lru_cache(maxsize=RULE_CACHE_SIZE)
+def gauss_hermite_rule(order):
+    """
+    Nodos, pesos y logaritmos de los pesos de Gauss-Hermite:
+    ∫ e^(-x²) g(x) dx ≈ Σ w_i g(x_i) en toda la recta.
+    """
+    check_order(order)
+    return golub_welsch(np.zeros(order), np.sqrt(np.arange(1.0, order) / 2), np.sqrt(np.pi))
+
+
+def check_order(order):
+    if order < 1:
+        raise ValueError("El orden de la regla debe ser al menos 1.")
+
+
+@lru_cache(maxsize=RULE_CACHE_SIZE)
+def clenshaw_curtis_rule(order):
+    """
+    Nodos cos(k π / order), k = 0, ..., order, y pesos de Clenshaw-Curtis en
+    [-1, 1], calculados con una FFT de tamaño order (algoritmo de Waldvogel).
+    """
+    check_order(order)
+    if order == 1:
+        return read_only(np.array([1.0, -1.0])), read_only(np.array([1.0, 1.0]))
+    odd = np.arange(1, order, 2)
+    count_odd = len(odd)
+    rest = order - count_odd
+    v0 = np.concatenate([2 / odd / (odd - 2), [1 / odd[-1]], np.zeros(rest)])
+    v2 = -v0[:-1] - v0[:0:-1]
+    g0 = -np.ones(order)
+    g0[count_odd] += order
+    g0[rest] += order
+    g = g0 / (order ** 2 - 1 + order % 2)
+    weights = np.fft.ifft(v2 + g).real
+    weights = np.append(weights, weights[0])
+    nodes = np.cos(np.arange(order + 1) * np.pi / order)
+    return read_only(nodes), read_only(weights)
+
+
+def read_only(array):
+    array.flags.writeable = False
+    return array
+
+
+def composite_nodes(rule_nodes, start, end, panels):
+    # Nodos de la regla llevados a cada uno de los paneles iguales de [start, end]
+    edges = np.linspace(start, end, panels + 1)
+    centers = (edges[:-1] + edges[1:]) / 2
+    half_width = (end - start) / (2 * panels)
+    return centers[:, None] + half_width * rule_nodes, half_width
+
+
+@profiled
+def gaussian_quadrature(x, f_x, start, end, method="gauss_legendre", order=20, panels=1, precision=8):
+    """
+    Cuadratura de Gauss-Legendre o Clenshaw-Curtis de order puntos, compuesta
+    sobre panels subintervalos iguales.
+
+    f se evalúa una sola vez sobre los nodos de todos los paneles. Los nodos y
+    pesos de cada orden se calculan una vez y quedan en una caché LRU.
+    - "gauss_legendre": exacta para polinomios de grado 2 order - 1; no evalúa f
+      en los extremos. No tiene estimación de error gratuita (error es nan).
+    - "clenshaw_curtis": order + 1 nodos de Chebyshev, incluidos los extremos.
+      Con order par, la regla de order / 2 usa uno de cada dos nodos, así que el
+      error se estima con |Q(order) - Q(order / 2)| sin evaluaciones extra.
+
+    f_x también puede ser una función de Python escrita con NumPy. Retorna un
+    QuadratureResult.
+    """
+    if method not in ("gauss_legendre", "clenshaw_curtis"):
+        raise ValueError(f"Método desconocido: {method}. Opciones: gauss_legendre, clenshaw_curtis")
+    if panels < 1:
+        raise ValueError("Se necesita al menos un panel.")
+    f_num = f_x if is_numeric_callable(f_x) else cached_lambdify(x, f_x, 'numpy')
+    start, end = float(start), float(end)
+    rule = gauss_legendre_rule if method == "gauss_legendre" else clenshaw_curtis_rule
+    rule_nodes, weights = rule(order)
+
+    nodes, half_width = composite_nodes(rule_nodes, start, end, panels)
+    values = np.broadcast_to(f_num(nodes), nodes.shape)
+    value = half_width * np.sum(values @ weights)
+
+    error = np.nan
+    if method == "clenshaw_curtis" and order % 2 == 0:
+        coarse = half_width * np.sum(values[:, ::2] @ clenshaw_curtis_rule(order // 2)[1])
+        error = abs(value - coarse)
+
+    edges = np.linspace(start, end, panels + 1)
+    panel_rows = np.column_stack([edges[:-1], edges[1:], half_width * (values @ weights), np.full(panels, np.nan)])
+    return QuadratureResult(
+        method, float(value), float(error), nodes.size, panels=panel_rows, function=f_num, precision=precision
+    )
+
+
+@profiled
+def gauss_laguerre(x, f_x, start, end, order=40, precision=8):
+    """
+    Integral sobre [start, ∞) o (-∞, end] con Gauss-Laguerre de order puntos:
+    ∫_a^∞ f(x) dx = ∫_0^∞ e^(-t) [e^t f(a + t)] dt. Es muy precisa cuando f decae
+    como e^(-x) por un polinomio. Sin estimación de error (error es nan).
+    """
+    start, end = float(start), float(end)
+    if np.isfinite(start) == np.isfinite(end):
+        raise ValueError("Gauss-Laguerre necesita exactamente un límite infinito.")
+    f_num = f_x if is_numeric_callable(f_x) else cached_lambdify(x, f_x, 'numpy')
+    sign = 1.0
+    if start > end:
+        start, end, sign = end, start, -1.0
+    nodes, _, log_weights = gauss_laguerre_rule(order)
+    points = start + nodes if np.isfinite(start) else end - nodes
+    result = weighted_rule("gauss_laguerre", f_num, points, log_weights + nodes, precision)
+    result.value *= sign
+    return result
+
+
+@profiled
+def gauss_hermite(x, f_x, order=40, precision=8):
+    """
+    Integral sobre toda la recta con Gauss-Hermite de order puntos:
+    ∫ f(x) dx = ∫ e^(-x²) [e^(x²) f(x)] dx. Es muy precisa cuando f decae como
+    e^(-x²) por un polinomio. Sin estimación de error (error es nan).
+    """
+    f_num = f_x if is_numeric_callable(f_x) else cached_lambdify(x, f_x, 'numpy')
+    nodes, _, log_weights = gauss_hermite_rule(order)
+    return weighted_rule("gauss_hermite", f_num, nodes, log_weights + nodes ** 2, precision)
+
+
+def weighted_rule(method, f_num, points, log_scaled_weights, precision):
+    # w_i e^(x_i) (o e^(x_i²)) se forma como exp(log w_i + exponente) para no desbordar
+    scaled = np.exp(log_scaled_weights)
+    values = np.broadcast_to(f_num(points), points.shape)
+    return QuadratureResult(method, float(scaled @ values), np.nan, points.size, function=f_num,
+                            precision=precision)
+
+
+def main():
+    x = sp.symbols('x')
+    f_x = sp.log(x + 1) / x
+    # Simpson necesita los extremos; Gauss-Legendre no evalúa x = 0, donde f_x no está definida
+    for order in (4, 8, 16):
+        gaussian_quadrature(x, f_x, 0, 4, "gauss_legendre", order).print_report()
+    result = gaussian_quadrature(x, sp.exp(-x ** 2), 0, 2, "clenshaw_curtis", 32)
+    result.print_report()
+    result = gaussian_quadrature(x, sp.sin(10 * x) ** 2, 0, 10, "gauss_legendre", 10, panels=50)
+    result.print_report()
+
+
+if __name__ == "__main__":
+    main()
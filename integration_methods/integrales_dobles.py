@@ -1,7 +1,9 @@
-import sympy as sp
 import numpy as np
-import matplotlib.pyplot as plt
-from sympy import symbols, integrate, latex, simplify, expand
+from common.lazy_imports import lazy_import
+
+plt = lazy_import("matplotlib.pyplot")
+sp = lazy_import("sympy")
+
 
 def resolver_integral_doble_paso_a_paso(funcion_str, variable1, variable2, 
                                        lim_inf1, lim_sup1, lim_inf2, lim_sup2, 
@@ -22,7 +24,7 @@ def resolver_integral_doble_paso_a_paso(funcion_str, variable1, variable2,
     """
     
     # Definir variables simbólicas
-    x, y = symbols(variable1 + ' ' + variable2)
+    x, y = sp.symbols(variable1 + ' ' + variable2)
     
     # Convertir string a expresión simbólica
     funcion = sp.sympify(funcion_str)
@@ -42,7 +44,7 @@ def resolver_integral_doble_paso_a_paso(funcion_str, variable1, variable2,
         print("-" * 40)
         
         # Primera integración (respecto a x)
-        integral_x = integrate(funcion, x)
+        integral_x = sp.integrate(funcion, x)
         print(f"∫ {funcion} dx = {integral_x}")
         
         # Evaluar en los límites de x
@@ -52,7 +54,7 @@ def resolver_integral_doble_paso_a_paso(funcion_str, variable1, variable2,
         print(f"= {integral_x_evaluada}")
         
         # Simplificar si es posible
-        integral_x_simplificada = simplify(integral_x_evaluada)
+        integral_x_simplificada = sp.simplify(integral_x_evaluada)
         if integral_x_simplificada != integral_x_evaluada:
             print(f"Simplificando: {integral_x_simplificada}")
         
@@ -68,7 +70,7 @@ def resolver_integral_doble_paso_a_paso(funcion_str, variable1, variable2,
         print("-" * 40)
         
         # Segunda integración (respecto a y)
-        integral_final = integrate(integral_x_simplificada, y)
+        integral_final = sp.integrate(integral_x_simplificada, y)
         print(f"∫ {integral_x_simplificada} dy = {integral_final}")
         
         # Evaluar en los límites de y
@@ -78,7 +80,7 @@ def resolver_integral_doble_paso_a_paso(funcion_str, variable1, variable2,
         print(f"= {resultado}")
         
         # Simplificar resultado final
-        resultado_final = simplify(resultado)
+        resultado_final = sp.simplify(resultado)
         if resultado_final != resultado:
             print(f"Simplificando resultado final: {resultado_final}")
         
@@ -94,7 +96,7 @@ def resolver_integral_doble_paso_a_paso(funcion_str, variable1, variable2,
         print("-" * 40)
         
         # Primera integración (respecto a y)
-        integral_y = integrate(funcion, y)
+        integral_y = sp.integrate(funcion, y)
         print(f"∫ {funcion} dy = {integral_y}")
         
         # Evaluar en los límites de y
@@ -104,7 +106,7 @@ def resolver_integral_doble_paso_a_paso(funcion_str, variable1, variable2,
         print(f"= {integral_y_evaluada}")
         
         # Simplificar si es posible
-        integral_y_simplificada = simplify(integral_y_evaluada)
+        integral_y_simplificada = sp.simplify(integral_y_evaluada)
         if integral_y_simplificada != integral_y_evaluada:
             print(f"Simplificando: {integral_y_simplificada}")
         
@@ -120,7 +122,7 @@ def resolver_integral_doble_paso_a_paso(funcion_str, variable1, variable2,
         print("-" * 40)
         
         # Segunda integración (respecto a x)
-        integral_final = integrate(integral_y_simplificada, x)
+        integral_final = sp.integrate(integral_y_simplificada, x)
         print(f"∫ {integral_y_simplificada} dx = {integral_final}")
         
         # Evaluar en los límites de x
@@ -130,7 +132,7 @@ def resolver_integral_doble_paso_a_paso(funcion_str, variable1, variable2,
         print(f"= {resultado}")
         
         # Simplificar resultado final
-        resultado_final = simplify(resultado)
+        resultado_final = sp.simplify(resultado)
         if resultado_final != resultado:
             print(f"Simplificando resultado final: {resultado_final}")
         
@@ -181,7 +183,7 @@ def resolver_integral_doble_rectangular(funcion_str, variable1, variable2,
     print(f"Resultado con orden XY: {resultado1}")
     print(f"Resultado con orden YX: {resultado2}")
     
-    if simplify(resultado1 - resultado2) == 0:
+    if sp.simplify(resultado1 - resultado2) == 0:
         print("✓ Los resultados coinciden (verificación exitosa)")
     else:
         print("⚠ Los resultados no coinciden - revisar límites o función")
@@ -218,13 +220,19 @@ def graficar_region_integracion(lim_inf1, lim_sup1, lim_inf2, lim_sup2, titulo="
     plt.show()
 
 
-resultado, pasos = resolver_integral_doble_paso_a_paso(
-    "exp(2*x-y)",           # función como string (ej: "x*y", "x**2 + y**2", "exp(x+y)")
-    "x", "y",        # variables de integración
-    0, 1,            # límites inferior y superior de la primera variable
-    1, 2,            # límites inferior y superior de la segunda variable
-    "yx"             # orden: "xy" (primero x, luego y) o "yx" (primero y, luego x)
-)
+def main():
+    resultado, pasos = resolver_integral_doble_paso_a_paso(
+        "exp(2*x-y)",           # función como string (ej: "x*y", "x**2 + y**2", "exp(x+y)")
+        "x", "y",        # variables de integración
+        0, 1,            # límites inferior y superior de la primera variable
+        1, 2,            # límites inferior y superior de la segunda variable
+        "yx"             # orden: "xy" (primero x, luego y) o "yx" (primero y, luego x)
+    )
+
+
+if __name__ == "__main__":
+    main()
+
 # CÓMO USAR ESTE CÓDIGO:
 # =====================
 # 
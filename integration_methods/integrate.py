@@ -0,0 +1,85 @@
+import numpy as np
+from common.dual import is_numeric_callable
+from common.instrumentation import profiled
+from common.lambdify_cache import cached_lambdify
+from common.lazy_imports import lazy_import
+from integration_methods.adaptive_quadrature import adaptive_quadrature
+from integration_methods.gaussian_quadrature import gauss_hermite, gauss_laguerre, gaussian_quadrature
+from integration_methods.tanh_sinh import finite_interval, tanh_sinh
+from integration_methods.trapezoid_method import romberg
+
+sp = lazy_import("sympy")
+
+INTEGRATION_METHODS = (
+    "auto", "tanh_sinh", "gauss_kronrod", "adaptive_simpson", "romberg", "gauss_legendre", "clenshaw_curtis",
+    "gauss_laguerre", "gauss_hermite",
+)
+# Estos métodos evalúan f en los extremos, así que no admiten límites infinitos
+ENDPOINT_METHODS = ("adaptive_simpson", "romberg", "clenshaw_curtis")
+
+
+@profiled
+def integrate(x, f_x, start, end, method="auto", tolerance=1e-10, order=40, precision=8):
+    """
+    Punto de entrada común para integrar f_x entre start y end.
+
+    start y end pueden ser infinitos (float('inf') o sp.oo). method elige el
+    integrador; "auto" usa tanh-sinh, que tolera singularidades en los extremos
+    y, con el cambio de variable de finite_interval, límites infinitos.
+    - "tanh_sinh", "gauss_kronrod", "adaptive_simpson" y "romberg" se detienen con
+      tolerance (absoluta y relativa).
+    - "gauss_legendre" y "clenshaw_curtis" usan una regla fija de order puntos.
+    - "gauss_laguerre" (un límite infinito) y "gauss_hermite" (ambos infinitos)
+      usan order puntos y convienen cuando f decae como e^(-x) o e^(-x²).
+    Con límites infinitos, gauss_kronrod y gauss_legendre integran el integrando
+    transformado a un intervalo finito.
+
+    Retorna un QuadratureResult.
+    """
+    if method not in INTEGRATION_METHODS:
+        raise ValueError(f"Método desconocido: {method}. Opciones: {', '.join(INTEGRATION_METHODS)}")
+    a, b = float(start), float(end)
+    infinite_limits = int(not np.isfinite(a)) + int(not np.isfinite(b))
+    if method == "auto":
+        method = "tanh_sinh"
+
+    if method == "tanh_sinh":
+        return tanh_sinh(x, f_x, a, b, tolerance, tolerance, precision=precision)
+    if method == "gauss_laguerre":
+        return gauss_laguerre(x, f_x, a, b, order, precision)
+    if method == "gauss_hermite":
+        if infinite_limits != 2:
+            raise ValueError("Gauss-Hermite integra sobre toda la recta: ambos límites deben ser infinitos.")
+        sign = 1.0 if a < b else -1.0
+        result = gauss_hermite(x, f_x, order, precision)
+        result.value *= sign
+        return result
+
+    if infinite_limits and method in ENDPOINT_METHODS:
+        raise ValueError(f"El método {method} evalúa f en los extremos y no admite límites infinitos.")
+    if infinite_limits:
+        f_num = f_x if is_numeric_callable(f_x) else cached_lambdify(x, f_x, 'numpy')
+        f_x, a, b = finite_interval(f_num, a, b)
+
+    if method == "gauss_kronrod":
+        return adaptive_quadrature(x, f_x, a, b, "gauss_kronrod", tolerance, tolerance, precision=precision)
+    if method == "adaptive_simpson":
+        return adaptive_quadrature(x, f_x, a, b, "simpson", tolerance, tolerance, precision=precision)
+    if method == "romberg":
+        return romberg(x, f_x, a, b, tolerance, tolerance, precision=precision)
+    return gaussian_quadrature(x, f_x, a, b, method, order, precision=precision)
+
+
+def main():
+    x = sp.symbols('x')
+    # simpson_area y trapezoidal_area evalúan log(x + 1) / x en x = 0 y dan nan
+    f_x = sp.log(x + 1) / x
+    for method in ("auto", "gauss_kronrod", "gauss_legendre"):
+        integrate(x, f_x, 0, 4, method).print_report()
+    integrate(x, x ** 2 * sp.exp(-x), 0, sp.oo, "gauss_laguerre").print_report()
+    integrate(x, sp.exp(-x ** 2) * sp.cos(x), -sp.oo, sp.oo, "gauss_hermite").print_report()
+    integrate(x, 1 / (1 + x ** 2), -sp.oo, sp.oo).print_report()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+import math
+
+import numpy as np
+
+# Sucesiones de Sobol con los números de dirección de Joe y Kuo (new-joe-kuo-6.21201):
+# (s, a, m_1, ..., m_s) para las dimensiones 2 en adelante; la primera es van der Corput
+JOE_KUO = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+    (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)),
+)
+MAX_SOBOL_DIMENSION = len(JOE_KUO) + 1
+# Bits de cada coordenada: admite hasta 2^BITS puntos
+BITS = 32
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53)
+SAMPLINGS = ("uniforme", "sobol", "halton")
+
+
+def direction_numbers(dimension):
+    # v[d, k] = m_k 2^(BITS - k); las coordenadas son XOR de estos enteros
+    v = np.zeros((dimension, BITS), dtype=np.uint64)
+    v[0] = 1 << np.arange(BITS - 1, -1, -1, dtype=np.uint64)
+    for d in range(1, dimension):
+        s, a, m = JOE_KUO[d - 1]
+        values = list(m)
+        for k in range(s, BITS):
+            new = values[k - s] ^ (values[k - s] << s)
+            for i in range(1, s):
+                if (a >> (s - 1 - i)) & 1:
+                    new ^= values[k - i] << i
+            values.append(new)
+        v[d] = [value << (BITS - 1 - k) for k, value in enumerate(values)]
+    return v
+
+
+def scramble_directions(v, rng):
+    # Scrambling matricial lineal: cada dimensión multiplica sus números de dirección
+    # (como vectores de bits, el más significativo primero) por una matriz triangular
+    # inferior aleatoria con unos en la diagonal, sobre GF(2)
+    dimension = v.shape[0]
+    bit_values = np.uint64(1) << np.arange(BITS - 1, -1, -1, dtype=np.uint64)
+    lower = np.tril(rng.integers(0, 2, size=(dimension, BITS, BITS), dtype=np.uint64), -1)
+    lower[:, np.arange(BITS), np.arange(BITS)] = 1
+    # Cada fila de la matriz como máscara de bits
+    masks = np.bitwise_or.reduce(lower * bit_values, axis=2)
+    scrambled = np.zeros_like(v)
+    for row in range(BITS):
+        parity = parity_bits(v & masks[:, row, None])
+        scrambled |= parity << np.uint64(BITS - 1 - row)
+    return scrambled
+
+
+def parity_bits(values):
+    # Paridad de la cantidad de unos de cada entero de 64 bits
+    values = values.copy()
+    for shift in (32, 16, 8, 4, 2, 1):
+        values ^= values >> np.uint64(shift)
+    return values & np.uint64(1)
+
+
+class SobolSequence:
+    """
+    Puntos de Sobol en [0, 1)^dimension, generados por bloques vectorizados.
+
+    Con scramble=True se aplica un scrambling matricial lineal y un desplazamiento
+    digital aleatorio: cada punto es uniforme y las réplicas con semillas distintas
+    son independientes, así su dispersión estima el error (QMC aleatorizado). Los
+    puntos se equilibran mejor en tamaños potencia de 2. seed=None toma la semilla
+    del generador global de NumPy, así np.random.seed también fija estos puntos.
+    """
+
+    def __init__(self, dimension, scramble=True, seed=None):
+        if not 1 <= dimension <= MAX_SOBOL_DIMENSION:
+            raise ValueError(f"Sobol admite dimensiones de 1 a {MAX_SOBOL_DIMENSION}.")
+        rng = np.random.default_rng(np.random.randint(2 ** 31) if seed is None else seed)
+        self.dimension = dimension
+        self.directions = direction_numbers(dimension)
+        self.shift = np.zeros(dimension, dtype=np.uint64)
+        if scramble:
+            self.directions = scramble_directions(self.directions, rng)
+            self.shift = rng.integers(0, 2 ** BITS, size=dimension, dtype=np.uint64)
+        # El punto de índice 0 es el desplazamiento; el siguiente a generar parte de él
+        self.last = self.shift.copy()
+        self.count = 0
+
+    def random(self, n):
+        """Los n puntos siguientes de la sucesión, en un arreglo (n, dimension)."""
+        if self.count + n > 2 ** BITS:
+            raise ValueError(f"Sobol con {BITS} bits admite a lo sumo 2^{BITS} puntos.")
+        if n == 0:
+            return np.empty((0, self.dimension))
+        # En orden de código Gray, el punto i sale del i - 1 con un XOR del número de
+        # dirección del bit más bajo de i: todo el bloque es un XOR acumulado
+        index = np.arange(max(self.count, 1), self.count + n, dtype=np.uint64)
+        lowest_bit = np.log2((index & (~index + np.uint64(1))).astype(float)).astype(np.intp)
+        steps = np.vstack([self.last, self.directions[:, lowest_bit].T])
+        points = np.bitwise_xor.accumulate(steps, axis=0)
+        if self.count:
+            points = points[1:]
+        self.last = points[-1]
+        self.count += n
+        return points / float(2 ** BITS)
+
+
+class HaltonSequence:
+    """
+    Puntos de Halton en [0, 1)^dimension: la coordenada d es el inverso radical
+    del índice en la base del d-ésimo primo. Con scramble=True cada dígito pasa
+    por una permutación aleatoria propia de su posición y base, lo que rompe las
+    correlaciones entre bases grandes y hace uniforme a cada punto.
+    """
+
+    def __init__(self, dimension, scramble=True, seed=None):
+        if not 1 <= dimension <= len(PRIMES):
+            raise ValueError(f"Halton admite dimensiones de 1 a {len(PRIMES)}.")
+        rng = np.random.default_rng(np.random.randint(2 ** 31) if seed is None else seed)
+        self.dimension = dimension
+        self.bases = PRIMES[:dimension]
+        # Dígitos suficientes para resolver 2^-BITS en cada base
+        self.digits = [math.ceil(BITS * math.log(2) / math.log(base)) for base in self.bases]
+        self.permutations = [
+            np.array([rng.permutation(base) if scramble else np.arange(base) for _ in range(digits)])
+            for base, digits in zip(self.bases, self.digits)
+        ]
+        self.count = 0
+
+    def random(self, n):
+        """Los n puntos siguientes de la sucesión, en un arreglo (n, dimension)."""
+        index = np.arange(self.count, self.count + n, dtype=np.int64)
+        points = np.empty((n, self.dimension))
+        for d, (base, digits, permutations) in enumerate(zip(self.bases, self.digits, self.permutations)):
+            remaining = index.copy()
+            value = np.zeros(n)
+            scale = 1.0
+            for position in range(digits):
+                scale /= base
+                value += permutations[position][remaining % base] * scale
+                remaining //= base
+            points[:, d] = value
+        self.count += n
+        return points
+
+
+SEQUENCES = {"sobol": SobolSequence, "halton": HaltonSequence}
+
+
+def uniform_points(sampling, n, dimension=1, seed=None):
+    """
+    n puntos en [0, 1)^dimension, arreglo (n, dimension), con el muestreo pedido:
+    "uniforme" (pseudoaleatorio, np.random.uniform), "sobol" o "halton"
+    (aleatorizados). Cada llamada usa una aleatorización nueva, así llamadas
+    repetidas son réplicas independientes.
+    """
+    if sampling not in SAMPLINGS:
+        raise ValueError(f"Muestreo desconocido: {sampling}. Opciones: {', '.join(SAMPLINGS)}")
+    if sampling == "uniforme":
+        return np.random.uniform(size=(n, dimension))
+    return SEQUENCES[sampling](dimension, seed=seed).random(n)
@@ -1,28 +1,289 @@
+from statistics import NormalDist
+
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.optimize import fsolve
-from tabulate import tabulate
-import sympy as sp
+from common.instrumentation import profiled
+from common.lambdify_cache import cached_lambdify
+from common.lazy_imports import lazy_callable, lazy_import
+from integration_methods.low_discrepancy import SAMPLINGS, uniform_points
+from integration_methods.quadrature_result import QuadratureResult
+
+plt = lazy_import("matplotlib.pyplot")
+sp = lazy_import("sympy")
+tabulate = lazy_callable("tabulate", "tabulate")
+fsolve = lazy_callable("scipy.optimize", "fsolve")
+
+
+REDUCCIONES = ("ninguna", "antiteticas", "control", "estratificado", "importancia")
+# Puntos de la malla con la que se invierte numéricamente la función de distribución de la densidad
+PUNTOS_DENSIDAD = 4097
+
 
-def montecarlo_integracion(x, f, desde, hasta, cantidad_puntos, repeticiones=10, precision=5):
-    f = sp.lambdify(x, f, 'numpy')
+@profiled
+def montecarlo_integracion(x, f, desde, hasta, cantidad_puntos, repeticiones=10, precision=5, reduccion="ninguna",
+                           densidad=None, grado_control=2, estratos=None, muestreo="uniforme"):
+    """
+    Estima el área bajo f entre desde y hasta con cantidad_puntos evaluaciones
+    de f por repetición.
+
+    reduccion elige la técnica de reducción de varianza:
+    - "ninguna": muestreo uniforme.
+    - "antiteticas": pares x y desde + hasta - x.
+    - "control": variable de control con un polinomio de grado grado_control
+      ajustado por mínimos cuadrados a la muestra, cuya integral es exacta.
+    - "estratificado": estratos iguales (por defecto cantidad_puntos / 2) con la
+      misma cantidad de puntos en cada uno.
+    - "importancia": x se muestrea con la densidad dada (una expresión en x, no
+      negativa en [desde, hasta]; no hace falta normalizarla) y se promedia f / p.
+
+    Cada repetición informa el error estándar y el factor de reducción de
+    varianza: la varianza del muestreo uniforme con las mismas evaluaciones
+    dividida por la del método elegido, ambas estimadas con la misma muestra.
+
+    muestreo elige de dónde salen los números uniformes: "uniforme"
+    (pseudoaleatorios), "sobol" o "halton" (cuasi Monte Carlo aleatorizado). Con
+    cuasi Monte Carlo los puntos no son independientes, así el error estándar y
+    el factor de reducción se estiman con la dispersión entre repeticiones, que
+    son réplicas con aleatorizaciones independientes.
+    """
+    if reduccion not in REDUCCIONES:
+        raise ValueError(f"Reducción desconocida: {reduccion}. Opciones: {', '.join(REDUCCIONES)}")
+    if reduccion == "importancia" and densidad is None:
+        raise ValueError("El muestreo por importancia necesita una densidad.")
+    if muestreo not in SAMPLINGS:
+        raise ValueError(f"Muestreo desconocido: {muestreo}. Opciones: {', '.join(SAMPLINGS)}")
+    cuasi_aleatorio = muestreo != "uniforme"
+    f = cached_lambdify(x, f, 'numpy')
     a = desde
     b = hasta
+    muestreo_densidad = preparar_densidad(x, densidad, a, b) if reduccion == "importancia" else None
     resultados = []
     areas = []
+    factores = []
+    varianzas_uniformes = []
+    uniformes = lambda n: uniform_points(muestreo, n)[:, 0]
     for _ in range(repeticiones):
-        x_random = np.random.uniform(a, b, cantidad_puntos)
-        f_values = f(x_random)
-        f_mean = np.mean(f_values)
-        area = abs((b - a) * f_mean)
+        x_random, f_values, integral, varianza, varianza_uniforme = ESTIMADORES[reduccion](
+            f, a, b, cantidad_puntos, uniformes, grado_control=grado_control, estratos=estratos,
+            densidad=muestreo_densidad
+        )
+        area = abs(integral)
+        factor = varianza_uniforme / varianza if varianza > 0 else np.inf
         areas.append(area)
-        resultados.append([len(resultados) + 1, a, b, round(area, precision)])
-    print(tabulate(resultados, headers=["Repetición", "Desde", "Hasta", "Área estimada"], tablefmt="grid"))
+        factores.append(factor)
+        varianzas_uniformes.append(varianza_uniforme)
+        if cuasi_aleatorio:
+            resultados.append([len(resultados) + 1, a, b, round(area, precision), "-", "-"])
+        else:
+            resultados.append([len(resultados) + 1, a, b, round(area, precision), f"{np.sqrt(varianza):.3e}",
+                               round(factor, 2)])
+    print(tabulate(resultados, headers=["Repetición", "Desde", "Hasta", "Área estimada", "Error estándar",
+                                        "Factor de reducción"], tablefmt="grid"))
     area_promedio = np.mean(areas)
     print(f"\nPromedio del área estimada sobre {repeticiones} repeticiones: {round(area_promedio, precision)}")
+    if cuasi_aleatorio:
+        error_entre_replicas(areas, varianzas_uniformes, cantidad_puntos)
+    elif reduccion != "ninguna":
+        print(f"Factor de reducción de varianza ({reduccion}): {np.mean(factores):.2f}; el muestreo uniforme "
+              f"necesitaría unas {np.mean(factores) * cantidad_puntos:.0f} evaluaciones para el mismo error")
     graficar_montecarlo(x, f, area_promedio, x_random, f_values, a, b)
     return area_promedio
 
+
+def error_entre_replicas(estimaciones, varianzas_uniformes, evaluaciones):
+    # Con réplicas independientes, la varianza de cada estimación sale de su dispersión;
+    # se compara con la varianza estimada del muestreo uniforme con los mismos puntos
+    if len(estimaciones) < 2:
+        print("Error estándar entre réplicas: no disponible (se necesitan al menos dos repeticiones)")
+        return
+    varianza = np.var(estimaciones, ddof=1)
+    factor = np.mean(varianzas_uniformes) / varianza if varianza > 0 else np.inf
+    print(f"Error estándar entre réplicas: {np.sqrt(varianza / len(estimaciones)):.3e} "
+          f"(del promedio de {len(estimaciones)} réplicas de {evaluaciones} puntos)")
+    print(f"Factor de reducción de varianza frente al muestreo uniforme: {factor:.2f}; el muestreo uniforme "
+          f"necesitaría unas {factor * evaluaciones:.0f} evaluaciones por réplica para el mismo error")
+
+
+# Cada estimador recibe uniformes(n), que da n números uniformes en [0, 1), y retorna (puntos, valores de f, integral, varianza de la integral,
+# varianza de la integral con muestreo uniforme y las mismas evaluaciones)
+def estimador_uniforme(f, a, b, n, uniformes, **_):
+    x_random = a + (b - a) * uniformes(n)
+    f_values = np.broadcast_to(f(x_random), x_random.shape)
+    varianza = (b - a) ** 2 * np.var(f_values, ddof=1) / n
+    return x_random, f_values, (b - a) * np.mean(f_values), varianza, varianza
+
+
+def estimador_antiteticas(f, a, b, n, uniformes, **_):
+    mitad = a + (b - a) * uniformes(n // 2)
+    x_random = np.concatenate([mitad, a + b - mitad])
+    f_values = np.broadcast_to(f(x_random), x_random.shape)
+    pares = (b - a) * (f_values[:n // 2] + f_values[n // 2:]) / 2
+    # Cada punto por separado es uniforme: sirve para estimar la varianza sin pares
+    varianza_uniforme = (b - a) ** 2 * np.var(f_values, ddof=1) / x_random.size
+    return x_random, f_values, np.mean(pares), np.var(pares, ddof=1) / pares.size, varianza_uniforme
+
+
+def estimador_control(f, a, b, n, uniformes, grado_control=2, **_):
+    x_random = a + (b - a) * uniformes(n)
+    f_values = np.broadcast_to(f(x_random), x_random.shape)
+    # Con término constante, los residuos del ajuste tienen media cero: la estimación
+    # es la integral exacta del polinomio más el promedio de los residuos
+    polinomio = np.polynomial.Polynomial.fit(x_random, f_values, grado_control)
+    residuos = f_values - polinomio(x_random)
+    primitiva = polinomio.integ()
+    integral = primitiva(b) - primitiva(a) + (b - a) * np.mean(residuos)
+    varianza = (b - a) ** 2 * np.var(residuos, ddof=grado_control + 1) / n
+    return x_random, f_values, integral, varianza, (b - a) ** 2 * np.var(f_values, ddof=1) / n
+
+
+def estimador_estratificado(f, a, b, n, uniformes, estratos=None, **_):
+    estratos = estratos or max(n // 2, 1)
+    por_estrato = n // estratos
+    if por_estrato < 2:
+        raise ValueError("Se necesitan al menos dos puntos por estrato para estimar la varianza.")
+    ancho = (b - a) / estratos
+    inicios = a + ancho * np.arange(estratos)
+    x_random = inicios[:, None] + ancho * uniformes(estratos * por_estrato).reshape(estratos, por_estrato)
+    f_values = np.broadcast_to(f(x_random), x_random.shape)
+    integral = ancho * np.sum(np.mean(f_values, axis=1))
+    varianza = ancho ** 2 * np.sum(np.var(f_values, axis=1, ddof=1)) / por_estrato
+    # Los puntos de todos los estratos juntos son una muestra uniforme estratificada:
+    # (b - a)² Var(f) sale de la media de f² menos el cuadrado de la integral
+    segundo_momento = np.mean(f_values ** 2)
+    varianza_uniforme = ((b - a) ** 2 * segundo_momento - integral ** 2) / x_random.size
+    return x_random.ravel(), f_values.ravel(), integral, varianza, varianza_uniforme
+
+
+def estimador_importancia(f, a, b, n, uniformes, densidad=None, **_):
+    p, inversa = densidad
+    x_random = inversa(uniformes(n))
+    f_values = np.broadcast_to(f(x_random), x_random.shape)
+    cocientes = f_values / p(x_random)
+    integral = np.mean(cocientes)
+    # E_u[((b - a) f)²] = (b - a) ∫ f² = (b - a) E_p[f² / p]
+    varianza_uniforme = ((b - a) * np.mean(f_values * cocientes) - integral ** 2) / n
+    return x_random, f_values, integral, np.var(cocientes, ddof=1) / n, varianza_uniforme
+
+
+def preparar_densidad(x, densidad, desde, hasta):
+    """
+    Normaliza la densidad en [desde, hasta] y retorna (p, inversa), donde inversa
+    lleva números uniformes en [0, 1) a puntos con densidad p (inversa de la
+    función de distribución, tabulada con trapecios e interpolada). La densidad
+    debe ser positiva donde f no se anula.
+    """
+    densidad = cached_lambdify(x, densidad, 'numpy')
+    malla = np.linspace(desde, hasta, PUNTOS_DENSIDAD)
+    valores = np.broadcast_to(densidad(malla), malla.shape).astype(float)
+    if not np.all(np.isfinite(valores)) or np.any(valores < 0):
+        raise ValueError("La densidad debe ser finita y no negativa en el intervalo.")
+    acumulada = np.concatenate([[0.0], np.cumsum((valores[1:] + valores[:-1]) / 2 * np.diff(malla))])
+    total = acumulada[-1]
+    if total <= 0:
+        raise ValueError("La densidad no puede ser nula en todo el intervalo.")
+    # Los puntos salen con la densidad constante a trozos de la tabla; usar esa misma
+    # densidad en f / p deja al estimador sin sesgo
+    alturas = np.diff(acumulada) / np.diff(malla) / total
+    p = lambda puntos: alturas[np.clip(np.searchsorted(malla, puntos, side='right') - 1, 0, alturas.size - 1)]
+    inversa = lambda u: np.interp(u * total, acumulada, malla)
+    return p, inversa
+
+
+ESTIMADORES = {
+    "ninguna": estimador_uniforme,
+    "antiteticas": estimador_antiteticas,
+    "control": estimador_control,
+    "estratificado": estimador_estratificado,
+    "importancia": estimador_importancia,
+}
+
+class EstadisticaCorrida:
+    """
+    Media y varianza de una muestra que llega por lotes, con memoria constante.
+
+    Cada lote se resume con su media y su suma de cuadrados centrada, y se
+    fusiona con lo acumulado con la fórmula de Chan (Welford por lotes), que no
+    resta cantidades grandes y parecidas como Σx² - n media².
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+
+    def agregar_lote(self, valores):
+        valores = np.asarray(valores, dtype=float).ravel()
+        if valores.size:
+            media = np.mean(valores)
+            self.fusionar(valores.size, media, np.sum((valores - media) ** 2))
+
+    def fusionar(self, n, media, m2):
+        total = self.n + n
+        delta = media - self.media
+        self.media += delta * n / total
+        self.m2 += m2 + delta * delta * self.n * n / total
+        self.n = total
+
+    @property
+    def varianza(self):
+        return self.m2 / (self.n - 1) if self.n > 1 else np.nan
+
+    @property
+    def error_estandar(self):
+        return np.sqrt(self.varianza / self.n) if self.n > 1 else np.nan
+
+
+@profiled
+def montecarlo_secuencial(x, f, desde, hasta, tolerancia_absoluta=1e-3, tolerancia_relativa=0.0, confianza=0.95,
+                          tamano_lote=10_000, max_puntos=10_000_000, precision=5):
+    """
+    Monte Carlo por lotes que se detiene cuando el intervalo de confianza es
+    suficientemente angosto.
+
+    x puede ser un símbolo o una tupla de símbolos; desde y hasta son entonces
+    números o secuencias con un límite por variable (la región es un rectángulo).
+    Se sortean lotes de tamano_lote puntos uniformes y solo se guarda la media y
+    la varianza corridas, así la memoria no depende de la cantidad de puntos. Se
+    detiene cuando la semiamplitud z σ / √n del intervalo de nivel confianza es
+    menor que max(tolerancia_absoluta, tolerancia_relativa * |integral|) o se
+    llega a max_puntos (entonces converged es False).
+
+    Retorna un QuadratureResult cuyo error es la semiamplitud del intervalo.
+    """
+    if not 0 < confianza < 1:
+        raise ValueError("La confianza debe estar entre 0 y 1.")
+    if tamano_lote < 2 or max_puntos < 2:
+        raise ValueError("El lote y el presupuesto deben tener al menos dos puntos.")
+    variables = tuple(x) if isinstance(x, (tuple, list)) else (x,)
+    desde = np.broadcast_to(np.asarray(desde, dtype=float), len(variables))
+    hasta = np.broadcast_to(np.asarray(hasta, dtype=float), len(variables))
+    f = cached_lambdify(variables, f, 'numpy')
+    volumen = np.prod(hasta - desde)
+    z = NormalDist().inv_cdf((1 + confianza) / 2)
+
+    estadistica = EstadisticaCorrida()
+    lotes = 0
+    semiamplitud = np.inf
+    while estadistica.n < max_puntos:
+        cantidad = min(tamano_lote, max_puntos - estadistica.n)
+        puntos = np.random.uniform(desde, hasta, size=(cantidad, len(variables)))
+        valores = volumen * np.broadcast_to(f(*puntos.T), (cantidad,))
+        estadistica.agregar_lote(valores)
+        lotes += 1
+        semiamplitud = z * estadistica.error_estandar
+        if semiamplitud <= max(tolerancia_absoluta, tolerancia_relativa * abs(estadistica.media)):
+            break
+
+    convergio = bool(semiamplitud <= max(tolerancia_absoluta, tolerancia_relativa * abs(estadistica.media)))
+    intervalo = (float(estadistica.media - semiamplitud), float(estadistica.media + semiamplitud))
+    print(f"\nMonte Carlo secuencial: {estadistica.n} puntos en {lotes} lotes")
+    print(f"Intervalo de confianza del {confianza:.0%}: [{intervalo[0]:.{precision}f}, {intervalo[1]:.{precision}f}]")
+    return QuadratureResult(
+        "montecarlo", float(estadistica.media), float(semiamplitud), estadistica.n, convergio, precision=precision,
+        details={"confianza": confianza, "intervalo": intervalo, "desviacion": float(np.sqrt(estadistica.varianza)),
+                 "lotes": lotes}
+    )
+
+
 def graficar_montecarlo(x, f, area, x_random, f_values, desde, hasta):
     x_vals = np.linspace(desde, hasta, 400)
     y_vals = f(x_vals)
@@ -37,20 +298,26 @@ def graficar_montecarlo(x, f, area, x_random, f_values, desde, hasta):
     plt.legend()
     plt.show()
 
-def montecarlo_pi(cantidad_puntos, repeticiones=10, precision=8):
+@profiled
+def montecarlo_pi(cantidad_puntos, repeticiones=10, precision=8, muestreo="uniforme"):
     resultados = []
+    estimaciones = []
     pi_promedio = 0
     for _ in range(repeticiones):
-        x_random = np.random.uniform(-1, 1, cantidad_puntos)
-        y_random = np.random.uniform(-1, 1, cantidad_puntos)
+        x_random, y_random = (2 * uniform_points(muestreo, cantidad_puntos, 2) - 1).T
         dentro_del_circulo = x_random**2 + y_random**2 <= 1
         num_dentro_del_circulo = np.sum(dentro_del_circulo)
         pi_estimado = 4 * num_dentro_del_circulo / cantidad_puntos
         pi_promedio += pi_estimado
+        estimaciones.append(pi_estimado)
         resultados.append([len(resultados) + 1, num_dentro_del_circulo, round(pi_estimado, precision)])
     pi_promedio /= repeticiones
     print(tabulate(resultados, headers=["Repetición", "Puntos dentro", "Pi estimado"], tablefmt="grid"))
     print(f"\nPromedio de pi estimado sobre {repeticiones} repeticiones: {round(pi_promedio, precision)}")
+    if muestreo != "uniforme":
+        # Con una proporción p de puntos dentro, la varianza uniforme de 4 p es 16 p (1 - p) / n
+        p = pi_promedio / 4
+        error_entre_replicas(estimaciones, [16 * p * (1 - p) / cantidad_puntos], cantidad_puntos)
     graficar_montecarlo_pi(x_random, y_random, dentro_del_circulo)
     return pi_promedio
 
@@ -69,9 +336,10 @@ def graficar_montecarlo_pi(x_random, y_random, dentro_del_circulo):
     plt.legend()
     plt.show()
 
-def montecarlo_integracion_entre_curvas(x, f1, f2, cantidad_puntos, repeticiones=10, precision=5):
-    f1 = sp.lambdify(x, f1, 'numpy')
-    f2 = sp.lambdify(x, f2, 'numpy')
+@profiled
+def montecarlo_integracion_entre_curvas(x, f1, f2, cantidad_puntos, repeticiones=10, precision=5, muestreo="uniforme"):
+    f1 = cached_lambdify(x, f1, 'numpy')
+    f2 = cached_lambdify(x, f2, 'numpy')
     interseccion = lambda x_val: f1(x_val) - f2(x_val)
     desde_x = fsolve(interseccion, 0)[0]
     hasta_x = fsolve(interseccion, 1)[0]
@@ -80,8 +348,9 @@ def montecarlo_integracion_entre_curvas(x, f1, f2, cantidad_puntos, repeticiones
     resultados = []
     areas = []
     for _ in range(repeticiones):
-        x_random = np.random.uniform(desde_x, hasta_x, cantidad_puntos)
-        y_random = np.random.uniform(desde_y, hasta_y, cantidad_puntos)
+        u = uniform_points(muestreo, cantidad_puntos, 2)
+        x_random = desde_x + (hasta_x - desde_x) * u[:, 0]
+        y_random = desde_y + (hasta_y - desde_y) * u[:, 1]
         puntos_dentro = np.sum((y_random > np.minimum(f1(x_random), f2(x_random))) &
                                 (y_random < np.maximum(f1(x_random), f2(x_random))))
         area_rectangulo = (hasta_x - desde_x) * (hasta_y - desde_y)
@@ -91,6 +360,9 @@ def montecarlo_integracion_entre_curvas(x, f1, f2, cantidad_puntos, repeticiones
     area_promedio = np.mean(areas)
     print(tabulate(resultados, headers=["Repetición", "Puntos dentro", "Área estimada"], tablefmt="grid"))
     print(f"\nPromedio del área estimada sobre {repeticiones} repeticiones: {round(area_promedio, precision)}")
+    if muestreo != "uniforme":
+        p = area_promedio / area_rectangulo
+        error_entre_replicas(areas, [area_rectangulo ** 2 * p * (1 - p) / cantidad_puntos], cantidad_puntos)
     graficar_montecarlo_entre_curvas(f1, f2, x_random, y_random, desde_x, hasta_x, area_promedio, desde_y, hasta_y)
     return area_promedio
 
@@ -132,6 +404,35 @@ def main():
         repeticiones=repeticiones_integracion,
         precision=precision_integracion
     )
+    for reduccion in REDUCCIONES[1:]:
+        print(f"\n=== Integración Monte Carlo con reducción de varianza: {reduccion} ===")
+        montecarlo_integracion(
+            x,
+            f_x,
+            desde=desde_integracion,
+            hasta=hasta_integracion,
+            cantidad_puntos=cantidad_puntos_integracion,
+            repeticiones=repeticiones_integracion,
+            precision=precision_integracion,
+            reduccion=reduccion,
+            densidad=1 + x**2
+        )
+    for muestreo in SAMPLINGS[1:]:
+        print(f"\n=== Integración cuasi Monte Carlo: {muestreo} ===")
+        montecarlo_integracion(
+            x,
+            sp.exp(x),
+            desde=desde_integracion,
+            hasta=hasta_integracion,
+            cantidad_puntos=1024,
+            repeticiones=repeticiones_integracion,
+            precision=precision_integracion,
+            muestreo=muestreo
+        )
+    print("\n=== Monte Carlo secuencial con intervalo de confianza ===")
+    y = sp.symbols('y')
+    montecarlo_secuencial((x, y), sp.exp(2*x - y), (0, 1), (1, 2), tolerancia_absoluta=0,
+                          tolerancia_relativa=1e-3).print_report()
     print("\n=== Estimación de π usando Monte Carlo ===")
     cantidad_puntos_pi = 1000
     repeticiones_pi = 10
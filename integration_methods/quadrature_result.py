@@ -0,0 +1,63 @@
+import numpy as np
+from common.lazy_imports import lazy_import
+
+plt = lazy_import("matplotlib.pyplot")
+
+
+class QuadratureResult:
+    """
+    Resultado común de los integradores con estimación de error.
+
+    value es la aproximación de la integral, error la estimación del error
+    absoluto y evaluations la cantidad de evaluaciones de f. panels, si el método
+    subdivide el intervalo, es un arreglo con una fila (a, b, valor, error) por
+    subintervalo final. details guarda datos propios del método (por ejemplo la
+    tabla de Romberg).
+    """
+
+    def __init__(self, method, value, error, evaluations, converged=True, panels=None, function=None,
+                 precision=8, details=None):
+        self.method = method
+        self.value = value
+        self.error = error
+        self.evaluations = evaluations
+        self.converged = converged
+        self.panels = panels
+        self.function = function
+        self.precision = precision
+        self.details = details
+
+    def print_report(self):
+        print(f"\nÁrea aproximada ({self.method}): {self.value:.{self.precision}f}")
+        error = "no disponible" if np.isnan(self.error) else f"{self.error:.3e}"
+        print(f"Error estimado: {error}, evaluaciones: {self.evaluations}")
+        if self.panels is not None:
+            print(f"Subintervalos: {len(self.panels)}")
+        if not self.converged:
+            print("No se alcanzó la tolerancia pedida.")
+
+    def plot(self):
+        if self.function is None or self.panels is None:
+            raise ValueError(f"El método {self.method} no tiene una gráfica asociada.")
+        start, end = self.panels[:, 0].min(), self.panels[:, 1].max()
+        x_vals = np.linspace(start, end, 1000)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # El integrando puede no estar definido en un extremo
+            y_vals = np.broadcast_to(self.function(x_vals), x_vals.shape)
+        plt.plot(x_vals, y_vals, label='$f(x)$', color='blue')
+        for edge in np.unique(self.panels[:, :2]):
+            plt.axvline(edge, color='orange', linewidth=0.5, alpha=0.7)
+        plt.axhline(0, color='black', linewidth=0.5)
+        plt.grid(color='gray', linestyle='--', linewidth=0.5)
+        plt.title(f'Integración adaptativa ({self.method}): {self.value:.{self.precision}f}')
+        plt.xlabel('$x$')
+        plt.ylabel('$f(x)$')
+        plt.legend()
+        plt.show()
+
+    def __float__(self):
+        return float(self.value)
+
+    def __repr__(self):
+        return (f"QuadratureResult(method={self.method!r}, value={self.value!r}, error={self.error!r}, "
+                f"evaluations={self.evaluations}, converged={self.converged})")
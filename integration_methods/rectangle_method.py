@@ -1,75 +1,78 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from tabulate import tabulate
-import sympy as sp
-
-
-def rectangle_area(x, f_x, start, end, num_rectangles, point="medio", precision=5):
-    f_num = sp.lambdify(x, f_x, 'numpy')
+from common.instrumentation import profiled
+from common.lambdify_cache import cached_lambdify
+from common.lazy_imports import lazy_callable, lazy_import
+from integration_methods.summation import CHUNK_SIZE, evaluate_on_grid, grid_nodes, grid_sum
+
+plt = lazy_import("matplotlib.pyplot")
+sp = lazy_import("sympy")
+tabulate = lazy_callable("tabulate", "tabulate")
+
+# Desplazamiento del punto de evaluación dentro de cada rectángulo, en unidades de h
+POINT_OFFSETS = {"izquierdo": 0.0, "derecho": 1.0, "medio": 0.5}
+MAX_PLOT_RECTANGLES = 200
+
+
+@profiled
+def rectangle_area(x, f_x, start, end, num_rectangles, point="medio", precision=5, table=False, plot=False,
+                   chunk_size=CHUNK_SIZE):
+    """
+    Suma de Riemann con punto "izquierdo", "derecho" o "medio".
+
+    f se evalúa de forma vectorizada en bloques de chunk_size nodos y los bloques
+    se acumulan con suma compensada, así n puede ser de decenas de millones sin
+    reservar arreglos de ese tamaño. La tabla por rectángulo y la gráfica solo
+    se construyen si se piden; la gráfica agrupa los rectángulos en a lo sumo
+    MAX_PLOT_RECTANGLES barras.
+    """
+    if point not in POINT_OFFSETS:
+        raise ValueError(f"Punto desconocido: {point}. Opciones: {', '.join(POINT_OFFSETS)}")
+    f_num = cached_lambdify(x, f_x, 'numpy')
 
     a = start
     b = end
     n = num_rectangles
     h = (b - a) / n
-    accumulated_area = 0
-    results = []
-    x_rect = []
-    y_rect = []
-    for i in range(n):
-        if point == "izquierdo":
-            x_i = a + i * h
-        elif point == "derecho":
-            x_i = a + i * h + h
-        else:
-            x_i = a + i * h + h / 2
-
-        f_xi = f_num(x_i)
-        area_i = f_xi * h
-        accumulated_area += area_i
-
-        if point == "izquierdo":
-            x_plot = a + i * h
-        elif point == "derecho":
-            x_plot = a + (i + 1) * h
-        else:
-            x_plot = a + i * h + h / 2
-
-        x_rect.append(x_plot)
-        y_rect.append(f_num(x_plot))
-        results.append([
-            round(i + 1, precision),
-            round(a + i * h + h, precision),
-            round(x_i, precision),
-            round(f_xi, precision),
-            round(area_i, precision)
-        ])
+    first_node = a + POINT_OFFSETS[point] * h
+    accumulated_area = h * grid_sum(f_num, first_node, h, n, chunk_size)
 
     area = round(accumulated_area, precision)
     print(f"Área aproximada bajo la curva desde {a} hasta {b}: {area}")
     print(f"Se calculó utilizando punto {point}.")
 
-    results.append(["", "", "", "", round(accumulated_area, precision)])
-    print(tabulate(results, headers=["i", "x", "xi", "f(xi)", "Área [f(xi)*h]"], tablefmt="grid"))
-
-    plot_area(x, f_num, area, a, b, x_rect, y_rect, h, point)
+    if table:
+        x_i = grid_nodes(first_node, h, 0, n)
+        f_xi = evaluate_on_grid(f_num, x_i)
+        results = np.column_stack([
+            np.arange(1, n + 1),
+            grid_nodes(a + h, h, 0, n),
+            x_i,
+            f_xi,
+            f_xi * h,
+        ]).round(precision).tolist()
+        results.append(["", "", "", "", area])
+        print(tabulate(results, headers=["i", "x", "xi", "f(xi)", "Área [f(xi)*h]"], tablefmt="grid"))
+
+    if plot:
+        plot_area(x, f_num, area, a, b, n, h, point)
     return area
 
 
-def plot_area(x, f_num, area, start, end, x_rect, y_rect, rect_width, point):
+def plot_area(x, f_num, area, start, end, num_rectangles, rect_width, point):
     x_vals = np.linspace(start, end, 400)
     y_vals = f_num(x_vals)
 
     plt.plot(x_vals, y_vals, label='$f(x)$', color='blue')
 
-    for x_val, y_val in zip(x_rect, y_rect):
-        if point == "izquierdo":
-            plt.bar(x_val, y_val, width=rect_width, align='edge', edgecolor='red', color='red', alpha=0.3)
-        elif point == "derecho":
-            plt.bar(x_val - rect_width, y_val, width=rect_width, align='edge', edgecolor='green', color='green',
-                    alpha=0.3)
-        else:
-            plt.bar(x_val - rect_width / 2, y_val, width=rect_width, align='center', edgecolor='orange', color='orange',
-                    alpha=0.3)
+    # Con muchos rectángulos se dibuja uno de cada group, con el ancho del grupo
+    group = -(-num_rectangles // MAX_PLOT_RECTANGLES)
+    width = rect_width * group
+    left_edges = grid_nodes(start, width, 0, -(-num_rectangles // group))
+    x_rect = left_edges + POINT_OFFSETS[point] * rect_width
+    y_rect = evaluate_on_grid(f_num, x_rect)
+    colors = {"izquierdo": 'red', "derecho": 'green', "medio": 'orange'}
+    plt.bar(left_edges, y_rect, width=np.minimum(width, end - left_edges), align='edge',
+            edgecolor=colors[point], color=colors[point], alpha=0.3)
 
     plt.axhline(0, color='black', linewidth=0.5)
     plt.axvline(0, color='black', linewidth=0.5)
@@ -91,7 +94,7 @@ def main():
     point = "medio"  # Opciones: "izquierdo", "derecho", "medio"
     precision = 5
 
-    rectangle_area(x, f_x, start, end, num_rectangles, point, precision)
+    rectangle_area(x, f_x, start, end, num_rectangles, point, precision, table=True, plot=True)
 
 
 if __name__ == "__main__":
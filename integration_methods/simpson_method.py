@@ -1,53 +1,118 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from tabulate import tabulate
-import sympy as sp
+from common.instrumentation import profiled
+from common.lambdify_cache import cached_lambdify
+from common.lazy_imports import lazy_callable, lazy_import
+from integration_methods.summation import CHUNK_SIZE, CompensatedSum, grid_chunks
 
+plt = lazy_import("matplotlib.pyplot")
+sp = lazy_import("sympy")
+tabulate = lazy_callable("tabulate", "tabulate")
 
-def simpson_area(x, f_x, start, end, num_intervals, precision=5):
-    if num_intervals % 2 != 0:
-        raise ValueError("El número de intervalos debe ser par para el método de Simpson.")
+MAX_PLOT_POINTS = 200
 
-    f_num = sp.lambdify(x, f_x, 'numpy')
+
+@profiled
+def simpson_area(x, f_x, start, end, num_intervals, precision=5, table=False, plot=False, chunk_size=CHUNK_SIZE):
+    """
+    Simpson compuesto sobre num_intervals subintervalos.
+
+    Con n par se usa la regla 1/3 en todo el intervalo; con n impar (n >= 3) la
+    regla 1/3 cubre los primeros n - 3 subintervalos y la regla 3/8 los últimos 3.
+    Los nodos se evalúan una sola vez, por bloques de chunk_size (ver
+    simpson_stream). La tabla de nodos y la gráfica solo se construyen si se piden.
+    """
+    if num_intervals < 2:
+        raise ValueError("El método de Simpson necesita al menos 2 intervalos.")
+
+    f_num = cached_lambdify(x, f_x, 'numpy')
 
     a = start
     b = end
     n = num_intervals
     h = (b - a) / n
-    results = []
-
-    odd_sum = 0
-    for i in range(1, n, 2):
-        x_i = a + i * h
-        odd_sum += f_num(x_i)
-
-    even_sum = 0
-    for i in range(2, n, 2):
-        x_i = a + i * h
-        even_sum += f_num(x_i)
-
-    accumulated_area = (h / 3) * (f_num(a) + 4 * odd_sum + 2 * even_sum + f_num(b))
-
-    for i in range(n + 1):
-        x_i = a + i * h
-        results.append([i, round(x_i, precision), round(f_num(x_i), precision)])
-
-    print(tabulate(results, headers=["i", "x_i", "f(x_i)"], tablefmt="grid"))
+    chunks = grid_chunks(f_num, a, h, n + 1, chunk_size)
+    stored = []
+    if table:
+        # Se guardan los valores ya calculados para la tabla en vez de evaluar de nuevo
+        chunks = keep_chunks(chunks, stored)
+    accumulated_area = simpson_stream(chunks, h)
+
+    if table:
+        y_nodes = np.concatenate(stored)
+        results = np.column_stack([np.arange(n + 1), a + h * np.arange(n + 1), y_nodes])
+        results[:, 1:] = results[:, 1:].round(precision)
+        print(tabulate(results.tolist(), headers=["i", "x_i", "f(x_i)"], tablefmt="grid"))
 
     area = round(accumulated_area, precision)
     print(f"\nÁrea aproximada bajo la curva desde {a} hasta {b}: {area}")
 
-    plot_simpson(f_num, start, end, area, n)
+    if plot:
+        plot_simpson(f_num, start, end, area, n)
     return area
 
 
+def keep_chunks(chunks, stored):
+    for values in chunks:
+        stored.append(np.array(values))
+        yield values
+
+
+def simpson_stream(chunks, h):
+    """
+    Integra con Simpson compuesto los valores f(x_0), f(x_1), ..., f(x_n) de nodos
+    equiespaciados con paso h, que llegan como una secuencia (o generador) de
+    bloques de cualquier tamaño.
+
+    Solo se guardan las sumas de los nodos pares e impares (con suma compensada) y
+    los últimos cuatro valores, así la memoria no depende de n. Como n se conoce
+    al final, los últimos tres valores se retienen hasta saber si corresponde
+    cerrar con la regla 1/3 (n par) o con un panel 3/8 (n impar).
+    """
+    even_sum, odd_sum = CompensatedSum(), CompensatedSum()
+    first = None
+    tail = np.empty(0)
+    last_accumulated = None
+    index = 0
+    for values in chunks:
+        values = np.concatenate([tail, np.ravel(values)])
+        if first is None and values.size:
+            first = values[0]
+        ready = values[:-3]
+        if ready.size:
+            # index es el índice global del primer valor de ready
+            even_sum.add_array(ready[index % 2::2])
+            odd_sum.add_array(ready[1 - index % 2::2])
+            last_accumulated = ready[-1]
+            index += ready.size
+        tail = values[-3:]
+
+    n = index + tail.size - 1
+    if n < 2:
+        raise ValueError("El método de Simpson necesita al menos 2 intervalos.")
+    if n % 2 == 0:
+        # El último valor cierra la regla 1/3; los otros dos se suman según su paridad
+        for offset, value in enumerate(tail[:-1]):
+            (even_sum if (index + offset) % 2 == 0 else odd_sum).add(value)
+        return h / 3 * (2 * even_sum.value + 4 * odd_sum.value - first + tail[-1])
+
+    # n impar: regla 1/3 hasta x_{n-3} y 3/8 en los últimos tres subintervalos
+    if n == 3:
+        simpson_third = 0.0
+    else:
+        simpson_third = h / 3 * (2 * even_sum.value + 4 * odd_sum.value - first - last_accumulated)
+    three_eighths = 3 * h / 8 * (last_accumulated + 3 * tail[0] + 3 * tail[1] + tail[2])
+    return simpson_third + three_eighths
+
+
 def plot_simpson(f_num, start, end, area, n):
     x_vals = np.linspace(start, end, 400)
     y_vals = f_num(x_vals)
     plt.plot(x_vals, y_vals, label='$f(x)$', color='blue')
 
-    x_points = np.linspace(start, end, n + 1)
-    y_points = f_num(x_points)
+    # Con muchos nodos se dibuja un subconjunto equiespaciado
+    step = -(-(n + 1) // MAX_PLOT_POINTS)
+    x_points = start + (end - start) / n * np.arange(0, n + 1, step)
+    y_points = np.broadcast_to(f_num(x_points), x_points.shape)
     plt.plot(x_points, y_points, 'ro', label='Puntos de Simpson')
 
     plt.axhline(0, color='black', linewidth=0.5)
@@ -65,10 +130,10 @@ def main():
     f_x = sp.log(x + 1) / x
     start = 0
     end = 4
-    num_intervals = 4 # Debe ser par
+    num_intervals = 4
     precision = 5
 
-    simpson_area(x, f_x, start, end, num_intervals, precision)
+    simpson_area(x, f_x, start, end, num_intervals, precision, table=True, plot=True)
 
 
 if __name__ == "__main__":
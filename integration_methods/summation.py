@@ -0,0 +1,65 @@
+import numpy as np
+
+CHUNK_SIZE = 1 << 20
+
+
+class CompensatedSum:
+    """
+    Acumulador de Neumaier (Kahan mejorado) para sumar muchos bloques.
+
+    Cada bloque se suma con np.sum, que ya usa suma por pares, y los totales de
+    los bloques se acumulan con compensación: el error de redondeo no crece con
+    el número de bloques.
+    """
+
+    __slots__ = ("total", "compensation")
+
+    def __init__(self, value=0.0):
+        self.total = float(value)
+        self.compensation = 0.0
+
+    def add(self, value):
+        value = float(value)
+        total = self.total + value
+        if abs(self.total) >= abs(value):
+            self.compensation += (self.total - total) + value
+        else:
+            self.compensation += (value - total) + self.total
+        self.total = total
+
+    def add_array(self, values):
+        self.add(np.sum(values))
+
+    @property
+    def value(self):
+        return self.total + self.compensation
+
+
+def grid_nodes(start, step, first, stop):
+    # Cada nodo se calcula desde start (sin acumular h), así no se arrastra error
+    return start + step * np.arange(first, stop, dtype=float)
+
+
+def evaluate_on_grid(func, nodes):
+    # lambdify devuelve un escalar cuando la expresión es constante
+    return np.broadcast_to(func(nodes), nodes.shape)
+
+
+def grid_chunks(func, start, step, count, chunk_size=CHUNK_SIZE):
+    """
+    Genera los valores func(start + i * step), i = 0, ..., count - 1, en bloques de
+    a lo sumo chunk_size nodos, así la memoria no depende de count.
+    """
+    for first in range(0, count, chunk_size):
+        nodes = grid_nodes(start, step, first, min(first + chunk_size, count))
+        yield evaluate_on_grid(func, nodes)
+
+
+def grid_sum(func, start, step, count, chunk_size=CHUNK_SIZE):
+    """
+    Suma func(start + i * step) para i = 0, ..., count - 1 con suma compensada.
+    """
+    accumulator = CompensatedSum()
+    for values in grid_chunks(func, start, step, count, chunk_size):
+        accumulator.add_array(values)
+    return accumulator.value
@@ -1,11 +1,19 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from tabulate import tabulate
-import sympy as sp
+from common.dual import is_numeric_callable
+from common.instrumentation import profiled
+from common.lambdify_cache import cached_lambdify
+from common.lazy_imports import lazy_callable, lazy_import
+from integration_methods.quadrature_result import QuadratureResult
+from integration_methods.summation import grid_sum
 
+plt = lazy_import("matplotlib.pyplot")
+sp = lazy_import("sympy")
+tabulate = lazy_callable("tabulate", "tabulate")
 
+
+@profiled
 def trapezoidal_area(x, f_x, start, end, num_trapezoids, precision=5):
-    f_num = sp.lambdify(x, f_x, 'numpy')
+    f_num = cached_lambdify(x, f_x, 'numpy')
     a = start
     b = end
     n = num_trapezoids
@@ -42,6 +50,65 @@ def trapezoidal_area(x, f_x, start, end, num_trapezoids, precision=5):
     return total_area
 
 
+@profiled
+def romberg(x, f_x, start, end, abs_tolerance=1e-10, rel_tolerance=1e-10, max_levels=20, min_levels=4,
+            precision=8):
+    """
+    Integración de Romberg sobre trapecios anidados.
+
+    El nivel k usa 2^k trapecios: solo se evalúan los 2^(k-1) puntos medios nuevos
+    y su suma se agrega a la mitad de la regla del nivel anterior. Cada fila del
+    tablero aplica extrapolación de Richardson, R[k, j] = R[k, j-1] +
+    (R[k, j-1] - R[k-1, j-1]) / (4^j - 1). Se detiene cuando dos diagonales
+    seguidas difieren menos que max(abs_tolerance, rel_tolerance * |R[k, k]|),
+    a partir de min_levels niveles (antes la diferencia puede ser cero por
+    casualidad, por ejemplo con integrandos periódicos).
+
+    f_x también puede ser una función de Python escrita con NumPy.
+
+    Retorna un QuadratureResult con el tablero en details["tableau"] (nan sobre
+    la diagonal); ver print_tableau.
+    """
+    f_num = f_x if is_numeric_callable(f_x) else cached_lambdify(x, f_x, 'numpy')
+    a = float(start)
+    b = float(end)
+    tableau = np.full((max_levels + 1, max_levels + 1), np.nan)
+    tableau[0, 0] = (b - a) / 2 * (f_num(a) + f_num(b))
+    evaluations = 2
+    error = np.inf
+
+    for k in range(1, max_levels + 1):
+        h = (b - a) / 2 ** k
+        # Los nodos impares del nivel k son los únicos que no se evaluaron antes
+        tableau[k, 0] = tableau[k - 1, 0] / 2 + h * grid_sum(f_num, a + h, 2 * h, 2 ** (k - 1))
+        evaluations += 2 ** (k - 1)
+        for j in range(1, k + 1):
+            tableau[k, j] = tableau[k, j - 1] + (tableau[k, j - 1] - tableau[k - 1, j - 1]) / (4 ** j - 1)
+
+        error = abs(tableau[k, k] - tableau[k - 1, k - 1])
+        if k >= min_levels and error <= max(abs_tolerance, rel_tolerance * abs(tableau[k, k])):
+            return QuadratureResult(
+                "romberg", float(tableau[k, k]), float(error), evaluations, function=f_num, precision=precision,
+                details={"tableau": tableau[:k + 1, :k + 1]}
+            )
+
+    return QuadratureResult(
+        "romberg", float(tableau[max_levels, max_levels]), float(error), evaluations, converged=False, function=f_num,
+        precision=precision, details={"tableau": tableau}
+    )
+
+
+def print_tableau(result):
+    tableau = result.details["tableau"]
+    rows = [[k, 2 ** k, *row[:k + 1]] for k, row in enumerate(tableau)]
+    print(tabulate(
+        rows,
+        headers=["k", "Trapecios", *[f"R[k,{j}]" for j in range(len(tableau))]],
+        floatfmt=f".{result.precision}f",
+        tablefmt="grid"
+    ))
+
+
 def plot_trapezoidal(f, x_trap, y_trap, area):
     x_vals = np.linspace(x_trap[0], x_trap[-1], 400)
     y_vals = f(x_vals)
@@ -80,6 +147,10 @@ def main():
 
     trapezoidal_area(x, f_x, start, end, num_trapezoids, precision)
 
+    result = romberg(x, sp.exp(-x ** 2), 0, 2, precision=12)
+    print_tableau(result)
+    result.print_report()
+
 
 if __name__ == "__main__":
     main()
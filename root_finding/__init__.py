@@ -0,0 +1 @@
+"""Métodos numéricos para encontrar raíces de ecuaciones."""
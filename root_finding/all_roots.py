@@ -0,0 +1,192 @@
+import numpy as np
+from common.instrumentation import profiled
+from common.lambdify_cache import cached_lambdify
+from common.lazy_imports import lazy_import
+from root_finding.bracketing import illinois_batch
+from root_finding.newton_raphson import derivative_evaluator, newton_batch_kernel
+
+plt = lazy_import("matplotlib.pyplot")
+sp = lazy_import("sympy")
+
+
+@profiled
+def all_roots(x, f_expr, a, b, num_samples=1000, tolerance=1e-12, max_refinements=4, refinement_factor=16,
+              max_iterations=100, duplicate_tolerance=None):
+    """
+    Encuentra todas las raíces reales de f en [a, b].
+
+    Muestrea f sobre una grilla, detecta cambios de signo y mínimos locales de |f|
+    cercanos a cero, y refina la grilla donde las raíces se agrupan (varios cambios
+    de signo seguidos o un mínimo que sugiere dos raíces dentro de una celda).
+    Los brackets se refinan todos a la vez con illinois_batch y los mínimos que
+    quedan (raíces de multiplicidad par) con Newton vectorizado.
+
+    Retorna un arreglo ordenado con las raíces sin duplicados.
+    """
+    if b <= a:
+        raise ValueError("El intervalo debe cumplir a < b.")
+    if refinement_factor < 2:
+        raise ValueError("El factor de refinamiento debe ser al menos 2.")
+    f = cached_lambdify(x, f_expr, 'numpy')
+
+    lows, highs, zeros, touching = scan_interval(f, a, b, num_samples, max_refinements, refinement_factor)
+
+    roots = [zeros]
+    if lows.size:
+        f_lows = evaluate(f, lows)
+        f_highs = evaluate(f, highs)
+        refined = illinois_batch(f, lows, highs, f_lows, f_highs, tolerance, max_iterations)
+        # Un polo con cambio de signo (tan(x) en π/2, 1/x en 0) también da un bracket:
+        # se descarta porque f no es pequeña en el punto al que converge
+        values = np.abs(evaluate(f, refined['root']))
+        scale = np.maximum(np.abs(f_lows), np.abs(f_highs))
+        roots.append(refined['root'][refined['converged'] & small_residual(values, scale)])
+
+    if touching.size:
+        _, evaluate_with_derivative, _ = derivative_evaluator(x, f_expr)
+        refined = newton_batch_kernel(evaluate_with_derivative, touching[:, 1], tolerance, max_iterations)
+        candidates = refined['root']
+        inside = (candidates >= touching[:, 0]) & (candidates <= touching[:, 2])
+        values = np.abs(evaluate(f, candidates))
+        scale = np.abs(evaluate(f, touching.ravel())).max()
+        roots.append(candidates[refined['converged'] & inside & small_residual(values, scale)])
+
+    roots = np.sort(np.concatenate(roots))
+    if duplicate_tolerance is None:
+        duplicate_tolerance = max(100 * tolerance, 1e-12 * (b - a))
+    return unique_roots(roots, duplicate_tolerance)
+
+
+def small_residual(values, scale):
+    # |f(raíz)| finito y pequeño frente a la escala de f alrededor de la raíz
+    with np.errstate(invalid='ignore'):
+        return np.isfinite(values) & (values <= np.sqrt(np.finfo(float).eps) * np.maximum(scale, 1.0))
+
+
+def scan_interval(f, a, b, num_samples, max_refinements, refinement_factor):
+    starts = np.array([a], dtype=float)
+    ends = np.array([b], dtype=float)
+    # Celdas de cada segmento: en cada nivel, refinement_factor por celda marcada del padre
+    cells = np.array([num_samples])
+    lows, highs, zeros, touching = [], [], [], []
+
+    for level in range(max_refinements + 1):
+        # Los segmentos tienen distinta cantidad de celdas: la grilla se completa con nan,
+        # que no cuenta como cambio de signo ni como mínimo
+        columns = np.arange(cells.max() + 1)
+        valid = columns[None, :] <= cells[:, None]
+        t = np.minimum(columns[None, :], cells[:, None]) / cells[:, None]
+        xs = starts[:, None] + (ends - starts)[:, None] * t
+        ys = np.full(xs.shape, np.nan)
+        ys[valid] = evaluate(f, xs[valid])
+
+        zeros.append(xs[ys == 0])
+        sign_change = ys[:, :-1] * ys[:, 1:] < 0
+        suspicious = hidden_root_nodes(ys)
+
+        refine = np.zeros_like(sign_change)
+        if level < max_refinements:
+            # Mínimo sospechoso en el nodo j + 1: se refinan las dos celdas vecinas
+            refine[:, :-1] |= suspicious
+            refine[:, 1:] |= suspicious
+            # La grilla no resuelve la curvatura (menos de unos cuatro nodos por
+            # oscilación): una celda puede esconder dos raíces sin cambio de signo
+            coarse = under_resolved_nodes(ys)
+            refine[:, :-1] |= coarse
+            refine[:, 1:] |= coarse
+            # Dos o más cambios de signo a menos de dos celdas de distancia: puede haber
+            # más raíces ocultas, así que se refina toda la ventana. Las celdas que tocan
+            # un cero (a precisión de máquina) cuentan como cambio de signo
+            scale = np.nanmax(np.abs(ys), axis=1, keepdims=True)
+            at_zero = np.abs(ys) <= np.finfo(float).eps * scale
+            crossing = sign_change | at_zero[:, :-1] | at_zero[:, 1:]
+            padded = np.pad(crossing, ((0, 0), (2, 2))).astype(np.int8)
+            nearby = sum(padded[:, k:k + sign_change.shape[1]] for k in range(5))
+            refine |= nearby >= 2
+
+        keep = sign_change & ~refine
+        lows.append(xs[:, :-1][keep])
+        highs.append(xs[:, 1:][keep])
+
+        final_nodes = suspicious & ~(refine[:, :-1] | refine[:, 1:])
+        rows, cols = np.nonzero(final_nodes)
+        touching.append(np.stack([xs[rows, cols], xs[rows, cols + 1], xs[rows, cols + 2]], axis=1))
+
+        if not refine.any():
+            break
+        # Las celdas marcadas contiguas se agrupan en un solo segmento a refinar
+        padded = np.pad(refine, ((0, 0), (1, 1))).astype(np.int8)
+        edges = np.diff(padded, axis=1)
+        run_rows, run_starts = np.nonzero(edges == 1)
+        _, run_ends = np.nonzero(edges == -1)
+        starts = xs[run_rows, run_starts]
+        ends = xs[run_rows, run_ends]
+        cells = (run_ends - run_starts) * refinement_factor
+
+    return (np.concatenate(lows), np.concatenate(highs), np.concatenate(zeros),
+            np.concatenate(touching) if touching else np.empty((0, 3)))
+
+
+def hidden_root_nodes(ys):
+    # Nodos interiores donde |f| tiene un mínimo local sin cambio de signo alrededor
+    # (un cero exacto en el nodo también cuenta: puede esconder una segunda raíz)
+    y0, y1, y2 = ys[:, :-2], ys[:, 1:-1], ys[:, 2:]
+    is_minimum = (np.abs(y1) <= np.abs(y0)) & (np.abs(y1) <= np.abs(y2)) & (y0 * y2 > 0) & (y0 * y1 >= 0)
+    # Vértice de la parábola que pasa por los tres nodos equiespaciados
+    curvature = y2 - 2 * y1 + y0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        vertex = y1 - (y2 - y0) ** 2 / (8 * curvature)
+    scale = np.nanmax(np.abs(ys), axis=1, keepdims=True)
+    near_zero = np.abs(vertex) <= np.sqrt(np.finfo(float).eps) * np.maximum(scale, 1.0)
+    with np.errstate(invalid='ignore'):
+        crosses = (vertex * y1 <= 0) & (curvature != 0)
+    return is_minimum & (crosses | near_zero)
+
+
+def under_resolved_nodes(ys):
+    # Nodos interiores donde la segunda diferencia supera a los valores de f alrededor
+    y0, y1, y2 = ys[:, :-2], ys[:, 1:-1], ys[:, 2:]
+    local = np.maximum(np.maximum(np.abs(y0), np.abs(y1)), np.abs(y2))
+    return np.abs(y2 - 2 * y1 + y0) > local
+
+
+def unique_roots(roots, duplicate_tolerance):
+    if roots.size == 0:
+        return roots
+    gaps = np.diff(roots)
+    keep = np.concatenate([[True], gaps > duplicate_tolerance * np.maximum(1.0, np.abs(roots[1:]))])
+    return roots[keep]
+
+
+def evaluate(func, values):
+    values = np.asarray(values, dtype=float)
+    return np.broadcast_to(func(values), values.shape).astype(float)
+
+
+def plot_roots(f, roots, a, b):
+    x_vals = np.linspace(a, b, 1000)
+    plt.figure(figsize=(12, 6))
+    plt.plot(x_vals, f(x_vals), label='$f(x)$', color='blue')
+    plt.axhline(0, color='black', linewidth=0.5)
+    plt.scatter(roots, np.zeros_like(roots), color='red', zorder=5, label=f'{len(roots)} raíces')
+    plt.legend()
+    plt.xlabel('x')
+    plt.ylabel('f(x)')
+    plt.title('Raíces de la función en el intervalo')
+    plt.grid(True)
+    plt.show()
+
+
+def main():
+    x = sp.symbols('x')
+    f_x = sp.sin(10 * x) * (x - 1)**2 + sp.cos(3 * x) / 10
+    a = -3
+    b = 3
+    roots = all_roots(x, f_x, a, b)
+    for idx, root in enumerate(roots):
+        print(f"Raíz {idx + 1}: {root:.12f}")
+    plot_roots(cached_lambdify(x, f_x, 'numpy'), roots, a, b)
+
+
+if __name__ == "__main__":
+    main()
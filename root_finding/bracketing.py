@@ -0,0 +1,273 @@
+import numpy as np
+from common.instrumentation import profiled
+from common.lambdify_cache import cached_lambdify
+from common.lazy_imports import lazy_import
+from root_finding.root_result import RootResult
+
+plt = lazy_import("matplotlib.pyplot")
+sp = lazy_import("sympy")
+
+STEP_NAMES = ("bisección", "secante", "interpolación cuadrática inversa", "regula falsi")
+
+
+@profiled
+def brent(x, f_expr, a, b, tolerance=1e-10, max_iterations=100, precision=8, trace="summary"):
+    """
+    Método de Brent: combina bisección, secante e interpolación cuadrática inversa.
+
+    Cada punto se evalúa una sola vez y la raíz nunca sale del intervalo [a, b],
+    que debe cumplir f(a) * f(b) < 0. La columna "Paso" de la traza indica el
+    tipo de paso según STEP_NAMES.
+    """
+    f = cached_lambdify(x, f_expr, 'numpy')
+    result = RootResult(
+        "brent",
+        ["a", "b", "c", "f(b)", "Paso", "Ancho"],
+        max_iterations, trace, precision, function=f, plotter=plot_result
+    )
+    full_trace = result.trace
+
+    fa = f(a)
+    fb = f(b)
+    result.evaluations = 2
+    if fa == 0:
+        return result.finish(a, 0, 0.0, 0.0)
+    if fb == 0:
+        return result.finish(b, 0, 0.0, 0.0)
+    if fa * fb > 0:
+        raise ValueError("La función debe tener signos opuestos en los extremos del intervalo [a, b].")
+
+    eps = np.finfo(float).eps
+    c, fc = b, fb
+    d = e = b - a
+    reference_width = abs(b - a)
+    stalled = 0
+
+    for iteration in range(max_iterations):
+        # c es el extremo opuesto a b: la raíz siempre queda entre b y c
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol1 = 2 * eps * abs(b) + 0.5 * tolerance
+        xm = 0.5 * (c - b)
+        if abs(xm) <= tol1 or fb == 0:
+            return result.finish(b, iteration, abs(c - b), abs((c - b) * 100 / b) if b != 0 else np.inf)
+
+        # Si el intervalo no se reduce a la mitad en dos pasos se fuerza una bisección
+        # (protege el caso de raíces múltiples, donde la interpolación avanza muy poco)
+        width = abs(c - b)
+        if width <= 0.5 * reference_width:
+            reference_width = width
+            stalled = 0
+        else:
+            stalled += 1
+
+        step = 0
+        if stalled < 2 and abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                step = 1
+                p = 2 * xm * s
+                q = 1 - s
+            else:
+                step = 2
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * xm * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            # La interpolación solo se acepta si cae dentro del intervalo y reduce el paso
+            if 2 * p < min(3 * xm * q - abs(tol1 * q), abs(e * q)):
+                e = d
+                d = p / q
+            else:
+                step = 0
+                d = xm
+                e = d
+        else:
+            d = xm
+            e = d
+
+        a, fa = b, fb
+        b = b + d if abs(d) > tol1 else b + np.copysign(tol1, xm)
+        fb = f(b)
+        result.evaluations += 1
+
+        if full_trace is not None:
+            full_trace[iteration] = (a, b, c, fb, step, abs(c - b))
+
+    raise ValueError("El método no convergió dentro del número máximo de iteraciones.")
+
+
+@profiled
+def illinois(x, f_expr, a, b, tolerance=1e-10, max_iterations=100, precision=8, trace="summary"):
+    """
+    Regula falsi con la modificación de Illinois.
+
+    Cuando el mismo extremo se conserva dos veces seguidas, su valor de f se
+    divide por dos, lo que evita el estancamiento de la regula falsi clásica.
+    """
+    f = cached_lambdify(x, f_expr, 'numpy')
+    result = RootResult(
+        "illinois",
+        ["a", "b", "c", "f(c)", "Paso", "Ancho"],
+        max_iterations, trace, precision, function=f, plotter=plot_result
+    )
+    full_trace = result.trace
+
+    fa = f(a)
+    fb = f(b)
+    result.evaluations = 2
+    if fa == 0:
+        return result.finish(a, 0, 0.0, 0.0)
+    if fb == 0:
+        return result.finish(b, 0, 0.0, 0.0)
+    if fa * fb > 0:
+        raise ValueError("La función debe tener signos opuestos en los extremos del intervalo [a, b].")
+
+    eps = np.finfo(float).eps
+    side = 0
+    c = a
+
+    for iteration in range(max_iterations):
+        c_previous = c
+        c = (a * fb - b * fa) / (fb - fa)
+        fc = f(c)
+        result.evaluations += 1
+
+        if fc * fb > 0:
+            b, fb = c, fc
+            if side == -1:
+                fa /= 2
+            side = -1
+        else:
+            a, fa = c, fc
+            if side == 1:
+                fb /= 2
+            side = 1
+
+        width = abs(b - a)
+        if full_trace is not None:
+            full_trace[iteration] = (a, b, c, fc, 3, width)
+
+        tol1 = 2 * eps * abs(c) + 0.5 * tolerance
+        if fc == 0 or width <= 2 * tol1 or abs(c - c_previous) <= tol1 * 0.5:
+            abs_error = abs(c - c_previous)
+            return result.finish(c, iteration + 1, abs_error, abs(abs_error * 100 / c) if c != 0 else np.inf)
+
+    raise ValueError("El método no convergió dentro del número máximo de iteraciones.")
+
+
+def illinois_batch(f, a, b, fa, fb, tolerance=1e-12, max_iterations=100):
+    """
+    Versión vectorizada de illinois: refina muchos brackets a la vez.
+
+    a, b, fa y fb son arreglos con los extremos y sus valores (f(a) * f(b) < 0).
+    Retorna un arreglo estructurado con los campos 'root', 'iterations',
+    'abs_error' y 'converged', igual que newton_batch_kernel.
+    """
+    a = np.array(a, dtype=float)
+    b = np.array(b, dtype=float)
+    fa = np.array(fa, dtype=float)
+    fb = np.array(fb, dtype=float)
+    size = a.size
+    eps = np.finfo(float).eps
+
+    side = np.zeros(size, dtype=np.int8)
+    c = a.copy()
+    iterations = np.zeros(size, dtype=np.int64)
+    abs_error = np.full(size, np.inf)
+    converged = np.zeros(size, dtype=bool)
+    active = np.arange(size)
+
+    for iteration in range(max_iterations):
+        if active.size == 0:
+            break
+        a_i, b_i, fa_i, fb_i = a[active], b[active], fa[active], fb[active]
+        c_previous = c[active]
+        c_new = (a_i * fb_i - b_i * fa_i) / (fb_i - fa_i)
+        fc = np.broadcast_to(f(c_new), c_new.shape)
+
+        keep_a = fc * fb_i > 0
+        side_i = side[active]
+        # Se reemplaza b: si ya se había reemplazado b antes, se pondera f(a) a la mitad
+        fa_i = np.where(keep_a & (side_i == -1), fa_i / 2, fa_i)
+        fb_i = np.where(~keep_a & (side_i == 1), fb_i / 2, fb_i)
+        a[active] = np.where(keep_a, a_i, c_new)
+        fa[active] = np.where(keep_a, fa_i, fc)
+        b[active] = np.where(keep_a, c_new, b_i)
+        fb[active] = np.where(keep_a, fc, fb_i)
+        side[active] = np.where(keep_a, -1, 1)
+        c[active] = c_new
+
+        step = np.abs(c_new - c_previous)
+        abs_error[active] = step
+        iterations[active] = iteration + 1
+        tol1 = 2 * eps * np.abs(c_new) + 0.5 * tolerance
+        done = (fc == 0) | (np.abs(b[active] - a[active]) <= 2 * tol1) | (step <= 0.5 * tol1)
+        converged[active[done]] = True
+        active = active[~done]
+
+    result = np.zeros(size, dtype=[
+        ('root', np.float64),
+        ('iterations', np.int64),
+        ('abs_error', np.float64),
+        ('converged', np.bool_),
+    ])
+    result['root'] = c
+    result['iterations'] = iterations
+    result['abs_error'] = abs_error
+    result['converged'] = converged
+    return result
+
+
+def plot_result(result):
+    f = result.function
+    root = result.root
+    brackets = result.history()[:, :2] if result.records_trace else np.empty((0, 2))
+    if len(brackets):
+        low = min(brackets.min(), root)
+        high = max(brackets.max(), root)
+    else:
+        low, high = root - 1, root + 1
+    padding = (high - low) * 0.2 if high != low else 1
+    x_vals = np.linspace(low - padding, high + padding, 400)
+
+    plt.figure(figsize=(10, 6))
+    plt.plot(x_vals, f(x_vals), label='$f(x)$', color='blue')
+    plt.axhline(0, color='black', linewidth=0.5)
+    colors = plt.cm.viridis(np.linspace(0, 1, max(len(brackets), 1)))
+    for idx, (a, b) in enumerate(brackets):
+        plt.plot([a, b], [0, 0], '|-', color=colors[idx], alpha=0.6)
+    plt.axvline(root, color='red', linestyle='--', label=f'Raíz aproximada: {root:.{result.precision}f}')
+    plt.scatter(root, 0, color='red', zorder=5)
+    plt.legend()
+    plt.xlabel('x')
+    plt.ylabel('f(x)')
+    plt.title(f'Método de {result.method.capitalize()}')
+    plt.grid(True)
+    plt.show()
+
+
+def main():
+    x = sp.symbols('x')
+    f_x = x**3 - 2*x - 5
+    a = 2
+    b = 3
+    tolerance = 1e-10
+    max_iterations = 100
+    precision = 10
+
+    result = brent(x, f_x, a, b, tolerance, max_iterations, precision, trace="full")
+    result.print_report()
+    result.plot()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+import numpy as np
+from common.instrumentation import profiled
+from common.lambdify_cache import cached_lambdify
+from common.lazy_imports import lazy_import
+
+plt = lazy_import("matplotlib.pyplot")
+sp = lazy_import("sympy")
+
+
+class ContinuationResult:
+    """
+    Rama de raíces de f(x; p) = 0 seguida a lo largo de los valores del parámetro.
+
+    roots[k] es la raíz para parameters[k] (nan si la rama se perdió antes),
+    iterations[k] los pasos de Newton del corrector y folds la lista de puntos de
+    retorno (p, x) detectados, donde df/dx = 0 y la rama deja de existir.
+    """
+
+    def __init__(self, parameters, roots, iterations, converged, folds, evaluations):
+        self.parameters = parameters
+        self.roots = roots
+        self.iterations = iterations
+        self.converged = converged
+        self.folds = folds
+        self.evaluations = evaluations
+
+    def plot(self):
+        plt.figure(figsize=(10, 6))
+        plt.plot(self.parameters, self.roots, '.-', label='Rama de raíces', color='blue')
+        for idx, (p_fold, x_fold) in enumerate(self.folds):
+            plt.scatter(p_fold, x_fold, color='red', zorder=5, label='Punto de retorno' if idx == 0 else None)
+        plt.xlabel('p')
+        plt.ylabel('x')
+        plt.title('Continuación de raíces')
+        plt.grid(True)
+        plt.legend()
+        plt.show()
+
+
+class ParametricFunction:
+    # f, df/dx, df/dp y las segundas derivadas usadas para ubicar los puntos de retorno
+    def __init__(self, x, p, f_expr):
+        args = (x, p)
+        f_x = sp.diff(f_expr, x)
+        self.f = cached_lambdify(args, f_expr, 'numpy')
+        self.f_x = cached_lambdify(args, f_x, 'numpy')
+        self.f_p = cached_lambdify(args, sp.diff(f_expr, p), 'numpy')
+        self.f_xx = cached_lambdify(args, sp.diff(f_x, x), 'numpy')
+        self.f_xp = cached_lambdify(args, sp.diff(f_x, p), 'numpy')
+        self.evaluations = 0
+
+    def correct(self, x_value, p_value, tolerance, max_steps):
+        for step in range(max_steps):
+            f_value = self.f(x_value, p_value)
+            slope = self.f_x(x_value, p_value)
+            self.evaluations += 2
+            if slope == 0 or not np.isfinite(slope):
+                return x_value, step + 1, False
+            x_new = x_value - f_value / slope
+            if not np.isfinite(x_new):
+                return x_value, step + 1, False
+            if abs(x_new - x_value) < tolerance:
+                return x_new, step + 1, True
+            x_value = x_new
+        return x_value, max_steps, False
+
+    def tangent(self, x_value, p_value):
+        # dx/dp = -f_p / f_x a lo largo de la rama
+        self.evaluations += 2
+        slope = self.f_x(x_value, p_value)
+        return -self.f_p(x_value, p_value) / slope if slope != 0 else 0.0
+
+    def locate_fold(self, x_value, p_value, tolerance, max_steps=30):
+        # Newton sobre el sistema extendido f = 0, df/dx = 0 en las incógnitas (x, p)
+        for _ in range(max_steps):
+            residual = np.array([self.f(x_value, p_value), self.f_x(x_value, p_value)], dtype=float)
+            jacobian = np.array([
+                [self.f_x(x_value, p_value), self.f_p(x_value, p_value)],
+                [self.f_xx(x_value, p_value), self.f_xp(x_value, p_value)],
+            ], dtype=float)
+            self.evaluations += 6
+            try:
+                step = np.linalg.solve(jacobian, -residual)
+            except np.linalg.LinAlgError:
+                return None
+            x_value, p_value = x_value + step[0], p_value + step[1]
+            if np.max(np.abs(step)) < tolerance:
+                return float(p_value), float(x_value)
+        return None
+
+
+@profiled
+def continuation(x, p, f_expr, parameter_values, initial_value, tolerance=1e-10, max_corrections=8,
+                 max_iterations=100, max_subdivisions=6):
+    """
+    Sigue la raíz de f(x; p) = 0 para cada valor de parameter_values.
+
+    f, df/dx y df/dp se compilan una sola vez. La primera raíz se obtiene con
+    Newton desde initial_value; cada raíz siguiente se predice desde la anterior
+    con la tangente dx/dp = -f_p / f_x y se corrige con a lo sumo max_corrections
+    pasos de Newton. Si el corrector falla, el paso en p se divide a la mitad hasta
+    max_subdivisions veces; si aun así falla, la rama se pierde en un punto de
+    retorno, que se ubica resolviendo f = 0, df/dx = 0 y se agrega a folds.
+
+    Retorna un ContinuationResult.
+    """
+    parameters = np.asarray(parameter_values, dtype=float)
+    function = ParametricFunction(x, p, f_expr)
+    roots = np.full(parameters.shape, np.nan)
+    iterations = np.zeros(parameters.shape, dtype=np.int64)
+    converged = np.zeros(parameters.shape, dtype=bool)
+    folds = []
+
+    if parameters.size == 0:
+        return ContinuationResult(parameters, roots, iterations, converged, folds, 0)
+
+    x_value, steps, ok = function.correct(float(initial_value), parameters[0], tolerance, max_iterations)
+    if not ok:
+        raise ValueError(f"Newton no convergió para el primer valor del parámetro p = {parameters[0]}.")
+    roots[0], iterations[0], converged[0] = x_value, steps, True
+    p_value = parameters[0]
+    slope_sign = np.sign(function.f_x(x_value, p_value))
+
+    for k in range(1, parameters.size):
+        x_next, p_reached, steps, ok = advance(
+            function, x_value, p_value, parameters[k], tolerance, max_corrections, max_subdivisions
+        )
+        if not ok:
+            # La rama se perdió: el punto de retorno está cerca del último punto alcanzado
+            fold = function.locate_fold(x_next, p_reached, tolerance)
+            folds.append(fold if fold is not None else (float(p_reached), float(x_next)))
+            break
+        new_sign = np.sign(function.f_x(x_next, parameters[k]))
+        if new_sign != slope_sign and new_sign != 0 and slope_sign != 0:
+            # df/dx cambió de signo: la rama pasó por un punto de retorno entre los dos valores
+            fold = function.locate_fold(x_value, p_value, tolerance)
+            if fold is not None:
+                folds.append(fold)
+        slope_sign = new_sign
+        x_value, p_value = x_next, parameters[k]
+        roots[k], iterations[k], converged[k] = x_value, steps, True
+
+    return ContinuationResult(parameters, roots, iterations, converged, folds, function.evaluations)
+
+
+def advance(function, x_value, p_value, p_target, tolerance, max_corrections, max_subdivisions):
+    # Predictor tangente + corrector de Newton; si el corrector falla el paso se divide
+    # a la mitad. Retorna el último punto alcanzado y si se llegó a p_target.
+    step = p_target - p_value
+    subdivisions = 0
+    total_steps = 0
+    while p_value != p_target:
+        remaining = p_target - p_value
+        if abs(step) >= abs(remaining):
+            step = remaining
+        predicted = x_value + function.tangent(x_value, p_value) * step
+        x_next, steps, ok = function.correct(predicted, p_value + step, tolerance, max_corrections)
+        total_steps += steps
+        if ok:
+            x_value, p_value = x_next, p_target if step == remaining else p_value + step
+            continue
+        subdivisions += 1
+        if subdivisions > max_subdivisions:
+            return x_value, p_value, total_steps, False
+        step /= 2
+    return x_value, p_value, total_steps, True
+
+
+def main():
+    x, p = sp.symbols('x p')
+    # La rama que parte de x = 2 desaparece en un punto de retorno cerca de p = 1
+    f_x = x**2 - p + 1 + sp.Rational(1, 10) * sp.sin(x * p)
+    parameter_values = np.linspace(5, 0, 200)
+    result = continuation(x, p, f_x, parameter_values, initial_value=2)
+    found = result.converged.sum()
+    print(f"Raíces encontradas: {found} de {len(parameter_values)}, evaluaciones: {result.evaluations}")
+    for p_fold, x_fold in result.folds:
+        print(f"Punto de retorno en p = {p_fold:.8f}, x = {x_fold:.8f}")
+    result.plot()
+
+
+if __name__ == "__main__":
+    main()
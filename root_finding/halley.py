@@ -0,0 +1,163 @@
+import math
+import time
+from functools import lru_cache
+
+import numpy as np
+from common.dual import derivatives, is_numeric_callable
+from common.instrumentation import profiled
+from common.lambdify_cache import DEFAULT_MAXSIZE, cached_lambdify
+from common.lazy_imports import lazy_import
+from root_finding.newton_raphson import plot_function
+from root_finding.root_result import RootResult
+
+sp = lazy_import("sympy")
+
+# Número de derivadas que usa cada método y su orden de convergencia
+HOUSEHOLDER_METHODS = {"newton": (1, 2), "halley": (2, 3), "householder": (3, 4)}
+TIMING_REPEATS = 3
+
+
+@lru_cache(maxsize=DEFAULT_MAXSIZE)
+def chosen_method(x, f_expr):
+    # Caché LRU acotada, como la de cached_lambdify: guarda por expresión un diccionario
+    # que choose_method llena con el método elegido la primera vez
+    return {}
+
+
+def fused_evaluator(x, f_expr, order):
+    """
+    Retorna una función que da (f, f', ..., f^(order)) en una sola llamada.
+
+    Con una expresión de sympy las derivadas se compilan juntas con eliminación de
+    subexpresiones comunes; con una función de Python se usan duales anidados.
+    """
+    if is_numeric_callable(f_expr):
+        return lambda value: derivatives(f_expr, value, order)
+    expressions = [f_expr]
+    for _ in range(order):
+        expressions.append(sp.diff(expressions[-1], x))
+    return cached_lambdify(x, expressions, 'numpy', cse=True)
+
+
+def choose_method(x, f_expr, initial_value):
+    # Índice de eficiencia log(orden) / tiempo por llamada: gana el método que más
+    # dígitos gana por segundo, medido con el mejor de TIMING_REPEATS llamadas.
+    # La elección se guarda por expresión, así que solo la primera llamada paga la medición
+    choice = chosen_method(x, f_expr)
+    if "method" in choice:
+        return choice["method"], 0
+    best, best_index, evaluations = None, -np.inf, 0
+    for method, (order, convergence) in HOUSEHOLDER_METHODS.items():
+        evaluate = fused_evaluator(x, f_expr, order)
+        seconds = np.inf
+        for _ in range(TIMING_REPEATS):
+            start = time.perf_counter()
+            evaluate(initial_value)
+            seconds = min(seconds, time.perf_counter() - start)
+        evaluations += TIMING_REPEATS * (order + 1)
+        index = math.log(convergence) / max(seconds, 1e-9)
+        if index > best_index:
+            best, best_index = method, index
+    choice["method"] = best
+    return best, evaluations
+
+
+def householder_step(values):
+    f, f_prime = values[0], values[1]
+    if len(values) == 2:
+        return f, f_prime
+    f_second = values[2]
+    if len(values) == 3:
+        return 2 * f * f_prime, 2 * f_prime ** 2 - f * f_second
+    f_third = values[3]
+    numerator = 6 * f * f_prime ** 2 - 3 * f ** 2 * f_second
+    denominator = 6 * f_prime ** 3 - 6 * f * f_prime * f_second + f ** 2 * f_third
+    return numerator, denominator
+
+
+@profiled
+def householder(x, f_expr, initial_value, method="auto", max_iterations=100, precision=8, trace="summary"):
+    """
+    Métodos de Householder: "newton" (orden 2), "halley" (orden 3) y
+    "householder" (orden 4, usa hasta f''').
+
+    f y sus derivadas se compilan en una sola función con subexpresiones comunes,
+    así cada iteración hace una única llamada. Con method="auto" se mide el costo
+    de una llamada de cada variante en initial_value y se elige la de mayor índice
+    de eficiencia log(orden) / tiempo. f_expr también puede ser una función de
+    Python escrita con NumPy (las derivadas salen de duales anidados).
+
+    evaluations cuenta los valores calculados (f y cada derivada), incluidas las
+    llamadas de la medición automática.
+    """
+    timing_evaluations = 0
+    if method == "auto":
+        method, timing_evaluations = choose_method(x, f_expr, float(initial_value))
+    if method not in HOUSEHOLDER_METHODS:
+        raise ValueError(f"Método desconocido: {method}. Opciones: auto, {', '.join(HOUSEHOLDER_METHODS)}")
+    order = HOUSEHOLDER_METHODS[method][0]
+    evaluate = fused_evaluator(x, f_expr, order)
+    f = f_expr if is_numeric_callable(f_expr) else cached_lambdify(x, f_expr, 'numpy')
+
+    tolerance = 10 ** -precision
+    result = RootResult(
+        method,
+        ["x", "f(x)", "Resultado", "Error abs", "Error rel %"],
+        max_iterations, trace, precision, function=f, plotter=plot_result
+    )
+    result.evaluations = timing_evaluations
+    full_trace = result.trace
+    x_current = initial_value
+
+    for iteration in range(max_iterations):
+        values = evaluate(x_current)
+        result.evaluations += order + 1
+        numerator, denominator = householder_step(values)
+
+        if values[0] == 0:
+            return result.finish(x_current, iteration + 1, 0.0, 0.0)
+        if denominator == 0:
+            raise ZeroDivisionError(f"Denominador cero en x = {x_current}. No se puede continuar.")
+
+        x_new = x_current - numerator / denominator
+        abs_error = abs(x_new - x_current)
+        rel_error = abs((x_new - x_current) * 100 / x_new) if x_new != 0 else np.inf
+
+        if full_trace is not None:
+            full_trace[iteration] = (x_current, values[0], x_new, abs_error, rel_error)
+
+        if abs_error < tolerance:
+            return result.finish(x_new, iteration + 1, abs_error, rel_error)
+
+        x_current = x_new
+
+    raise ValueError("El método no convergió dentro del número máximo de iteraciones.")
+
+
+def halley(x, f_expr, initial_value, max_iterations=100, precision=8, trace="summary"):
+    return householder(x, f_expr, initial_value, "halley", max_iterations, precision, trace)
+
+
+def plot_result(result):
+    iterations = []
+    if result.records_trace:
+        # Cada paso se dibuja como (x, f(x)) -> x siguiente, igual que en Newton
+        history = result.history()
+        iterations = np.column_stack([history[:, 0], history[:, 1], history[:, 1], history[:, 2]])
+    plot_function(result.function, result.root, result.precision, iterations)
+
+
+def main():
+    x = sp.symbols('x')
+    f_x = x**3 - sp.sin(x) - 5
+    for method in ("newton", "halley", "householder", "auto"):
+        result = householder(x, f_x, 2, method, precision=12)
+        print(f"{result.method:>12}: raíz {result.root:.12f}, iteraciones {result.iterations}, "
+              f"evaluaciones {result.evaluations}")
+    result = halley(x, f_x, 2, precision=8, trace="full")
+    result.print_report()
+    result.plot()
+
+
+if __name__ == "__main__":
+    main()
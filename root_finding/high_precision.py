@@ -0,0 +1,139 @@
+import numpy as np
+from common.dual import is_numeric_callable
+from common.instrumentation import profiled
+from common.lambdify_cache import cached_lambdify
+from common.lazy_imports import lazy_import
+from root_finding.root_result import RootResult
+
+mpmath = lazy_import("mpmath")
+plt = lazy_import("matplotlib.pyplot")
+sp = lazy_import("sympy")
+
+FLOAT_DIGITS = 15
+GUARD_DIGITS = 10
+FLOAT_TOLERANCE = 1e-12
+
+
+@profiled
+def newton_high_precision(x, f_expr, initial_value, precision=50, max_iterations=100, trace="summary"):
+    """
+    Newton-Raphson con precisión arbitraria (mpmath) para precision > 15 decimales.
+
+    Las primeras iteraciones se hacen en float64 hasta que el paso relativo baja de
+    1e-12. Desde ahí cada paso de Newton se hace en mpmath con el doble de dígitos
+    correctos que dejó el paso anterior (convergencia cuadrática), más GUARD_DIGITS
+    de guarda, hasta llegar a la precisión pedida. Así solo el último paso se paga
+    con todos los dígitos.
+
+    Las constantes Float de f_expr (0.1, 2.5) solo tienen unos 15 dígitos, así que
+    limitarían la raíz a esa precisión: en la etapa mpmath se reemplazan por el
+    racional que escriben (0.1 -> 1/10). Si la constante ya era una aproximación
+    (3.14159 en lugar de pi), la raíz es la de f con esa constante; conviene usar
+    las constantes exactas de sympy.
+
+    Retorna un RootResult cuya raíz es un mpmath.mpf; la traza registra los
+    dígitos de trabajo de cada paso (15 en la etapa float64).
+    """
+    if is_numeric_callable(f_expr):
+        raise ValueError("La precisión arbitraria requiere una expresión de sympy para evaluar f con mpmath.")
+    f = cached_lambdify(x, f_expr, 'numpy')
+    f_prime = cached_lambdify(x, sp.diff(f_expr, x), 'numpy')
+    tolerance = mpmath.mpf(10) ** -precision
+    result = RootResult(
+        "newton_high_precision",
+        ["Dígitos", "x", "Error abs"],
+        max_iterations, trace, precision, function=f, plotter=plot_result
+    )
+    full_trace = result.trace
+
+    # Etapa en float64
+    x_current = float(initial_value)
+    iteration = 0
+    while True:
+        if iteration >= max_iterations:
+            raise ValueError("El método no convergió dentro del número máximo de iteraciones.")
+        f_current, f_prime_current = f(x_current), f_prime(x_current)
+        result.evaluations += 2
+        if f_prime_current == 0:
+            raise ZeroDivisionError(f"Derivada cero en x = {x_current}. No se puede continuar.")
+        step = f_current / f_prime_current
+        x_current -= step
+        iteration += 1
+        if full_trace is not None:
+            full_trace[iteration - 1] = (FLOAT_DIGITS, x_current, abs(step))
+        if not np.isfinite(x_current):
+            raise ValueError("Newton divergió en la etapa de doble precisión.")
+        if abs(step) <= FLOAT_TOLERANCE * max(1.0, abs(x_current)) or f_current == 0:
+            break
+
+    # Etapa en mpmath: los dígitos de trabajo se duplican en cada paso
+    exact_expr = exact_constants(f_expr)
+    f_mp = cached_lambdify(x, exact_expr, 'mpmath')
+    f_prime_mp = cached_lambdify(x, sp.diff(exact_expr, x), 'mpmath')
+    integer_digits = max(int(np.log10(abs(x_current))) + 1, 1) if x_current != 0 else 1
+    target = precision + integer_digits + GUARD_DIGITS
+    known = FLOAT_DIGITS
+    x_mp = mpmath.mpf(x_current)
+
+    while iteration < max_iterations:
+        digits = min(2 * known + GUARD_DIGITS, target)
+        with mpmath.workdps(digits):
+            x_mp = +x_mp
+            slope = f_prime_mp(x_mp)
+            if slope == 0:
+                raise ZeroDivisionError(f"Derivada cero en x = {x_mp}. No se puede continuar.")
+            step = f_mp(x_mp) / slope
+            x_mp = x_mp - step
+        result.evaluations += 2
+        iteration += 1
+        abs_step = abs(step)
+        if full_trace is not None:
+            full_trace[iteration - 1] = (digits, float(x_mp), float(abs_step))
+
+        # El error después del paso es del orden de |f''/2f'| paso²: los dígitos de guarda
+        # cubren la constante, así que un paso de la mitad de los dígitos ya basta
+        if digits == target and (abs_step < tolerance or abs_step ** 2 * 10 ** GUARD_DIGITS < tolerance):
+            with mpmath.workdps(target):
+                rel_error = abs(step * 100 / x_mp) if x_mp != 0 else mpmath.inf
+            return result.finish(x_mp, iteration, abs_step, rel_error)
+        if step == 0:
+            known = target
+        else:
+            scale = max(abs(x_mp), 1)
+            known = max(min(int(-2 * mpmath.log10(abs_step / scale)), target), 1)
+
+    raise ValueError("El método no convergió dentro del número máximo de iteraciones.")
+
+
+def exact_constants(f_expr):
+    # Las constantes Float pasan al racional de su representación decimal
+    if not f_expr.has(sp.Float):
+        return f_expr
+    return sp.nsimplify(f_expr, rational=True)
+
+
+def plot_result(result):
+    root = float(result.root)
+    x_vals = np.linspace(root - 5, root + 5, 400)
+    plt.figure(figsize=(12, 8))
+    plt.plot(x_vals, result.function(x_vals), label='$f(x)$', color='blue')
+    plt.axhline(0, color='black', linewidth=0.5)
+    plt.axvline(root, color='red', linestyle='--', label=f'Raíz aproximada: {root:.{FLOAT_DIGITS}f}')
+    plt.scatter(root, 0, color='red', zorder=5)
+    plt.legend()
+    plt.xlabel('x')
+    plt.ylabel('f(x)')
+    plt.title('Newton-Raphson con precisión arbitraria')
+    plt.grid(True)
+    plt.show()
+
+
+def main():
+    x = sp.symbols('x')
+    f_x = x**3 - sp.sin(x) - 5
+    result = newton_high_precision(x, f_x, initial_value=2, precision=200, trace="full")
+    result.print_report()
+
+
+if __name__ == "__main__":
+    main()
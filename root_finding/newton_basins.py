@@ -0,0 +1,177 @@
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from common.instrumentation import profiled
+from common.lambdify_cache import cached_lambdify
+from common.lazy_imports import lazy_import
+from root_finding.newton_raphson import derivative_evaluator, newton_batch_kernel
+from root_finding.polynomial_roots import polynomial_coefficients, polynomial_roots
+
+plt = lazy_import("matplotlib.pyplot")
+sp = lazy_import("sympy")
+
+NOT_CONVERGED = -1
+
+
+class BasinMap:
+    """
+    Mapas de cuencas de atracción de Newton sobre una grilla compleja.
+
+    root_index[i, j] es el índice en roots de la raíz a la que converge el punto
+    de partida (NOT_CONVERGED si no converge) e iterations[i, j] las iteraciones
+    usadas. La fila 0 corresponde a la parte imaginaria mayor. Ambos mapas son
+    archivos .npy abiertos como memmap en directory.
+    """
+
+    def __init__(self, directory, roots, real_range, imag_range):
+        self.directory = directory
+        self.roots = roots
+        self.real_range = real_range
+        self.imag_range = imag_range
+        self.root_index = np.load(os.path.join(directory, "root_index.npy"), mmap_mode='r')
+        self.iterations = np.load(os.path.join(directory, "iterations.npy"), mmap_mode='r')
+
+    @property
+    def shape(self):
+        return self.root_index.shape
+
+    def plot(self, max_pixels=1000):
+        # Para grillas grandes se grafica una versión submuestreada
+        step = max(1, int(np.ceil(max(self.shape) / max_pixels)))
+        index = np.asarray(self.root_index[::step, ::step])
+        iterations = np.asarray(self.iterations[::step, ::step])
+        extent = (*self.real_range, *self.imag_range)
+
+        shade = 1 - 0.7 * iterations / max(iterations.max(), 1)
+        colors = plt.cm.tab10(np.mod(index, 10))[..., :3] * shade[..., None]
+        colors[index == NOT_CONVERGED] = 0
+
+        plt.figure(figsize=(10, 10))
+        plt.imshow(colors, extent=extent, origin='upper')
+        plt.scatter(self.roots.real, self.roots.imag, color='white', edgecolors='black', zorder=5, label='Raíces')
+        plt.legend()
+        plt.xlabel('Re(z)')
+        plt.ylabel('Im(z)')
+        plt.title('Cuencas de atracción del método de Newton')
+        plt.show()
+
+
+@profiled
+def newton_basins(x, f_expr, real_range, imag_range, resolution, roots=None, max_iterations=50, tolerance=1e-10,
+                  tile_size=512, workers=None, output_dir=None):
+    """
+    Ejecuta Newton sobre una grilla compleja de resolution = (ancho, alto) puntos.
+
+    La grilla se procesa por bloques de tile_size x tile_size repartidos en un
+    ProcessPoolExecutor (workers=1 lo ejecuta en el proceso actual), y cada bloque
+    escribe directamente en los memmap de output_dir, así que los mapas no necesitan
+    caber en memoria. Si no se indican las raíces se usan las del polinomio o, si
+    f_expr no es un polinomio, las que se encuentran en una pasada gruesa.
+
+    Retorna un BasinMap.
+    """
+    width, height = resolution
+    if width < 2 or height < 2:
+        raise ValueError("La resolución debe tener al menos 2 puntos por eje.")
+    if roots is None:
+        roots = find_roots(x, f_expr, real_range, imag_range, max_iterations, tolerance)
+    roots = np.asarray(roots, dtype=complex)
+
+    if output_dir is None:
+        output_dir = tempfile.mkdtemp(prefix="newton_basins_")
+    os.makedirs(output_dir, exist_ok=True)
+    index_path = os.path.join(output_dir, "root_index.npy")
+    iterations_path = os.path.join(output_dir, "iterations.npy")
+    index_dtype = np.int8 if len(roots) < 127 else np.int32
+    np.lib.format.open_memmap(index_path, mode='w+', dtype=index_dtype, shape=(height, width))
+    np.lib.format.open_memmap(iterations_path, mode='w+', dtype=np.int32, shape=(height, width))
+
+    grid = (real_range, imag_range, width, height)
+    f_prime_expr = sp.diff(f_expr, x)
+    tasks = [
+        (x, f_expr, f_prime_expr, grid, (row, min(row + tile_size, height)), (col, min(col + tile_size, width)),
+         roots, max_iterations, tolerance, index_path, iterations_path)
+        for row in range(0, height, tile_size)
+        for col in range(0, width, tile_size)
+    ]
+
+    if workers == 1 or len(tasks) == 1:
+        for task in tasks:
+            basin_tile(task)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # list() propaga cualquier excepción de los procesos
+            list(executor.map(basin_tile, tasks))
+
+    return BasinMap(output_dir, roots, real_range, imag_range)
+
+
+def basin_tile(task):
+    x, f_expr, f_prime_expr, grid, rows, cols, roots, max_iterations, tolerance, index_path, iterations_path = task
+    # Cada proceso compila una sola vez gracias a la caché de lambdify
+    f = cached_lambdify(x, f_expr, 'numpy')
+    f_prime = cached_lambdify(x, f_prime_expr, 'numpy')
+
+    z = grid_points(grid, rows, cols)
+    result = newton_batch_kernel(lambda values: (f(values), f_prime(values)), z, tolerance, max_iterations)
+    index = classify(result['root'], result['converged'], roots, tolerance)
+
+    root_index = np.load(index_path, mmap_mode='r+')
+    iterations = np.load(iterations_path, mmap_mode='r+')
+    root_index[rows[0]:rows[1], cols[0]:cols[1]] = index
+    iterations[rows[0]:rows[1], cols[0]:cols[1]] = result['iterations']
+    root_index.flush()
+    iterations.flush()
+
+
+def grid_points(grid, rows, cols):
+    (re_min, re_max), (im_min, im_max), width, height = grid
+    re = re_min + (re_max - re_min) * np.arange(*cols) / (width - 1)
+    im = im_max - (im_max - im_min) * np.arange(*rows) / (height - 1)
+    return re[None, :] + 1j * im[:, None]
+
+
+def classify(points, converged, roots, tolerance):
+    if len(roots) == 0:
+        return np.full(points.shape, NOT_CONVERGED)
+    distances = np.abs(points[..., None] - roots)
+    index = np.argmin(distances, axis=-1)
+    # Se acepta la raíz más cercana solo si el punto final está a distancia relativa pequeña
+    close = np.take_along_axis(distances, index[..., None], axis=-1)[..., 0]
+    limit = max(1e3 * tolerance, 1e-6) * np.maximum(1.0, np.abs(roots[index]))
+    return np.where(converged & (close <= limit), index, NOT_CONVERGED)
+
+
+def find_roots(x, f_expr, real_range, imag_range, max_iterations, tolerance, samples=64):
+    coefficients = polynomial_coefficients(x, f_expr)
+    if coefficients is not None and len(coefficients) > 1:
+        return polynomial_roots(np.array(coefficients))
+
+    _, evaluate, _ = derivative_evaluator(x, f_expr)
+    z = grid_points((real_range, imag_range, samples, samples), (0, samples), (0, samples))
+    result = newton_batch_kernel(evaluate, z, tolerance, max_iterations)
+    candidates = result['root'][result['converged']]
+
+    roots = []
+    for candidate in candidates:
+        if all(abs(candidate - root) > max(1e3 * tolerance, 1e-6) * max(1.0, abs(root)) for root in roots):
+            roots.append(candidate)
+    return np.array(roots, dtype=complex)
+
+
+def main():
+    x = sp.symbols('x')
+    f_x = x**3 - 1
+    basins = newton_basins(x, f_x, (-2, 2), (-2, 2), (2000, 2000), tile_size=500)
+    print(f"Mapas guardados en: {basins.directory}")
+    for idx, root in enumerate(basins.roots):
+        share = np.mean(basins.root_index == idx) * 100
+        print(f"Raíz {idx}: {root:.8f} ({share:.2f}% de la grilla)")
+    print(f"Sin converger: {np.mean(basins.root_index == NOT_CONVERGED) * 100:.2f}%")
+    basins.plot()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,64 +1,240 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from tabulate import tabulate
-import sympy as sp
+from common.dual import derivative, is_numeric_callable
+from common.instrumentation import profiled
+from common.lambdify_cache import cached_lambdify
+from common.lazy_imports import lazy_import
+from root_finding.high_precision import FLOAT_DIGITS, newton_high_precision
+from root_finding.polynomial_roots import nearest_real_root
+from root_finding.root_result import RootResult
 
+plt = lazy_import("matplotlib.pyplot")
+sp = lazy_import("sympy")
 
-def newton_raphson(x, f_expr, initial_value, max_iterations=100, precision=8):
-    f_prime_expr = sp.diff(f_expr, x)
-    f = sp.lambdify(x, f_expr, 'numpy')
-    f_prime = sp.lambdify(x, f_prime_expr, 'numpy')
+# La multiplicidad estimada se adopta cuando se repite en STABLE_ESTIMATES pasos seguidos
+# y el paso ya es menor que SMALL_STEP * max(1, |x|): lejos de la raíz Newton también
+# avanza lento y la razón entre pasos no indica multiplicidad
+STABLE_ESTIMATES = 3
+SMALL_STEP = 1e-2
+
+
+@profiled
+def newton_raphson(x, f_expr, initial_value, max_iterations=100, precision=8, trace="summary",
+                   polynomial_fast_path=False, multiplicity=1, known_roots=()):
+    """
+    Con polynomial_fast_path=True, si f_expr es un polinomio y no se pide la traza
+    completa, todas las raíces se calculan de una vez (ver
+    root_finding.polynomial_roots): se retorna la raíz real más cercana a
+    initial_value, que no siempre es a la que llegaría la iteración, y result.roots
+    contiene todas las raíces.
+
+    f_expr también puede ser una función de Python escrita con NumPy (x se ignora):
+    f y f' se obtienen juntas con números duales, en una sola evaluación por iteración.
+
+    Con precision > 15 (más de lo que da float64) se usa newton_high_precision y la
+    raíz es un mpmath.mpf (ver ahí el tratamiento de las constantes Float). Ese
+    modo no admite multiplicity, known_roots ni polynomial_fast_path: combinarlos
+    lanza ValueError.
+
+    Raíces múltiples: multiplicity puede ser un entero fijo m (se usa el paso
+    modificado x - m f/f', que vuelve a converger cuadráticamente) o "auto": m se
+    estima a partir del cociente de pasos consecutivos (en una raíz de
+    multiplicidad m Newton avanza con razón 1 - 1/m), solo cerca de la raíz y
+    cuando la estimación es estable; si un paso con m > 1 hace crecer |f|, se
+    vuelve al punto anterior con m = 1. result.multiplicity guarda la m usada.
+
+    known_roots deflaciona raíces ya encontradas (repetidas según su multiplicidad):
+    se aplica Newton a f(x) / prod(x - r), sin recompilar f, para que llamadas
+    sucesivas encuentren raíces distintas.
+    """
+    if precision > FLOAT_DIGITS:
+        if multiplicity != 1 or len(known_roots) or polynomial_fast_path:
+            raise ValueError(
+                "multiplicity, known_roots y polynomial_fast_path no se combinan con precision > "
+                f"{FLOAT_DIGITS}."
+            )
+        return newton_high_precision(x, f_expr, initial_value, precision, max_iterations, trace)
+    f, evaluate, evaluations_per_step = derivative_evaluator(x, f_expr)
+    known_roots = np.asarray(known_roots, dtype=float)
 
     tolerance = 10 ** -precision
+    result = RootResult(
+        "newton_raphson",
+        ["x", "f(x)", "f'(x)", "Resultado", "Error abs", "Error rel %", "m"],
+        max_iterations, trace, precision, function=f, plotter=plot_result
+    )
+    estimating = multiplicity == "auto"
+    result.multiplicity = 1 if estimating else int(multiplicity)
+    if result.multiplicity < 1:
+        raise ValueError("La multiplicidad debe ser un entero positivo.")
+    if (polynomial_fast_path and not result.records_trace and not is_numeric_callable(f_expr)
+            and known_roots.size == 0):
+        if finish_polynomial(result, x, f_expr, [initial_value], tolerance):
+            return result
+    full_trace = result.trace
     x_current = initial_value
-    counts = []
-    iterations = []
+    previous_step = None
+    previous_estimate = None
+    streak = 0
+    # (x, f, f') antes del último paso con m > 1 estimada, para deshacerlo si empeora f
+    before_step = None
 
     for iteration in range(max_iterations):
-        f_current = f(x_current)
-        f_prime_current = f_prime(x_current)
+        f_current, f_prime_current = evaluate(x_current)
+        result.evaluations += evaluations_per_step
 
+        if f_current == 0:
+            # Raíz exacta, aunque f' también sea cero (raíz múltiple)
+            if full_trace is not None:
+                full_trace[iteration] = (x_current, 0.0, f_prime_current, x_current, 0.0, 0.0, result.multiplicity)
+            return result.finish(x_current, iteration + 1, 0.0, 0.0)
+        if known_roots.size:
+            # (f / prod(x - r))' / (f / prod(x - r)) = f'/f - sum 1/(x - r)
+            f_prime_current = f_prime_current - f_current * np.sum(1 / (x_current - known_roots))
+        if before_step is not None and abs(f_current) > abs(before_step[1]):
+            x_current, f_current, f_prime_current = before_step
+            result.multiplicity = 1
+            previous_step, previous_estimate, streak = None, None, 0
+        before_step = None
         if f_prime_current == 0:
             raise ZeroDivisionError(f"Derivada cero en x = {x_current}. No se puede continuar.")
 
-        x_new = x_current - f_current / f_prime_current
+        newton_step = f_current / f_prime_current
+        near_root = tolerance < abs(newton_step) <= SMALL_STEP * max(1.0, abs(x_current))
+        if estimating and previous_step is not None and near_root:
+            previous_estimate, streak = estimate_multiplicity(
+                result, newton_step, previous_step, previous_estimate, streak
+            )
+        elif estimating:
+            previous_estimate, streak = None, 0
+        previous_step = newton_step
+        if estimating and result.multiplicity > 1:
+            before_step = (x_current, f_current, f_prime_current)
+
+        x_new = x_current - result.multiplicity * newton_step
         abs_error = abs(x_new - x_current)
-        rel_error = abs((x_new - x_current) * 100 / x_new)
-
-        if iteration < 3:
-            print(f"\nIteración {iteration + 1}:")
-            print(f"f({x_current}) = {round(f_current, precision)}")
-            print(f"f'({x_current}) = {round(f_prime_current, precision)}")
-            print(f"x_{iteration + 1} = {round(x_current, precision)} - ({round(f_current, precision)} / {round(f_prime_current, precision)}) = {round(x_new, precision)}")
-            print(f"Error abs = {round(abs_error, precision)}")
-            print(f"Error rel = {round(rel_error, 2)} %")
-
-        counts.append([
-            iteration + 1,
-            round(x_current, precision),
-            round(x_new, precision),
-            round(abs_error, precision),
-            f"{round(rel_error, 2)} %"
-        ])
-        iterations.append((x_current, f_current, f_prime_current, x_new))
+        rel_error = abs((x_new - x_current) * 100 / x_new) if x_new != 0 else np.inf
+
+        if full_trace is not None:
+            full_trace[iteration] = (
+                x_current, f_current, f_prime_current, x_new, abs_error, rel_error, result.multiplicity
+            )
 
         if abs_error < tolerance:
-            print("\nResumen de Iteraciones:")
-            print(tabulate(
-                counts,
-                headers=["Iteración", "x", "Resultado", "Error abs", "Error rel"],
-                floatfmt=f".{precision}f",
-                tablefmt="grid"
-            ))
-            plot_function(f, root=x_new, precision=precision, iterations=iterations)
-            print(f"\nRaíz encontrada: {x_new:.{precision}f}")
-            return x_new
+            return result.finish(x_new, iteration + 1, abs_error, rel_error)
 
         x_current = x_new
 
     raise ValueError("El método no convergió dentro del número máximo de iteraciones.")
 
 
+def estimate_multiplicity(result, step, previous_step, previous_estimate, streak):
+    # Con pasos x - c f/f' cerca de una raíz de multiplicidad m, step / previous_step tiende
+    # a 1 - c/m, así que m = c / (1 - razón). La m cambia cuando STABLE_ESTIMATES estimaciones
+    # seguidas coinciden; una vez que converge cuadráticamente la razón tiende a 0 y la
+    # estimación a c. Retorna la estimación y cuántas veces seguidas se repitió.
+    ratio = step / previous_step
+    if not 0 <= ratio < 1:
+        return None, 0
+    estimate = max(int(round(result.multiplicity / (1 - ratio))), 1)
+    streak = streak + 1 if estimate == previous_estimate else 1
+    if streak >= STABLE_ESTIMATES:
+        result.multiplicity = estimate
+    return estimate, streak
+
+
+def derivative_evaluator(x, f_expr):
+    # Retorna f, una función que da (f(x), f'(x)) y cuántas evaluaciones cuesta cada llamada
+    if is_numeric_callable(f_expr):
+        return f_expr, lambda value: derivative(f_expr, value), 1
+    f = cached_lambdify(x, f_expr, 'numpy')
+    f_prime = cached_lambdify(x, sp.diff(f_expr, x), 'numpy')
+    return f, lambda value: (f(value), f_prime(value)), 2
+
+
+def finish_polynomial(result, x, f_expr, starting_points, tolerance):
+    found = nearest_real_root(x, f_expr, starting_points, tolerance)
+    if found is None:
+        return False
+    root, roots, correction = found
+    # Un paso de Newton sobre todas las raíces: p y p' en cada una
+    result.evaluations += 2 * len(roots)
+    result.roots = roots
+    result.finish(root, 1, correction, abs(correction * 100 / root) if root != 0 else np.inf)
+    return True
+
+
+@profiled
+def newton_raphson_batch(x, f_expr, initial_values, max_iterations=100, precision=8):
+    """
+    Aplica Newton-Raphson a un arreglo de valores iniciales en paralelo.
+
+    Todos los valores avanzan a la vez usando f y f' evaluadas sobre arreglos;
+    los carriles que convergen se retiran de las iteraciones siguientes. Si f_expr
+    es una función de Python, f y f' salen de una sola pasada con números duales.
+
+    Retorna un arreglo estructurado con la forma de initial_values y los campos
+    'root', 'iterations', 'abs_error' y 'converged'.
+    """
+    _, evaluate, _ = derivative_evaluator(x, f_expr)
+    return newton_batch_kernel(evaluate, initial_values, 10 ** -precision, max_iterations)
+
+
+def newton_batch_kernel(evaluate, initial_values, tolerance, max_iterations):
+    # evaluate(valores) retorna (f, f') sobre el arreglo, como en derivative_evaluator
+    x0 = np.asarray(initial_values)
+    dtype = np.result_type(x0.dtype, np.float64)
+    x_current = x0.astype(dtype).ravel()
+    size = x_current.size
+
+    iterations = np.zeros(size, dtype=np.int64)
+    abs_error = np.full(size, np.inf)
+    converged = np.zeros(size, dtype=bool)
+    active = np.arange(size)
+
+    for iteration in range(max_iterations):
+        if active.size == 0:
+            break
+        x_active = x_current[active]
+        # lambdify devuelve un escalar cuando la expresión (o su derivada) es constante
+        f_current, f_prime_current = (np.broadcast_to(values, x_active.shape) for values in evaluate(x_active))
+
+        # Los carriles con derivada cero se detienen; si f también es cero ya están en la raíz
+        exact_root = f_current == 0
+        zero_slope = (f_prime_current == 0) & ~exact_root
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_new = np.where(exact_root, x_active, x_active - f_current / f_prime_current)
+        error = np.abs(x_new - x_active)
+        valid = ~zero_slope & np.isfinite(x_new)
+
+        updated = active[valid]
+        x_current[updated] = x_new[valid]
+        abs_error[updated] = error[valid]
+        iterations[active] = iteration + 1
+
+        done = valid & (error < tolerance)
+        converged[active[done]] = True
+        active = active[valid & ~done]
+
+    result = np.zeros(x0.shape, dtype=[
+        ('root', dtype),
+        ('iterations', np.int64),
+        ('abs_error', np.float64),
+        ('converged', np.bool_),
+    ])
+    result['root'] = x_current.reshape(x0.shape)
+    result['iterations'] = iterations.reshape(x0.shape)
+    result['abs_error'] = abs_error.reshape(x0.shape)
+    result['converged'] = converged.reshape(x0.shape)
+    return result
+
+
+def plot_result(result):
+    iterations = []
+    if result.records_trace:
+        iterations = result.history()[:, :4]
+    plot_function(result.function, result.root, result.precision, iterations)
+
+
 def plot_function(fx, root, precision, iterations):
     range_ = 5
     x_vals = np.linspace(root - range_, root + range_, 400)
@@ -90,7 +266,9 @@ def main():
     initial_value = 2
     precision = 8
     max_iterations = 100
-    newton_raphson(x, f_x, initial_value, max_iterations, precision)
+    result = newton_raphson(x, f_x, initial_value, max_iterations, precision, trace="full")
+    result.print_report()
+    result.plot()
 
 
 if __name__ == "__main__":
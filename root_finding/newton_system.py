@@ -0,0 +1,311 @@
+import time
+
+import numpy as np
+from common.dual import is_numeric_callable, jacobian as dual_jacobian
+from common.instrumentation import profiled
+from common.lambdify_cache import cached_lambdify
+from common.lazy_imports import lazy_import
+from dynamic_systems.jacobian import compute_jacobian_matrix
+from root_finding.root_result import RootResult
+
+sp = lazy_import("sympy")
+linalg = lazy_import("scipy.linalg")
+
+UPDATE_MODES = ("auto", "newton", "chord", "broyden")
+
+
+class CompiledSystem:
+    """
+    F y su Jacobiana compiladas una sola vez con lambdify (con eliminación de
+    subexpresiones comunes). Aceptan un vector de forma (n,) o un lote (m, n).
+    """
+
+    def __init__(self, variables, functions, simplify=False):
+        self.variables = tuple(variables)
+        self.functions = [sp.sympify(function) for function in functions]
+        self.size = len(self.variables)
+        if len(self.functions) != self.size:
+            raise ValueError("El sistema debe tener tantas ecuaciones como incógnitas.")
+        jacobian = compute_jacobian_matrix(self.functions, self.variables, simplify=simplify)
+        self.jacobian_expr = jacobian
+        self.F = cached_lambdify(self.variables, self.functions, 'numpy', cse=True)
+        self.J = cached_lambdify(self.variables, list(jacobian), 'numpy', cse=True)
+
+    def residual(self, point):
+        return stack_entries(self.F(*np.moveaxis(point, -1, 0)), point.shape[:-1])
+
+    def jacobian(self, point):
+        entries = stack_entries(self.J(*np.moveaxis(point, -1, 0)), point.shape[:-1])
+        return entries.reshape(*point.shape[:-1], self.size, self.size)
+
+
+class CallableSystem:
+    """
+    Sistema dado como función de Python func(*variables) -> secuencia de n valores.
+    La Jacobiana se obtiene con números duales (n pasadas en modo directo).
+    """
+
+    def __init__(self, func, size):
+        self.func = func
+        self.size = size
+
+    def residual(self, point):
+        return stack_entries(self.func(*np.moveaxis(point, -1, 0)), point.shape[:-1])
+
+    def jacobian(self, point):
+        _, jacobian = dual_jacobian(self.func, np.moveaxis(point, -1, 0))
+        # (n, n, lote...) -> (lote..., n, n)
+        return np.moveaxis(jacobian, (0, 1), (-2, -1))
+
+
+def compile_system(variables, functions, size):
+    if is_numeric_callable(functions):
+        return CallableSystem(functions, size)
+    return CompiledSystem(variables, functions)
+
+
+def stack_entries(entries, batch_shape):
+    # Las entradas constantes de lambdify vuelven como escalares: se llevan a la forma del lote
+    return np.stack([np.broadcast_to(np.asarray(e, dtype=float), batch_shape) for e in entries], axis=-1)
+
+
+@profiled
+def newton_system(variables, functions, initial_values, tolerance=1e-10, max_iterations=100, update="auto",
+                  line_search=True, max_broyden_updates=20, precision=8, trace="summary"):
+    """
+    Newton-Raphson para sistemas de n ecuaciones con n incógnitas.
+
+    F y J se compilan una vez; cada paso resuelve J dx = -F con una factorización
+    LU (nunca se forma la inversa). update controla cuándo se recalcula J:
+    - "newton": en cada iteración.
+    - "chord": se reutiliza la factorización mientras ||F|| baje al menos a la mitad.
+    - "broyden": actualizaciones de rango uno de Broyden sobre la factorización
+      inicial (fórmula de Sherman-Morrison en forma de producto).
+    - "auto": "broyden" si evaluar y factorizar J cuesta bastante más que evaluar F,
+      "newton" en otro caso.
+    Con line_search, el paso se amortigua por retroceso hasta cumplir la condición
+    de Armijo sobre ||F||².
+
+    functions también puede ser una función de Python F(*variables) que retorna
+    los n valores; entonces J se calcula con números duales y variables se ignora.
+
+    Retorna un RootResult cuya raíz es un vector; evaluations cuenta las
+    evaluaciones de F y jacobian_evaluations las de J.
+    """
+    if update not in UPDATE_MODES:
+        raise ValueError(f"Modo de actualización desconocido: {update}. Opciones: {', '.join(UPDATE_MODES)}")
+    system = compile_system(variables, functions, np.size(initial_values))
+    result = RootResult(
+        "newton_system",
+        ["||F||", "||dx||", "Paso", "Jacobiana"],
+        max_iterations, trace, precision, function=system.residual
+    )
+    result.jacobian_evaluations = 0
+    full_trace = result.trace
+
+    point = np.array(initial_values, dtype=float)
+    residual = system.residual(point)
+    result.evaluations = 1
+    norm = np.linalg.norm(residual)
+
+    factorization, update = refresh_jacobian(system, point, result, residual, update)
+    corrections = []
+    refreshed = True
+    steps = 0
+
+    for _ in range(max_iterations):
+        if factorization is None:
+            factorization = linalg.lu_factor(jacobian_at(system, point, result))
+            corrections = []
+            refreshed = True
+
+        step = -apply_inverse(factorization, corrections, residual)
+        damping, new_point, new_residual, accepted = damped_step(
+            system, point, step, norm, result, line_search
+        )
+        if not accepted and update != "newton" and not refreshed:
+            # La J reutilizada ya no da una dirección de descenso: se recalcula
+            factorization = None
+            continue
+
+        new_norm = np.linalg.norm(new_residual)
+        step_norm = np.linalg.norm(new_point - point)
+        if full_trace is not None:
+            full_trace[steps] = (new_norm, step_norm, damping, int(refreshed))
+        refreshed = False
+        steps += 1
+
+        if update == "newton":
+            factorization = None
+        elif update == "chord" and new_norm > 0.5 * norm:
+            factorization = None
+        elif update == "broyden":
+            if len(corrections) >= max_broyden_updates:
+                factorization = None
+            else:
+                broyden_update(factorization, corrections, new_point - point, new_residual - residual)
+
+        point, residual = new_point, new_residual
+        norm = new_norm
+        if norm <= tolerance or (damping == 1 and step_norm <= tolerance * (1 + np.linalg.norm(point))):
+            rel_error = step_norm * 100 / np.linalg.norm(point) if np.any(point) else np.inf
+            return result.finish(point, steps, step_norm, rel_error)
+
+    raise ValueError("El método no convergió dentro del número máximo de iteraciones.")
+
+
+def jacobian_at(system, point, result):
+    result.jacobian_evaluations += 1
+    jacobian = system.jacobian(point)
+    if not np.all(np.isfinite(jacobian)):
+        raise ValueError(f"La Jacobiana no es finita en {point}.")
+    return jacobian
+
+
+def refresh_jacobian(system, point, result, residual, update):
+    start = time.perf_counter()
+    factorization = linalg.lu_factor(jacobian_at(system, point, result))
+    jacobian_time = time.perf_counter() - start
+    if update == "auto":
+        start = time.perf_counter()
+        system.residual(point)
+        residual_time = time.perf_counter() - start
+        result.evaluations += 1
+        # Si J cuesta varias evaluaciones de F, conviene reutilizarla con Broyden
+        update = "broyden" if jacobian_time > 4 * residual_time else "newton"
+    return factorization, update
+
+
+def apply_inverse(factorization, corrections, vector):
+    # H_k = (I + u_k s_k^T) ... (I + u_1 s_1^T) J_0^{-1}
+    solution = linalg.lu_solve(factorization, vector)
+    for u, s in corrections:
+        solution = solution + u * (s @ solution)
+    return solution
+
+
+def broyden_update(factorization, corrections, s, y):
+    # Broyden "bueno" aplicado a la inversa: H+ = H + (s - H y) s^T H / (s^T H y)
+    h_y = apply_inverse(factorization, corrections, y)
+    denominator = s @ h_y
+    if denominator == 0 or not np.isfinite(denominator):
+        corrections.clear()
+        return
+    corrections.append(((s - h_y) / denominator, s))
+
+
+def damped_step(system, point, step, norm, result, line_search, armijo=1e-4, min_damping=1e-4):
+    damping = 1.0
+    while True:
+        new_point = point + damping * step
+        new_residual = system.residual(new_point)
+        result.evaluations += 1
+        new_norm = np.linalg.norm(new_residual)
+        if not line_search:
+            return damping, new_point, new_residual, True
+        if np.isfinite(new_norm) and new_norm ** 2 <= (1 - 2 * armijo * damping) * norm ** 2:
+            return damping, new_point, new_residual, True
+        if damping / 2 < min_damping:
+            accepted = np.isfinite(new_norm) and new_norm < norm
+            return damping, new_point, new_residual, accepted
+        damping /= 2
+
+
+@profiled
+def newton_system_batch(variables, functions, initial_values, tolerance=1e-10, max_iterations=100,
+                        line_search=True, max_halvings=10):
+    """
+    Newton para sistemas desde muchos vectores iniciales a la vez.
+
+    initial_values tiene forma (m, n). En cada iteración se resuelven todas las
+    Jacobianas activas con np.linalg.solve; los carriles que convergen o cuya
+    Jacobiana es singular (no finita o con número de condición mayor que 1/eps)
+    se retiran con converged en False.
+
+    Retorna un arreglo estructurado con los campos 'root' (vector de n valores),
+    'iterations', 'residual' y 'converged'.
+    """
+    initial_values = np.array(initial_values, dtype=float)
+    system = compile_system(variables, functions, initial_values.shape[-1])
+    points = initial_values.reshape(-1, system.size)
+    count = points.shape[0]
+
+    residuals = system.residual(points)
+    norms = np.linalg.norm(residuals, axis=1)
+    iterations = np.zeros(count, dtype=np.int64)
+    converged = norms <= tolerance
+    active = np.flatnonzero(~converged & np.isfinite(norms))
+
+    for iteration in range(max_iterations):
+        if active.size == 0:
+            break
+        point, residual, norm = points[active], residuals[active], norms[active]
+        jacobian = system.jacobian(point)
+
+        singular = ~np.isfinite(jacobian).all(axis=(1, 2))
+        # El determinante depende de la escala de J: se usa el número de condición de cada carril
+        with np.errstate(divide='ignore', invalid='ignore'):
+            condition = np.linalg.cond(np.where(singular[:, None, None], 0.0, jacobian))
+        singular |= ~(condition <= 1 / np.finfo(float).eps)
+        step = np.zeros_like(point)
+        regular = ~singular
+        if regular.any():
+            step[regular] = np.linalg.solve(jacobian[regular], -residual[regular][..., None])[..., 0]
+
+        damping = np.ones(len(active))
+        new_point = point + step
+        new_residual = system.residual(new_point)
+        new_norm = np.linalg.norm(new_residual, axis=1)
+        if line_search:
+            for _ in range(max_halvings):
+                retry = regular & ~(new_norm ** 2 <= (1 - 2e-4 * damping) * norm ** 2)
+                if not retry.any():
+                    break
+                damping[retry] /= 2
+                new_point[retry] = point[retry] + damping[retry, None] * step[retry]
+                new_residual[retry] = system.residual(new_point[retry])
+                new_norm[retry] = np.linalg.norm(new_residual[retry], axis=1)
+
+        valid = regular & np.isfinite(new_norm)
+        updated = active[valid]
+        points[updated] = new_point[valid]
+        residuals[updated] = new_residual[valid]
+        norms[updated] = new_norm[valid]
+        iterations[active] = iteration + 1
+
+        step_norm = np.linalg.norm(damping[:, None] * step, axis=1)
+        small_step = (damping == 1) & (step_norm <= tolerance * (1 + np.linalg.norm(new_point, axis=1)))
+        done = valid & ((new_norm <= tolerance) | small_step)
+        converged[active[done]] = True
+        active = active[valid & ~done]
+
+    result = np.zeros(count, dtype=[
+        ('root', np.float64, (system.size,)),
+        ('iterations', np.int64),
+        ('residual', np.float64),
+        ('converged', np.bool_),
+    ])
+    result['root'] = points
+    result['iterations'] = iterations
+    result['residual'] = norms
+    result['converged'] = converged
+    return result
+
+
+def main():
+    x, y = sp.symbols('x y')
+    functions = [x**2 + y**2 - 4, sp.exp(x) + y - 1]
+    result = newton_system((x, y), functions, [1, -1], trace="full")
+    result.print_report()
+    print(f"Evaluaciones de la Jacobiana: {result.jacobian_evaluations}")
+
+    grid = np.stack(np.meshgrid(np.linspace(-3, 3, 20), np.linspace(-3, 3, 20)), axis=-1).reshape(-1, 2)
+    batch = newton_system_batch((x, y), functions, grid)
+    roots = np.unique(np.round(batch['root'][batch['converged']], 8), axis=0)
+    print(f"\nSoluciones desde {len(grid)} puntos iniciales:")
+    for root in roots:
+        print(root)
+
+
+if __name__ == "__main__":
+    main()
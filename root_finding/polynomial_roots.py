@@ -0,0 +1,121 @@
+from functools import lru_cache
+
+import numpy as np
+from common.lazy_imports import lazy_import
+
+sp = lazy_import("sympy")
+
+
+def polynomial_roots(coefficients, polish=True):
+    """
+    Calcula todas las raíces (reales y complejas) de uno o varios polinomios.
+
+    Los coeficientes van del grado mayor al menor, como en numpy.polyval. Con un
+    arreglo de forma (m, grado + 1) se resuelven m polinomios del mismo grado a la
+    vez. Las raíces son los valores propios de la matriz compañera y después se
+    pulen con un paso de Newton vectorizado.
+
+    Retorna un arreglo complejo de forma (grado,) o (m, grado).
+    """
+    coefficients = np.asarray(coefficients)
+    if coefficients.ndim == 1:
+        return single_polynomial_roots(coefficients, polish)
+    if coefficients.ndim != 2:
+        raise ValueError("Los coeficientes deben tener forma (grado + 1,) o (m, grado + 1).")
+    if np.any(coefficients[:, 0] == 0):
+        raise ValueError("Todos los polinomios del lote deben tener coeficiente principal distinto de cero.")
+
+    roots = np.linalg.eigvals(companion_matrix(coefficients))
+    if polish:
+        roots, _ = newton_polish(coefficients, roots)
+    return roots
+
+
+def single_polynomial_roots(coefficients, polish=True):
+    nonzero = np.flatnonzero(coefficients)
+    if nonzero.size == 0:
+        raise ValueError("El polinomio nulo no tiene raíces aisladas.")
+    # Los ceros finales corresponden a raíces en x = 0
+    trimmed = coefficients[nonzero[0]:nonzero[-1] + 1]
+    zero_roots = np.zeros(len(coefficients) - 1 - nonzero[-1], dtype=complex)
+    if len(trimmed) == 1:
+        return zero_roots
+    roots = polynomial_roots(trimmed[None, :], polish)[0]
+    return np.concatenate([roots, zero_roots])
+
+
+def companion_matrix(coefficients):
+    coefficients = np.asarray(coefficients)
+    count, size = coefficients.shape[0], coefficients.shape[1] - 1
+    dtype = np.result_type(coefficients.dtype, np.float64)
+    matrix = np.zeros((count, size, size), dtype=dtype)
+    matrix[:, 0, :] = -coefficients[:, 1:] / coefficients[:, :1]
+    matrix[:, np.arange(1, size), np.arange(size - 1)] = 1
+    return matrix
+
+
+def horner(coefficients, points):
+    """
+    Evalúa p y p' en los puntos con el esquema de Horner.
+
+    coefficients tiene forma (m, grado + 1) y points forma (m, k).
+    """
+    value = np.broadcast_to(coefficients[:, :1], points.shape).astype(np.result_type(coefficients, points))
+    derivative = np.zeros_like(value)
+    for k in range(1, coefficients.shape[1]):
+        derivative = derivative * points + value
+        value = value * points + coefficients[:, k:k + 1]
+    return value, derivative
+
+
+def newton_polish(coefficients, roots):
+    value, derivative = horner(coefficients, roots)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        step = value / derivative
+    # En raíces múltiples p' se anula: se conserva el valor propio
+    step = np.where(np.isfinite(step), step, 0)
+    return roots - step, np.abs(step)
+
+
+@lru_cache(maxsize=256)
+def polynomial_coefficients(x, f_expr):
+    """
+    Retorna los coeficientes de f_expr si es un polinomio en x con coeficientes
+    numéricos, o None en otro caso. El resultado se guarda en caché.
+    """
+    f_expr = sp.sympify(f_expr)
+    if not f_expr.is_polynomial(x):
+        return None
+    coefficients = sp.Poly(f_expr, x).all_coeffs()
+    if not all(c.is_number for c in coefficients):
+        return None
+    values = [complex(c) for c in coefficients]
+    if all(v.imag == 0 for v in values):
+        return tuple(v.real for v in values)
+    return tuple(values)
+
+
+def nearest_real_root(x, f_expr, starting_points, tolerance):
+    """
+    Atajo para newton_raphson y secant cuando f_expr es un polinomio.
+
+    Retorna (raíz real más cercana a los puntos de partida, todas las raíces,
+    corrección del pulido) o None si f_expr no es un polinomio, no tiene raíces
+    reales o el pulido no alcanza la tolerancia (por ejemplo en raíces múltiples).
+    """
+    coefficients = polynomial_coefficients(x, f_expr)
+    if coefficients is None or len(coefficients) < 2:
+        return None
+    coefficients = np.array(coefficients)[None, :]
+    roots, corrections = newton_polish(coefficients, polynomial_roots(coefficients, polish=False))
+    roots, corrections = roots[0], corrections[0]
+
+    is_real = np.abs(roots.imag) <= tolerance * np.maximum(1.0, np.abs(roots.real))
+    if not is_real.any():
+        return None
+    candidates = np.flatnonzero(is_real)
+    center = np.mean(starting_points)
+    best = candidates[np.argmin(np.abs(roots.real[candidates] - center))]
+    if corrections[best] >= tolerance:
+        return None
+    return float(roots.real[best]), roots, float(corrections[best])
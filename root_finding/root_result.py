@@ -0,0 +1,98 @@
+import numpy as np
+from common.lazy_imports import lazy_callable, lazy_import
+
+mpmath = lazy_import("mpmath")
+
+tabulate = lazy_callable("tabulate", "tabulate")
+
+TRACE_LEVELS = ("none", "summary", "full")
+
+
+class RootResult:
+    """
+    Resultado común de los métodos de búsqueda de raíces.
+
+    El nivel de traza controla cuánto se registra durante las iteraciones:
+    - "none": solo la raíz, las iteraciones y las evaluaciones.
+    - "summary": además el error absoluto y relativo de la última iteración.
+    - "full": cada iteración en un arreglo de NumPy reservado de antemano.
+
+    La tabla y la gráfica solo se construyen cuando se piden. Cuando el método
+    obtiene todas las raíces a la vez (por ejemplo con un polinomio), quedan en roots.
+    Los métodos lanzan ValueError si no convergen, así que todo RootResult
+    retornado corresponde a una raíz encontrada.
+    """
+
+    def __init__(self, method, columns, max_iterations, trace="summary", precision=8, function=None, plotter=None):
+        if trace not in TRACE_LEVELS:
+            raise ValueError(f"Nivel de traza desconocido: {trace}. Opciones: {', '.join(TRACE_LEVELS)}")
+        self.method = method
+        self.columns = tuple(columns)
+        self.trace_level = trace
+        self.precision = precision
+        self.function = function
+        self.plotter = plotter
+        self.root = None
+        self.roots = None
+        self.iterations = 0
+        self.evaluations = 0
+        self.abs_error = None
+        self.rel_error = None
+        self.trace = np.empty((max_iterations, len(self.columns))) if trace == "full" else None
+
+    @property
+    def records_trace(self):
+        return self.trace is not None
+
+    def finish(self, root, iterations, abs_error=None, rel_error=None):
+        self.root = root
+        self.iterations = iterations
+        if self.trace_level != "none":
+            self.abs_error = abs_error
+            self.rel_error = rel_error
+        return self
+
+    def history(self):
+        if self.trace is None:
+            raise ValueError("El historial de iteraciones requiere trace='full'.")
+        return self.trace[:self.iterations]
+
+    def column(self, name):
+        return self.history()[:, self.columns.index(name)]
+
+    def table(self, tablefmt="grid"):
+        rows = [[i + 1, *row] for i, row in enumerate(self.history())]
+        return tabulate(
+            rows,
+            headers=["Iteración", *self.columns],
+            floatfmt=f".{self.precision}f",
+            tablefmt=tablefmt
+        )
+
+    def print_report(self):
+        if self.trace is not None:
+            print("\nResumen de Iteraciones:")
+            print(self.table())
+        if np.ndim(self.root) > 0:
+            root = np.array2string(np.asarray(self.root), precision=self.precision, floatmode='fixed')
+            print(f"\nRaíz encontrada: {root}")
+        elif hasattr(self.root, "_mpf_"):
+            # mpmath.mpf no acepta especificaciones de formato: se escribe con nstr
+            digits = self.precision + len(str(int(abs(self.root))))
+            root = mpmath.nstr(self.root, digits, min_fixed=-np.inf, max_fixed=np.inf, strip_zeros=False)
+            print(f"\nRaíz encontrada: {root}")
+        else:
+            print(f"\nRaíz encontrada: {self.root:.{self.precision}f}")
+        print(f"Iteraciones: {self.iterations}, evaluaciones: {self.evaluations}")
+
+    def plot(self):
+        if self.plotter is None:
+            raise ValueError(f"El método {self.method} no tiene una gráfica asociada.")
+        self.plotter(self)
+
+    def __float__(self):
+        return float(self.root)
+
+    def __repr__(self):
+        return (f"RootResult(method={self.method!r}, root={self.root!r}, iterations={self.iterations}, "
+                f"evaluations={self.evaluations})")
@@ -1,18 +1,40 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from tabulate import tabulate
-import sympy as sp
-
-
-def secant(x, f_expr, x_initial, x_final, tolerance=1e-6, max_iterations=100, precision=5):
-    f = sp.lambdify(x, f_expr, 'numpy')
-    iterations = []
-    secant_lines = []
-    x_values = [x_initial, x_final]
+from common.instrumentation import profiled
+from common.lambdify_cache import cached_lambdify
+from common.lazy_imports import lazy_import
+from root_finding.newton_raphson import finish_polynomial
+from root_finding.root_result import RootResult
+
+plt = lazy_import("matplotlib.pyplot")
+sp = lazy_import("sympy")
+
+
+@profiled
+def secant(x, f_expr, x_initial, x_final, tolerance=1e-6, max_iterations=100, precision=5, trace="summary",
+           polynomial_fast_path=False):
+    """
+    Con polynomial_fast_path=True, si f_expr es un polinomio y no se pide la traza
+    completa, todas las raíces se calculan de una vez: se retorna la raíz real más
+    cercana al punto medio entre x_initial y x_final, que no siempre es a la que
+    llegaría la iteración, y result.roots contiene todas las raíces.
+    """
+    f = cached_lambdify(x, f_expr, 'numpy')
+    result = RootResult(
+        "secant",
+        ["x_i-1", "f(x_i-1)", "x_i", "f(x_i)", "Resultado", "Error abs", "Error rel %"],
+        max_iterations, trace, precision, function=f, plotter=plot_result
+    )
+    if polynomial_fast_path and not result.records_trace:
+        if finish_polynomial(result, x, f_expr, [x_initial, x_final], tolerance):
+            return result
+    full_trace = result.trace
+
+    # Cada punto se evalúa una sola vez: f(x_final) se reutiliza en la siguiente iteración
+    f_x_initial = f(x_initial)
+    f_x_final = f(x_final)
+    result.evaluations += 2
 
     for i in range(max_iterations):
-        f_x_initial = f(x_initial)
-        f_x_final = f(x_final)
         denominator = f_x_final - f_x_initial
 
         if denominator == 0:
@@ -20,37 +42,31 @@ def secant(x, f_expr, x_initial, x_final, tolerance=1e-6, max_iterations=100, pr
 
         x_new = x_final - f_x_final * (x_final - x_initial) / denominator
         abs_error = abs(x_new - x_final)
-        rel_error = abs((x_new - x_final) * 100 / x_new)
-
-        iterations.append([
-            i + 1,
-            round(x_initial, precision),
-            round(f_x_initial, precision),
-            round(x_new, precision),
-            round(abs_error, precision),
-            f"{round(rel_error, 2)} %"
-        ])
-        secant_lines.append(((x_initial, f_x_initial), (x_final, f_x_final)))
-        x_values.append(x_new)
-
-        if i < 3:
-            print(f"\nIteración {i + 1}:")
-            print(f"x_{i + 1} = {x_final}")
-            print(f"f(x_{i + 1}) = {f_x_final}")
-            print(f"x_nuevo = {x_final} - ({f_x_final} * ({x_final} - {x_initial}) / ({f_x_final} - {f_x_initial})) = {x_new}")
-
-        if abs(x_new - x_final) < tolerance:
-            print("\nResumen de Iteraciones:")
-            print(tabulate(iterations, headers=["Iteración", "x", "f(x)", "Resultado", "Error abs", "Error rel"], tablefmt="grid"))
-            plot_function(f, root=x_new, precision=precision, secant_lines=secant_lines, x_values=x_values)
-            print(f"\nRaíz encontrada: {x_new:.{precision}f}")
-            return x_new
+        rel_error = abs((x_new - x_final) * 100 / x_new) if x_new != 0 else np.inf
+
+        if full_trace is not None:
+            full_trace[i] = (x_initial, f_x_initial, x_final, f_x_final, x_new, abs_error, rel_error)
+
+        if abs_error < tolerance:
+            return result.finish(x_new, i + 1, abs_error, rel_error)
 
         x_initial, x_final = x_final, x_new
+        f_x_initial, f_x_final = f_x_final, f(x_new)
+        result.evaluations += 1
 
     raise ValueError("El método no convergió o faltan iteraciones.")
 
 
+def plot_result(result):
+    secant_lines = []
+    x_values = [result.root]
+    if result.records_trace:
+        history = result.history()
+        secant_lines = [((row[0], row[1]), (row[2], row[3])) for row in history]
+        x_values = [history[0, 0], history[0, 2], *history[:, 4]]
+    plot_function(result.function, result.root, result.precision, secant_lines, x_values)
+
+
 def plot_function(fx, root, precision, secant_lines, x_values):
     min_x = min(x_values)
     max_x = max(x_values)
@@ -91,7 +107,9 @@ def main():
     max_iterations = 100
     precision = 5
 
-    secant(x, f_x, x_initial, x_final, tolerance, max_iterations, precision)
+    result = secant(x, f_x, x_initial, x_final, tolerance, max_iterations, precision, trace="full")
+    result.print_report()
+    result.plot()
 
 
 if __name__ == "__main__":
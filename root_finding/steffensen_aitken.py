@@ -1,21 +1,49 @@
-import numpy as np
-import matplotlib.pyplot as plt
-from tabulate import tabulate
-import sympy as sp
 import math
+import numpy as np
+from common.instrumentation import profiled
+from common.lambdify_cache import cached_lambdify
+from common.lazy_imports import lazy_import
+from root_finding.high_precision import FLOAT_DIGITS, newton_high_precision
+from root_finding.root_result import RootResult
+
+plt = lazy_import("matplotlib.pyplot")
+sp = lazy_import("sympy")
+
+# La etapa en doble precisión previa a newton_high_precision se detiene con un paso
+# menor que 10^-HANDOFF_DIGITS: más cerca, Steffensen suele anular el denominador
+HANDOFF_DIGITS = 8
+
+
+@profiled
+def steffensen_aitken(x, f_x, g_x, initial_value, max_iterations=100, precision=8, trace="summary"):
+    """
+    Con precision > 15 la iteración se detiene en doble precisión con un paso menor
+    que 10^-8 (o antes, si el denominador se anula) y la raíz de f_x se refina con
+    newton_high_precision (g_x puede tener constantes float que limitan la precisión
+    del punto fijo); la raíz es entonces un mpmath.mpf. Las iteraciones y la traza
+    son las del refinamiento; evaluations cuenta ambas etapas.
+    """
+    g_num = cached_lambdify(x, g_x, 'numpy')
+    if precision > FLOAT_DIGITS:
+        start, evaluations = float_start(g_num, initial_value, max_iterations)
+        result = newton_high_precision(x, f_x, start, precision, max_iterations, trace)
+        result.evaluations += evaluations
+        return result
+    f_num = cached_lambdify(x, f_x, 'numpy')
 
-
-def steffensen_aitken(x, f_x, g_x, initial_value, max_iterations=100, precision=8):
-    f_num = sp.lambdify(x, f_x, 'numpy')
-    g_num = sp.lambdify(x, g_x, 'numpy')
-
-    x_current = initial_value
     tolerance = 10 ** -precision
-    accum = []
+    result = RootResult(
+        "steffensen_aitken",
+        ["x0", "x1", "x2", "Resultado", "Error Absoluto", "Error Relativo %"],
+        max_iterations, trace, precision, function=f_num, plotter=plot_result
+    )
+    full_trace = result.trace
+    x_current = initial_value
 
     for iteration in range(max_iterations):
         x1 = g_num(x_current)
         x2 = g_num(x1)
+        result.evaluations += 2
         denominator = x2 - 2 * x1 + x_current
 
         if denominator == 0:
@@ -26,40 +54,39 @@ def steffensen_aitken(x, f_x, g_x, initial_value, max_iterations=100, precision=
         error_abs = abs(x_new - x_current)
         error_rel = abs((x_new - x2) * 100 / x_new) if x_new != 0 else np.inf
 
-        if iteration < 3:
-            print(f"\nIteración {iteration + 1}:")
-            print(f"x0 = {round(x_current, precision)}")
-            print(f"x1 = g({round(x_current, precision)}) = {round(x1, precision)}")
-            print(f"x2 = g({round(x1, precision)}) = {round(x2, precision)}")
-            print(
-                f"x_nuevo = {round(x_current, precision)} - (({round(x1, precision)} - {round(x_current, precision)})^2 / ({round(x2, precision)} - 2 * {round(x1, precision)} + {round(x_current, precision)})) = {round(x_new, precision)}")
-
-        accum.append([
-            iteration + 1,
-            round(x_current, precision),
-            round(x1, precision),
-            round(x2, precision),
-            round(x_new, precision),
-            f"{round(error_abs, precision)}",
-            f"{round(error_rel, 2)} %"
-        ])
+        if full_trace is not None:
+            full_trace[iteration] = (x_current, x1, x2, x_new, error_abs, error_rel)
 
         if error_abs < tolerance:
-            print(tabulate(
-                accum,
-                headers=["Iteración", "x0", "x1", "x2", "Resultado", "Error Absoluto", "Error Relativo"],
-                floatfmt=f".{precision}f",
-                tablefmt="grid"
-            ))
-            print(f"\nRaíz aproximada: {round(x_new, precision)}")
-            plot_function(f_num, x_new, precision)
-            return x_new
+            return result.finish(x_new, iteration + 1, error_abs, error_rel)
 
         x_current = x_new
 
     raise ValueError("El método no convergió dentro del número máximo de iteraciones.")
 
 
+def float_start(g_num, x_current, max_iterations):
+    # Retorna el punto de partida para newton_high_precision y las evaluaciones de g usadas
+    evaluations = 0
+    for _ in range(max_iterations):
+        x1 = g_num(x_current)
+        x2 = g_num(x1)
+        evaluations += 2
+        denominator = x2 - 2 * x1 + x_current
+        if denominator == 0:
+            # El iterado ya es tan bueno como lo permite float64: Newton sigue desde él
+            return x_current, evaluations
+        x_new = x_current - ((x1 - x_current) ** 2) / denominator
+        if abs(x_new - x_current) < 10 ** -HANDOFF_DIGITS:
+            return x_new, evaluations
+        x_current = x_new
+    raise ValueError("El método no convergió dentro del número máximo de iteraciones.")
+
+
+def plot_result(result):
+    plot_function(result.function, result.root, result.precision)
+
+
 def plot_function(f_num, root, precision):
     margin = 1
     x_vals = np.linspace(root - margin, root + margin, 400)
@@ -85,7 +112,9 @@ def main():
     initial_value = 2
     precision = 10
     max_iterations = 100
-    steffensen_aitken(x, f_x, g_x, initial_value, max_iterations, precision)
+    result = steffensen_aitken(x, f_x, g_x, initial_value, max_iterations, precision, trace="full")
+    result.print_report()
+    result.plot()
 
 
 if __name__ == "__main__":